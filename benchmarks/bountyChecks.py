@@ -0,0 +1,107 @@
+"""Benchmark the number of system checks per second that a guild's BountyDB can serve, with all factions full.
+Compares the BountyDB system index used by cmd_check against a scan of every faction's bounties.
+
+Run from the repository root:
+    python -m benchmarks.bountyChecks [numChecks] [galaxyWidth]
+"""
+import sys
+import random
+import time
+
+from bot.cfg import bbData, cfg
+from bot.databases import bountyDB
+from . import syntheticGalaxy
+
+
+def checkByScan(db : bountyDB.BountyDB, system : str, userID : int) -> int:
+    """Check a system in the same way that cmd_check did before the system index was introduced.
+
+    :param BountyDB db: The database to check
+    :param str system: The system to check
+    :param int userID: The ID of the checking user
+    :return: The number of criminals reported as close to system
+    :rtype: int
+    """
+    touched = []
+    for fac in db.getFactions():
+        for currentBounty in db.getFactionBounties(fac):
+            checkResult = currentBounty.check(system, userID)
+            if checkResult == 3:
+                currentBounty.calcRewards()
+            if checkResult != 0:
+                touched.append(currentBounty)
+
+    numClose = 0
+    for fac in db.getFactions():
+        for currentBounty in db.getFactionBounties(fac):
+            if system in currentBounty.route:
+                if 0 < currentBounty.route.index(currentBounty.answer) - currentBounty.route.index(system) \
+                        < cfg.closeBountyThreshold:
+                    numClose += 1
+
+    # Reset checked systems, so that every check does the same work
+    for currentBounty in touched:
+        currentBounty.checked[system] = -1
+    return numClose
+
+
+def checkByIndex(db : bountyDB.BountyDB, system : str, userID : int) -> int:
+    """Check a system in the same way as cmd_check, using the BountyDB system index.
+
+    :param BountyDB db: The database to check
+    :param str system: The system to check
+    :param int userID: The ID of the checking user
+    :return: The number of criminals reported as close to system
+    :rtype: int
+    """
+    systemBounties = db.getSystemBounties(system)
+    for currentBounty, position in systemBounties:
+        if currentBounty.check(system, userID) == 3:
+            currentBounty.calcRewards()
+
+    numClose = 0
+    for currentBounty, position in systemBounties:
+        if 0 < currentBounty.answerPosition - position < cfg.closeBountyThreshold:
+            numClose += 1
+
+    # Reset checked systems, so that every check does the same work
+    for currentBounty, position in systemBounties:
+        currentBounty.checked[system] = -1
+    return numClose
+
+
+def timeChecks(checkFunc, db : bountyDB.BountyDB, systems : list) -> float:
+    """Time checkFunc over every system in systems.
+
+    :param checkFunc: The checking function to benchmark
+    :param BountyDB db: The database to check
+    :param list[str] systems: The systems to check, in order
+    :return: The number of checks performed per second
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for system in systems:
+        checkFunc(db, system, 1)
+    return len(systems) / (time.perf_counter() - start)
+
+
+def main(numChecks : int = 100000, galaxyWidth : int = 10):
+    random.seed(0)
+    syntheticGalaxy.makeGalaxy(galaxyWidth, galaxyWidth)
+    db = bountyDB.BountyDB(list(bbData.bountyFactions))
+    syntheticGalaxy.fillBountyDB(db)
+    systems = [random.choice(list(bbData.builtInSystemObjs.keys())) for _ in range(numChecks)]
+
+    # Both methods must agree on which criminals are close to each system
+    for system in set(systems):
+        if checkByScan(db, system, 1) != checkByIndex(db, system, 1):
+            raise RuntimeError("Scan and index checks disagree for system " + system)
+
+    print(str(len(bbData.builtInSystemObjs)) + " systems, " + str(len(db.getFactions())) + " factions, " \
+            + str(cfg.maxBountiesPerFaction) + " bounties per faction, " + str(numChecks) + " checks")
+    print("scan:  " + str(int(timeChecks(checkByScan, db, systems))) + " checks/sec")
+    print("index: " + str(int(timeChecks(checkByIndex, db, systems))) + " checks/sec")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,424 @@
+"""Headless simulation of the bounty economy, for tuning bounty config variables and benchmarking the bounty hot path.
+
+Simulates N guilds of synthetic players over a simulated clock, without a discord connection.
+Guilds are real BasedGuilds, with real BountyDBs. New bounties are generated through BountyConfig.generate and spawned
+after delays drawn from each guild's configured new bounty delay generator. Players check systems with the same
+Bounty.check/calcRewards logic as cmd_check, respecting check cooldowns and daily bounty win limits.
+
+Reports throughput (checks/sec and bounties/sec of wall-clock time), credit inflation per simulated day,
+and the distribution of time taken for bounties to be captured.
+
+Run from the repository root:
+    python -m benchmarks.bountyEconomy --guilds 10 --players 50 --days 7
+"""
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import argparse
+import heapq
+import random
+import statistics
+import sys
+import time
+
+from bot.cfg import bbData, cfg
+from bot import botState, lib
+from bot.logging import Logger
+from bot.databases import bountyDB
+from bot.gameObjects.bounties import bounty, bountyConfig
+from bot.scheduling.timedTask import DynamicRescheduleTask
+from bot.scheduling.timedTaskHeap import TimedTaskHeap
+from bot.users import basedGuild
+from . import syntheticGalaxy
+
+
+SECONDS_PER_DAY = 60 * 60 * 24
+
+# Event types, in order of priority for events occurring at the same simulated time
+EVENT_SPAWN = 0
+EVENT_CHECK = 1
+
+
+class SimDCGuild:
+    """A stand-in for discord.Guild, giving BasedGuild the attributes it uses outside of discord API calls.
+
+    :var id: The ID of the guild
+    :vartype id: int
+    :var name: The name of the guild
+    :vartype name: str
+    """
+
+    def __init__(self, id : int):
+        """
+        :param int id: The ID of the guild
+        """
+        self.id = id
+        self.name = "Simulated Guild " + str(id)
+
+
+class SimPlayer:
+    """A synthetic player, tracking the same bounty hunting stats as BasedUser.
+
+    :var id: The ID of the player, unique across all guilds
+    :vartype id: int
+    :var guild: The player's home guild
+    :vartype guild: BasedGuild
+    :var credits: The player's current credits balance
+    :vartype credits: int
+    :var bountyCooldownEnd: The simulated time at which the player may next check a system
+    :vartype bountyCooldownEnd: float
+    :var bountyWinsToday: The number of bounties the player has won since dailyBountyWinsReset
+    :vartype bountyWinsToday: int
+    :var dailyBountyWinsReset: The simulated time at which bountyWinsToday should be reset
+    :vartype dailyBountyWinsReset: float
+    :var systemsChecked: The number of systems the player has checked that were on a bounty route
+    :vartype systemsChecked: int
+    :var bountyWins: The number of bounties the player has won
+    :vartype bountyWins: int
+    :var hint: The last bounty reported as spotted nearby to this player, and the route position of the reporting system
+    :vartype hint: tuple[bounty.Bounty, int] or None
+    """
+
+    def __init__(self, id : int, guild : basedGuild.BasedGuild):
+        """
+        :param int id: The ID of the player, unique across all guilds
+        :param BasedGuild guild: The player's home guild
+        """
+        self.id = id
+        self.guild = guild
+        self.credits = 0
+        self.bountyCooldownEnd = 0.0
+        self.bountyWinsToday = 0
+        self.dailyBountyWinsReset = float(SECONDS_PER_DAY)
+        self.systemsChecked = 0
+        self.bountyWins = 0
+        self.hint = None
+
+
+class SimStats:
+    """Counters and timers collected over a simulation run.
+
+    :var checks: The number of systems checked
+    :vartype checks: int
+    :var checkSeconds: The wall-clock time spent checking systems
+    :vartype checkSeconds: float
+    :var spawns: The number of bounties spawned
+    :vartype spawns: int
+    :var spawnSeconds: The wall-clock time spent generating and adding bounties
+    :vartype spawnSeconds: float
+    :var captureTimes: The simulated time in seconds between each captured bounty being spawned and being captured
+    :vartype captureTimes: list[float]
+    :var creditsMinted: The number of credits paid out to players during each simulated day
+    :vartype creditsMinted: list[int]
+    :var capturesPerDay: The number of bounties captured during each simulated day
+    :vartype capturesPerDay: list[int]
+    :var dailyLimitRejections: The number of checks rejected because the player reached cfg.maxDailyBountyWins
+    :vartype dailyLimitRejections: int
+    """
+
+    def __init__(self, days : int):
+        """
+        :param int days: The number of simulated days that statistics will be collected over
+        """
+        self.checks = 0
+        self.checkSeconds = 0.0
+        self.spawns = 0
+        self.spawnSeconds = 0.0
+        self.captureTimes = []
+        self.creditsMinted = [0] * days
+        self.capturesPerDay = [0] * days
+        self.dailyLimitRejections = 0
+
+
+def setupHeadlessState():
+    """Initialize the botState attributes needed to construct BasedGuilds without a discord client.
+    The new bounties heap is never polled; bounty spawning is driven by the simulation's own clock.
+    """
+    botState.logger = Logger(categories=list(cfg.loggingCategories))
+    botState.newBountiesTTDB = TimedTaskHeap()
+
+
+def getNewBountyDelay(guild : basedGuild.BasedGuild) -> float:
+    """Draw a new bounty delay from the given guild's configured delay generator.
+
+    :param BasedGuild guild: The guild to generate a new bounty delay for
+    :return: The number of seconds to wait before the guild's next bounty should be spawned
+    :rtype: float
+    """
+    if isinstance(guild.newBountyTT, DynamicRescheduleTask):
+        return guild.newBountyTT.delayTimeGenerator(guild.newBountyTT.delayTimeGeneratorArgs).total_seconds()
+    return guild.newBountyTT.expiryDelta.total_seconds()
+
+
+def spawnBounty(guild : basedGuild.BasedGuild, now : float, spawnTimes : Dict[bounty.Bounty, float], stats : SimStats):
+    """Generate and add a random bounty to the guild, if it has space. Mirrors BasedGuild.spawnAndAnnounceRandomBounty,
+    with routes drawn from the synthetic galaxy.
+
+    :param BasedGuild guild: The guild to spawn a bounty in
+    :param float now: The current simulated time
+    :param dict[Bounty, float] spawnTimes: The simulated spawn time of each active bounty
+    :param SimStats stats: The statistics to record the spawn into
+    """
+    startTime = time.perf_counter()
+    if guild.bountiesDB.canMakeBounty():
+        newBounty = bounty.Bounty(owningDB=guild.bountiesDB,
+                                    config=bountyConfig.BountyConfig(route=syntheticGalaxy.makeRoute()))
+        guild.bountiesDB.addBounty(newBounty)
+        spawnTimes[newBounty] = now
+        stats.spawns += 1
+    stats.spawnSeconds += time.perf_counter() - startTime
+
+
+def pickSystem(player : SimPlayer, informedRate : float) -> str:
+    """Decide which system the player should check next.
+    Players follow up on the last criminal spotted near them, otherwise with probability informedRate they check an
+    unchecked system from an active bounty's route, and otherwise they check a random system.
+
+    :param SimPlayer player: The player deciding on a system
+    :param float informedRate: The probability that a player without a hint checks a system on an active route
+    :return: The name of the system to check
+    :rtype: str
+    """
+    db = player.guild.bountiesDB
+    if player.hint is not None:
+        hintBounty, hintPosition = player.hint
+        player.hint = None
+        if db.bountyObjExists(hintBounty):
+            for system in hintBounty.route[hintPosition + 1:hintPosition + cfg.closeBountyThreshold]:
+                if not hintBounty.systemChecked(system):
+                    return system
+
+    if random.random() < informedRate and db.hasBounties():
+        activeBounties = [currentBounty for fac in db.getFactions() for currentBounty in db.getFactionBounties(fac)]
+        targetBounty = random.choice(activeBounties)
+        uncheckedSystems = [system for system in targetBounty.route if not targetBounty.systemChecked(system)]
+        if uncheckedSystems:
+            return random.choice(uncheckedSystems)
+
+    return random.choice(list(bbData.builtInSystemObjs.keys()))
+
+
+def checkSystem(player : SimPlayer, system : str, now : float, players : Dict[int, SimPlayer],
+        spawnTimes : Dict[bounty.Bounty, float], stats : SimStats) -> bool:
+    """Check a system for the given player, with the same rules as cmd_check.
+
+    :param SimPlayer player: The player checking the system
+    :param str system: The name of the system to check
+    :param float now: The current simulated time
+    :param dict[int, SimPlayer] players: All players in the simulation, by ID
+    :param dict[Bounty, float] spawnTimes: The simulated spawn time of each active bounty
+    :param SimStats stats: The statistics to record the check into
+    :return: True if the system was on an active bounty route, False otherwise
+    :rtype: bool
+    """
+    db = player.guild.bountiesDB
+    day = int(now // SECONDS_PER_DAY)
+    startTime = time.perf_counter()
+    systemInBountyRoute = False
+    toPop = []
+
+    for currentBounty, position in list(db.getSystemBounties(system)):
+        checkResult = currentBounty.check(system, player.id)
+        if checkResult == 3:
+            player.bountyWinsToday += 1
+            player.bountyWins += 1
+            rewards = currentBounty.calcRewards()
+            for userID in rewards:
+                players[userID].credits += rewards[userID]["reward"]
+                stats.creditsMinted[day] += rewards[userID]["reward"]
+            toPop.append(currentBounty)
+        if checkResult != 0:
+            systemInBountyRoute = True
+
+    for currentBounty in toPop:
+        db.removeBountyObj(currentBounty)
+        stats.captureTimes.append(now - spawnTimes.pop(currentBounty))
+        stats.capturesPerDay[day] += 1
+
+    for currentBounty, position in db.getSystemBounties(system):
+        if 0 < currentBounty.answerPosition - position < cfg.closeBountyThreshold:
+            player.hint = (currentBounty, position)
+
+    stats.checkSeconds += time.perf_counter() - startTime
+    stats.checks += 1
+    return systemInBountyRoute
+
+
+def getCheckCooldownSeconds() -> float:
+    """Get the check cooldown duration from cfg.timeouts, whether or not the config has been initialized.
+
+    :return: The number of seconds that players must wait between checking systems on bounty routes
+    :rtype: float
+    """
+    cooldownDict = cfg.timeouts["checkCooldown"] if type(cfg.timeouts) == dict else cfg.timeouts.checkCooldown
+    return lib.timeUtil.timeDeltaFromDict(cooldownDict).total_seconds()
+
+
+def simulate(numGuilds : int, playersPerGuild : int, days : int, meanActivityGapMinutes : float,
+        informedRate : float) -> Tuple[SimStats, List[SimPlayer], List[basedGuild.BasedGuild]]:
+    """Run the bounty economy simulation.
+
+    :param int numGuilds: The number of guilds to simulate
+    :param int playersPerGuild: The number of synthetic players in each guild
+    :param int days: The number of simulated days to run for
+    :param float meanActivityGapMinutes: The mean simulated time a player waits after their check cooldown ends
+                                            before checking again
+    :param float informedRate: The probability that a player checks a system on an active bounty route
+    :return: The statistics collected, all players, and all guilds
+    :rtype: tuple[SimStats, list[SimPlayer], list[BasedGuild]]
+    """
+    stats = SimStats(days)
+    endTime = float(days * SECONDS_PER_DAY)
+    checkCooldown = getCheckCooldownSeconds()
+    guilds = []
+    players = {}
+    spawnTimes = {}
+    # Heap of (simulated time, tie breaker, event type, guild or player)
+    events = []
+    eventNum = 0
+
+    for guildID in range(numGuilds):
+        guild = basedGuild.BasedGuild(guildID, SimDCGuild(guildID), bountyDB.BountyDB(list(bbData.bountyFactions)),
+                                        shopDisabled=True)
+        guilds.append(guild)
+        heapq.heappush(events, (0.0, eventNum, EVENT_SPAWN, guild))
+        eventNum += 1
+        for _ in range(playersPerGuild):
+            newPlayer = SimPlayer(len(players), guild)
+            players[newPlayer.id] = newPlayer
+            heapq.heappush(events, (random.expovariate(1 / (meanActivityGapMinutes * 60)), eventNum, EVENT_CHECK, newPlayer))
+            eventNum += 1
+
+    while events:
+        now, _, eventType, subject = heapq.heappop(events)
+        if now >= endTime:
+            break
+
+        if eventType == EVENT_SPAWN:
+            spawnBounty(subject, now, spawnTimes, stats)
+            nextTime = now + getNewBountyDelay(subject)
+
+        else:
+            # Reset daily bounty wins at simulated midnight
+            if subject.dailyBountyWinsReset <= now:
+                subject.bountyWinsToday = 0
+                subject.dailyBountyWinsReset = (now // SECONDS_PER_DAY + 1) * SECONDS_PER_DAY
+            if subject.bountyWinsToday >= cfg.maxDailyBountyWins:
+                stats.dailyLimitRejections += 1
+                nextTime = subject.dailyBountyWinsReset
+            else:
+                if checkSystem(subject, pickSystem(subject, informedRate), now, players, spawnTimes, stats):
+                    subject.systemsChecked += 1
+                    subject.bountyCooldownEnd = now + checkCooldown
+                nextTime = max(now, subject.bountyCooldownEnd) \
+                            + random.expovariate(1 / (meanActivityGapMinutes * 60))
+
+        heapq.heappush(events, (nextTime, eventNum, eventType, subject))
+        eventNum += 1
+
+        # The simulation runs much faster than real time, so prevent delay generator logs from accumulating
+        if eventNum % 10000 == 0:
+            botState.logger.clearLogs()
+
+    return stats, list(players.values()), guilds
+
+
+def percentiles(values : List[float], divisions : int = 10) -> List[float]:
+    """Get the decile cut points of values, or an empty list if there are too few values.
+
+    :param list[float] values: The values to find percentiles of
+    :param int divisions: The number of equal-probability intervals to divide values into (Default 10)
+    :return: divisions - 1 cut points dividing values into equal-probability intervals
+    :rtype: list[float]
+    """
+    if len(values) < 2:
+        return []
+    return statistics.quantiles(values, n=divisions)
+
+
+def report(stats : SimStats, players : List[SimPlayer], guilds : List[basedGuild.BasedGuild], wallSeconds : float):
+    """Print a summary of a simulation run.
+
+    :param SimStats stats: The statistics collected in the run
+    :param list[SimPlayer] players: All players in the simulation
+    :param list[BasedGuild] guilds: All guilds in the simulation
+    :param float wallSeconds: The wall-clock duration of the run
+    """
+    print("##### THROUGHPUT #####")
+    print("wall time:  " + str(round(wallSeconds, 2)) + "s")
+    print("checks:     " + str(stats.checks) + " (" \
+            + str(int(stats.checks / stats.checkSeconds) if stats.checkSeconds else 0) + " checks/sec)")
+    print("spawns:     " + str(stats.spawns) + " (" \
+            + str(int(stats.spawns / stats.spawnSeconds) if stats.spawnSeconds else 0) + " bounties/sec)")
+    print("daily win limit rejections: " + str(stats.dailyLimitRejections))
+
+    print("\n##### CREDIT INFLATION #####")
+    print("day\tcaptures\tminted\ttotal\tper player")
+    totalCredits = 0
+    for day in range(len(stats.creditsMinted)):
+        totalCredits += stats.creditsMinted[day]
+        print(str(day + 1) + "\t" + str(stats.capturesPerDay[day]) + "\t\t" + str(stats.creditsMinted[day]) + "\t" \
+                + str(totalCredits) + "\t" + str(round(totalCredits / len(players), 1) if players else 0))
+    if players:
+        balances = sorted(player.credits for player in players)
+        print("player balances: min " + str(balances[0]) + ", median " + str(int(statistics.median(balances))) \
+                + ", max " + str(balances[-1]))
+
+    print("\n##### TIME TO CAPTURE #####")
+    activeBounties = sum(guild.bountiesDB.factionNumBounties[fac] for guild in guilds for fac in guild.bountiesDB.getFactions())
+    print("captured: " + str(len(stats.captureTimes)) + ", still active: " + str(activeBounties))
+    if stats.captureTimes:
+        hours = [captureTime / 3600 for captureTime in stats.captureTimes]
+        print("mean:   " + str(round(statistics.mean(hours), 2)) + "h")
+        print("min:    " + str(round(min(hours), 2)) + "h")
+        for decile, cutPoint in enumerate(percentiles(hours)):
+            print("p" + str((decile + 1) * 10) + ":    " + str(round(cutPoint, 2)) + "h")
+        print("max:    " + str(round(max(hours), 2)) + "h")
+
+
+def main(argv : List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate the bounty economy without a discord connection.")
+    parser.add_argument("--guilds", type=int, default=10, help="number of guilds to simulate")
+    parser.add_argument("--players", type=int, default=50, help="number of players in each guild")
+    parser.add_argument("--days", type=int, default=7, help="number of simulated days")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--galaxyWidth", type=int, default=10, help="width and height of the synthetic galaxy grid")
+    parser.add_argument("--activityGap", type=float, default=30,
+                        help="mean minutes a player waits after their check cooldown before checking again")
+    parser.add_argument("--informedRate", type=float, default=0.8,
+                        help="probability that a player checks a system on an active bounty route")
+    parser.add_argument("--maxBountiesPerFaction", type=int, default=cfg.maxBountiesPerFaction)
+    parser.add_argument("--newBountyDelayType", type=str, default=cfg.newBountyDelayType)
+    parser.add_argument("--delayMin", type=int, default=cfg.newBountyDelayRandomRange["min"],
+                        help="newBountyDelayRandomRange minimum, in seconds")
+    parser.add_argument("--delayMax", type=int, default=cfg.newBountyDelayRandomRange["max"],
+                        help="newBountyDelayRandomRange maximum, in seconds")
+    parser.add_argument("--closeBountyThreshold", type=int, default=cfg.closeBountyThreshold)
+    parser.add_argument("--bPointsToCreditsRatio", type=int, default=cfg.bPointsToCreditsRatio)
+    parser.add_argument("--minChecksPerSec", type=float, default=0,
+                        help="exit with status 1 if check throughput falls below this, for regression testing")
+    args = parser.parse_args(argv)
+
+    cfg.maxBountiesPerFaction = args.maxBountiesPerFaction
+    cfg.newBountyDelayType = args.newBountyDelayType
+    cfg.newBountyDelayRandomRange = {"min": args.delayMin, "max": args.delayMax}
+    cfg.closeBountyThreshold = args.closeBountyThreshold
+    cfg.bPointsToCreditsRatio = args.bPointsToCreditsRatio
+
+    random.seed(args.seed)
+    setupHeadlessState()
+    syntheticGalaxy.makeGalaxy(args.galaxyWidth, args.galaxyWidth)
+    # Each guild needs enough criminal names to fill every faction without collisions
+    syntheticGalaxy.makeBuiltInCriminals(max(20, cfg.maxBountiesPerFaction * 2))
+
+    startTime = time.perf_counter()
+    stats, players, guilds = simulate(args.guilds, args.players, args.days, args.activityGap, args.informedRate)
+    report(stats, players, guilds, time.perf_counter() - startTime)
+
+    if stats.checkSeconds and stats.checks / stats.checkSeconds < args.minChecksPerSec:
+        print("\nCheck throughput below --minChecksPerSec " + str(args.minChecksPerSec))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Benchmark building the embeds sent by the info commands, against reusing them from bbData.infoEmbeds.
+A synthetic catalogue of builtIn ships and items is registered in bbData. For each type of item, an embed is built for
+randomly chosen items, as every info command call did before embeds were cached, and then fetched from the cache.
+
+Run from the repository root:
+    python -m benchmarks.infoEmbeds [numLookups]
+"""
+from __future__ import annotations
+from typing import Callable, List
+import importlib
+import random
+import sys
+import time
+
+from benchmarks import saveMemory
+from bot.cfg import bbData, gameConfigurator
+from bot.lib import embedCache
+
+
+# The command module is named with a hyphen, so cannot be imported with an import statement
+gof2Info = importlib.import_module("bot.commands.usr_gof2-info")
+
+
+def timeCalls(func : Callable[[object], object], args : List[object]) -> float:
+    """Time a call of func for each of args.
+
+    :param func: The function to benchmark
+    :param list args: The argument to give to each call of func
+    :return: The mean time per call, in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for arg in args:
+        func(arg)
+    return (time.perf_counter() - start) * 1000000 / len(args)
+
+
+def main(numLookups : int = 10000):
+    random.seed(0)
+    saveMemory.makeCatalogue()
+    gameConfigurator._buildNameIndex()
+    bbData.infoEmbeds = embedCache.EmbedCache()
+
+    for category, buildFunc in (("ships", gof2Info._shipInfoEmbed), ("weapons", gof2Info._weaponInfoEmbed),
+                                ("modules", gof2Info._moduleInfoEmbed), ("turrets", gof2Info._turretInfoEmbed)):
+        objs = random.choices(list(bbData.nameIndex.names[category].values()), k=numLookups)
+        buildTime = timeCalls(buildFunc, objs)
+        cachedTime = timeCalls(lambda obj: bbData.infoEmbeds.get(category, obj.name, lambda: buildFunc(obj)), objs)
+        if any(bbData.infoEmbeds.get(category, obj.name, None).to_dict() != buildFunc(obj).to_dict() for obj in objs[:20]):
+            raise RuntimeError("Cached and newly built " + category + " embeds disagree")
+        print(category + ": build " + str(round(buildTime, 2)) + "us, cached " + str(round(cachedTime, 2)) + "us (" \
+                + str(round(buildTime / cachedTime, 1)) + "x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,149 @@
+"""Benchmark Inventory membership, adding, removing and pagination at several inventory sizes.
+Compares Inventory against a copy of its previous implementation, which kept the stored item types in a list, so that
+membership tests and removals searched the list.
+
+Run from the repository root:
+    python -m benchmarks.inventory [numOps]
+"""
+from __future__ import annotations
+from typing import Callable, List
+import random
+import sys
+import time
+
+from bot.baseClasses import serializable
+from bot.gameObjects.inventories import inventory, inventoryListing
+
+
+class ListInventory:
+    """The parts of Inventory's previous implementation exercised by this benchmark.
+
+    :var items: The item listings
+    :vartype items: dict[object, InventoryListing]
+    :var keys: The item types stored, searched for membership tests and removals
+    :vartype keys: list[object]
+    :var numKeys: The number of item types stored
+    :vartype numKeys: int
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.keys = []
+        self.numKeys = 0
+
+
+    def addItem(self, item : object, quantity : int = 1):
+        if item in self.items:
+            self.items[item].count += quantity
+        else:
+            self.items[item] = inventoryListing.InventoryListing(item, quantity)
+            self.keys.append(item)
+            self.numKeys += 1
+
+
+    def removeItem(self, item : object, quantity : int = 1):
+        self.items[item].count -= quantity
+        if self.items[item].count == 0:
+            for i in range(len(self.keys)):
+                if self.keys[i] is item:
+                    self.keys.pop(i)
+                    break
+            self.numKeys -= 1
+            del self.items[item]
+
+
+    def stores(self, item : object) -> bool:
+        return item in self.keys
+
+
+    def getPage(self, pageNum : int, itemsPerPage : int) -> list:
+        return [self.items[item] for item in self.keys[(pageNum - 1) * itemsPerPage: min(pageNum * itemsPerPage,
+                                                                                            self.numKeys)]]
+
+
+class Item(serializable.Serializable):
+    """A serializable item to store, compared by identity as game items are.
+
+    :var num: The item's number, for reference
+    :vartype num: int
+    """
+
+    def __init__(self, num : int):
+        """
+        :param int num: The item's number
+        """
+        self.num = num
+
+
+    def toDict(self, **kwargs) -> dict:
+        return {"num": self.num}
+
+
+    @classmethod
+    def fromDict(cls, itemDict : dict, **kwargs) -> Item:
+        return Item(itemDict["num"])
+
+
+def timeOps(opFunc : Callable[[object], object], args : List[object]) -> float:
+    """Time a call of opFunc for each of args.
+
+    :param opFunc: The operation to benchmark
+    :param list args: The argument to give to each call of opFunc
+    :return: The mean time per call, in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for arg in args:
+        opFunc(arg)
+    return (time.perf_counter() - start) * 1000000 / len(args)
+
+
+def benchmarkSize(numKeys : int, numOps : int):
+    """Benchmark both inventory implementations holding numKeys item types, and print the results.
+
+    :param int numKeys: The number of item types to store
+    :param int numOps: The number of each operation to time
+    """
+    items = [Item(num) for num in range(numKeys)]
+    # Both inventories are given the same operations, so they should list items in the same order
+    opItems = random.choices(items, k=numOps)
+    pageNums = random.choices(range(1, (numKeys + 9) // 10 + 1), k=numOps)
+    results = {}
+    for invName, invType in (("list", ListInventory), ("dict", inventory.Inventory)):
+        inv = invType()
+        for item in items:
+            inv.addItem(item)
+
+        storesTime = timeOps(inv.stores, opItems)
+        # Sell and buy back the same item, as a hangar does when a player sells and then re-buys an item
+        def sellAndBuy(item):
+            inv.removeItem(item)
+            inv.addItem(item)
+        sellBuyTime = timeOps(sellAndBuy, opItems)
+        pageTime = timeOps(lambda pageNum: inv.getPage(pageNum, 10), pageNums)
+        # Remove and re-add an item then view a page, as when browsing the hangar after a sale
+        def removeAndPage(item):
+            inv.removeItem(item)
+            inv.addItem(item)
+            inv.getPage(1, 10)
+        removePageTime = timeOps(removeAndPage, opItems)
+
+        order = [listing.item for listing in inv.getPage(1, 10)]
+        results[invName] = (storesTime, sellBuyTime, pageTime, removePageTime, order)
+
+    if results["list"][4] != results["dict"][4]:
+        raise RuntimeError("Inventories disagree on the order of the first page at " + str(numKeys) + " keys")
+    for opNum, opName in enumerate(("stores", "remove + add", "getPage", "remove + add + getPage")):
+        listTime, dictTime = results["list"][opNum], results["dict"][opNum]
+        print(str(numKeys) + " keys " + opName + ": list " + str(round(listTime, 2)) + "us, dict " \
+                + str(round(dictTime, 2)) + "us (" + str(round(listTime / dictTime, 1)) + "x)")
+
+
+def main(numOps : int = 1000):
+    random.seed(0)
+    for numKeys in (10, 1000, 100000):
+        benchmarkSize(numKeys, numOps)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,152 @@
+"""Benchmark leaderboard generation over a large synthetic UserDB.
+Compares the leaderboard index used by cmd_leaderboard against the scan and full sort that it previously performed,
+for global leaderboards and for local leaderboards of a large and a small guild, either filtering the index or ranking
+only the guild's members. Also measures the cost of keeping the index up to date as stats change, and checks users'
+cached values against a full recalculation.
+
+Run from the repository root:
+    python -m benchmarks.leaderboards [numUsers] [guildSize]
+"""
+from __future__ import annotations
+from typing import Callable, List, Set, Tuple
+import operator
+import random
+import sys
+import time
+
+from bot.cfg import configurator
+configurator.init()
+
+from bot import lib # noqa: E402
+from bot.databases import userDB # noqa: E402
+from bot.gameObjects.items import shipItem # noqa: E402
+from bot.gameObjects.items.modules import moduleItem # noqa: E402
+from bot.gameObjects.items.tools import toolItem # noqa: E402
+from bot.gameObjects.items.weapons import primaryWeapon, turretWeapon # noqa: E402
+from bot.gameObjects.inventories import inventory # noqa: E402
+from bot.users import basedUser, leaderboards # noqa: E402
+
+
+def makeUsers(numUsers : int) -> userDB.UserDB:
+    """Create a UserDB of synthetic users with random stats, ships and hangars.
+
+    :param int numUsers: The number of users to create
+    :return: A new UserDB containing numUsers users
+    :rtype: UserDB
+    """
+    # Items are given an emoji so that the database can be saved and reloaded
+    emoji = lib.emojis.BasedEmoji(unicode="🚀")
+    weapons = [primaryWeapon.PrimaryWeapon("Synthetic Weapon " + str(i), [], value=random.randint(100, 10000), emoji=emoji)
+                for i in range(50)]
+    db = userDB.UserDB()
+    for userID in range(numUsers):
+        inactiveWeapons = inventory.TypeRestrictedInventory(primaryWeapon.PrimaryWeapon)
+        for weapon in random.sample(weapons, random.randint(0, 5)):
+            inactiveWeapons.addItem(weapon, quantity=random.randint(1, 3))
+        db.addUser(basedUser.BasedUser(userID, credits=random.randint(0, 100000),
+                                        systemsChecked=random.randint(0, 5000), bountyWins=random.randint(0, 500),
+                                        activeShip=shipItem.Ship("Synthetic Ship", 2, 2, 3, value=random.randint(1000, 50000),
+                                                                    emoji=emoji),
+                                        inactiveShips=inventory.TypeRestrictedInventory(shipItem.Ship),
+                                        inactiveModules=inventory.TypeRestrictedInventory(moduleItem.ModuleItem),
+                                        inactiveWeapons=inactiveWeapons,
+                                        inactiveTurrets=inventory.TypeRestrictedInventory(turretWeapon.TurretWeapon),
+                                        inactiveTools=inventory.TypeRestrictedInventory(toolItem.ToolItem)))
+    return db
+
+
+def topByScan(db : userDB.UserDB, stat : str, userFilter : Callable[[int], bool]) -> List[Tuple[int, int]]:
+    """Find the top 10 users in the same way that cmd_leaderboard did before the leaderboard index was introduced.
+
+    :param UserDB db: The users to rank
+    :param str stat: The stat to rank users by
+    :param userFilter: Decides whether a user ID should be included, standing in for get_user or get_member
+    :return: The top 10 tuples of user ID and score
+    :rtype: list[tuple[int, int]]
+    """
+    inputDict = {}
+    for user in db.getUsers():
+        if userFilter(user.id):
+            inputDict[user.id] = user.getStatByName(stat)
+    return sorted(inputDict.items(), key=operator.itemgetter(1))[::-1][:10]
+
+
+def timeQueries(queryFunc : Callable[[], object], numQueries : int) -> float:
+    """Time numQueries calls of queryFunc.
+
+    :param queryFunc: The query to benchmark
+    :param int numQueries: The number of times to call queryFunc
+    :return: The mean time per query, in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for _ in range(numQueries):
+        queryFunc()
+    return (time.perf_counter() - start) * 1000 / numQueries
+
+
+def main(numUsers : int = 100000, guildSize : int = 5000):
+    random.seed(0)
+    start = time.perf_counter()
+    db = makeUsers(numUsers)
+    print(str(numUsers) + " users created and indexed in " + str(round(time.perf_counter() - start, 2)) + "s")
+
+    guildMembers : Set[int] = set(random.sample(range(numUsers), guildSize))
+    smallGuildMembers : Set[int] = set(random.sample(range(numUsers), 20))
+    scopes = {"global": lambda userID: True, "local (" + str(guildSize) + " members)": guildMembers.__contains__}
+
+    for stat in leaderboards.indexedStats:
+        for scopeName, userFilter in scopes.items():
+            # Ties may be broken differently, so only compare scores
+            scanScores = [score for userID, score in topByScan(db, stat, userFilter)]
+            indexScores = [score for userID, score in db.leaderboards.top(stat, 10, userFilter=userFilter)]
+            if scanScores != indexScores:
+                raise RuntimeError("Scan and index leaderboards disagree for " + stat + " " + scopeName)
+
+            scanTime = timeQueries(lambda: topByScan(db, stat, userFilter), 3)
+            indexTime = timeQueries(lambda: db.leaderboards.top(stat, 10, userFilter=userFilter), 100)
+            print(stat + " " + scopeName + ": scan " + str(round(scanTime, 2)) + "ms, index " \
+                    + str(round(indexTime, 3)) + "ms (" + str(int(scanTime / indexTime)) + "x)")
+
+        # Local leaderboards rank only the guild's members, as given by the guild membership index
+        for members in (guildMembers, smallGuildMembers):
+            memberScores = [score for userID, score in db.leaderboards.top(stat, 10, userIDs=members)]
+            if memberScores != [score for userID, score in topByScan(db, stat, members.__contains__)]:
+                raise RuntimeError("Scan and guild members leaderboards disagree for " + stat)
+            memberTime = timeQueries(lambda: db.leaderboards.top(stat, 10, userIDs=members), 100)
+            print(stat + " local (" + str(len(members)) + " members) by guild members: " + str(round(memberTime, 3)) + "ms")
+
+    # Measure the overhead added to stat changes, including rescoring value when credits change
+    users = db.getUsers()
+    numUpdates = 10000
+    start = time.perf_counter()
+    for user in random.choices(users, k=numUpdates):
+        user.credits += random.randint(-1000, 1000)
+        user.systemsChecked += 1
+    updateTime = (time.perf_counter() - start) * 1000000 / numUpdates
+    print(str(numUpdates) + " credits and systemsChecked changes: " + str(round(updateTime, 2)) + "us per change")
+
+    # getStatByName("value") reads the cached value, which previously was recalculated in full for every read
+    start = time.perf_counter()
+    for user in users:
+        user.calculateValue()
+    recalculateTime = (time.perf_counter() - start) * 1000000 / len(users)
+    for user in users:
+        if user.getStatByName("value") != user.calculateValue():
+            raise RuntimeError("Cached value is inconsistent for user #" + str(user.id))
+    print("value: full recalculation " + str(round(recalculateTime, 2)) + "us per user, cached value consistent for all " \
+            + str(len(users)) + " users")
+
+    # Reloading the database ranks users in bulk, which should give the same scores, of the same types, as stat changes
+    start = time.perf_counter()
+    reloadedDB = userDB.UserDB.fromDict(db.toDict())
+    reloadTime = time.perf_counter() - start
+    for stat in leaderboards.indexedStats:
+        if [(score, type(score)) for userID, score in reloadedDB.leaderboards.top(stat, 10)] \
+                != [(score, type(score)) for userID, score in db.leaderboards.top(stat, 10)]:
+            raise RuntimeError("Leaderboards disagree after reloading the user database for " + stat)
+    print("user database saved and reloaded in " + str(round(reloadTime, 2)) + "s, leaderboards consistent")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,85 @@
+"""Benchmark looking up builtIn game objects by name, as the info and showme commands do.
+Compares bbData.nameIndex against the linear scans the commands previously made, which called isCalled on every
+object and, for ships, built a Ship from every ship's data to test its name. The time taken to find similar names
+for an unrecognised name is also reported.
+A synthetic catalogue of builtIn ships and items is registered in bbData, of roughly the size of the real game data.
+
+Run from the repository root:
+    python -m benchmarks.nameIndex [numLookups]
+"""
+from __future__ import annotations
+from typing import Callable, List
+import random
+import sys
+import time
+
+from benchmarks import saveMemory
+from bot.cfg import bbData, gameConfigurator
+from bot.gameObjects.items import shipItem
+
+
+def scanShips(name : str) -> shipItem.Ship:
+    """Find a builtIn ship by name or alias, as cmd_info_ship previously did.
+
+    :param str name: The name to look up
+    :return: A new Ship called name, or None if no ship is called name
+    :rtype: Ship or None
+    """
+    itemObj = None
+    for ship in bbData.builtInShipData.values():
+        shipObj = shipItem.Ship.fromDict(ship)
+        if shipObj.isCalled(name):
+            itemObj = shipObj
+    return itemObj
+
+
+def scanWeapons(name : str) -> object:
+    """Find a builtIn weapon by name or alias, as cmd_info_weapon previously did.
+
+    :param str name: The name to look up
+    :return: The weapon called name, or None if no weapon is called name
+    :rtype: PrimaryWeapon or None
+    """
+    itemObj = None
+    for weap in bbData.builtInWeaponObjs.keys():
+        if bbData.builtInWeaponObjs[weap].isCalled(name):
+            itemObj = bbData.builtInWeaponObjs[weap]
+    return itemObj
+
+
+def timeLookups(lookupFunc : Callable[[str], object], names : List[str]) -> float:
+    """Time a call of lookupFunc for each of names.
+
+    :param lookupFunc: The lookup to benchmark
+    :param list[str] names: The name to look up in each call
+    :return: The mean time per lookup, in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for name in names:
+        lookupFunc(name)
+    return (time.perf_counter() - start) * 1000000 / len(names)
+
+
+def main(numLookups : int = 1000):
+    random.seed(0)
+    saveMemory.makeCatalogue(numShips=70, numItems=150)
+    gameConfigurator._buildNameIndex()
+
+    for category, scanFunc, objNames in (("ships", scanShips, list(bbData.builtInShipData)),
+                                            ("weapons", scanWeapons, list(bbData.builtInWeaponObjs))):
+        names = [name.lower() for name in random.choices(objNames, k=numLookups)]
+        if any(scanFunc(name).name != bbData.nameIndex.get(category, name).name for name in names[:20]):
+            raise RuntimeError("Scan and index lookups disagree for " + category)
+        scanTime = timeLookups(scanFunc, names)
+        indexTime = timeLookups(lambda name: bbData.nameIndex.get(category, name), names)
+        # Drop a letter from each name, as in a typo
+        typos = [name[:len(name) // 2] + name[len(name) // 2 + 1:] for name in names]
+        suggestTime = timeLookups(lambda name: bbData.nameIndex.suggest(category, name), typos)
+        print(str(len(objNames)) + " " + category + ": scan " + str(round(scanTime, 2)) + "us, index " \
+                + str(round(indexTime, 2)) + "us (" + str(round(scanTime / indexTime, 1)) + "x), suggestions " \
+                + str(round(suggestTime, 2)) + "us")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
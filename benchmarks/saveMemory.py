@@ -0,0 +1,173 @@
+"""Benchmark the memory used by loading a large synthetic users save, as the bot does on startup.
+A synthetic catalogue of builtIn ships and items is registered in bbData, and a save is generated in which each user
+has a builtIn ship loadout and small hangars of mostly builtIn items, with some custom spawned items mixed in.
+The save is then loaded with UserDB.fromDict under tracemalloc, and the memory allocated by the load is reported,
+along with the size of a single instance of the most numerous game object types.
+
+To compare two versions of the game object classes, run this benchmark against each.
+
+Run from the repository root:
+    python -m benchmarks.saveMemory [numUsers]
+"""
+from __future__ import annotations
+from typing import Dict, List
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from bot.cfg import configurator
+configurator.init()
+
+from bot.cfg import bbData # noqa: E402
+from bot import lib # noqa: E402
+from bot.databases import userDB # noqa: E402
+from bot.gameObjects.items import gameItem # noqa: E402
+from bot.gameObjects.items.modules import armourModule, shieldModule, cabinModule # noqa: E402
+from bot.gameObjects.items.weapons import primaryWeapon, turretWeapon # noqa: E402
+from bot.gameObjects.inventories import inventoryListing # noqa: E402
+
+
+# The emoji given to all synthetic items, as the empty emoji cannot be deserialized
+syntheticEmoji = lib.emojis.BasedEmoji(unicode="🚀")
+
+
+def makeCatalogue(numShips : int = 40, numItems : int = 60):
+    """Register a synthetic catalogue of builtIn ships, weapons, modules and turrets in bbData.
+
+    :param int numShips: The number of builtIn ships to create (Default 40)
+    :param int numItems: The number of builtIn weapons, modules and turrets to create, each (Default 60)
+    """
+    for shipNum in range(numShips):
+        name = "Synthetic Ship " + str(shipNum)
+        bbData.builtInShipData[name] = {"name": name, "maxPrimaries": random.randint(1, 4),
+                                        "maxTurrets": random.randint(0, 2), "maxModules": random.randint(2, 8),
+                                        "armour": random.randint(100, 1000), "value": random.randint(1000, 100000),
+                                        "emoji": syntheticEmoji.toDict(), "techLevel": shipNum % 10 + 1, "builtIn": True}
+    for itemNum in range(numItems):
+        techLevel = itemNum % 10 + 1
+        weapon = primaryWeapon.PrimaryWeapon("Synthetic Weapon " + str(itemNum), [], dps=itemNum * 10,
+                                                value=itemNum * 100, emoji=syntheticEmoji, techLevel=techLevel, builtIn=True)
+        bbData.builtInWeaponObjs[weapon.name] = weapon
+        turret = turretWeapon.TurretWeapon("Synthetic Turret " + str(itemNum), [], dps=itemNum * 20,
+                                            value=itemNum * 200, emoji=syntheticEmoji, techLevel=techLevel, builtIn=True)
+        bbData.builtInTurretObjs[turret.name] = turret
+        module = armourModule.ArmourModule("Synthetic Module " + str(itemNum), [], armour=itemNum * 5,
+                                            value=itemNum * 50, emoji=syntheticEmoji, techLevel=techLevel, builtIn=True)
+        bbData.builtInModuleObjs[module.name] = module
+
+
+def customItemDict(itemNum : int) -> dict:
+    """Serialize a custom spawned item, as it would appear in a save.
+    Custom items are drawn from a limited number of variants, so some users own equal custom items.
+
+    :param int itemNum: Which custom item variant to serialize
+    :return: The serialized custom item
+    :rtype: dict
+    """
+    if itemNum % 3 == 0:
+        item = primaryWeapon.PrimaryWeapon("Custom Weapon " + str(itemNum), [], dps=itemNum, value=itemNum * 10,
+                                            emoji=syntheticEmoji)
+    elif itemNum % 3 == 1:
+        item = shieldModule.ShieldModule("Custom Shield " + str(itemNum), [], shield=itemNum, value=itemNum * 10,
+                                            emoji=syntheticEmoji)
+    else:
+        item = cabinModule.CabinModule("Custom Cabin " + str(itemNum), [], cabinSize=itemNum, value=itemNum * 10,
+                                        emoji=syntheticEmoji)
+    return item.toDict(saveType=True)
+
+
+def listingsDicts(names : List[str], numListings : int) -> List[dict]:
+    """Serialize a random hangar inventory of builtIn items.
+
+    :param list[str] names: The names of the builtIn items to choose from
+    :param int numListings: The number of different items in the inventory
+    :return: The serialized inventory listings
+    :rtype: list[dict]
+    """
+    return [{"item": {"name": name, "builtIn": True}, "count": random.randint(1, 3)}
+            for name in random.sample(names, numListings)]
+
+
+def makeSave(numUsers : int, numCustomVariants : int = 2000) -> Dict[str, dict]:
+    """Generate a synthetic users save, in the format read by UserDB.fromDict.
+
+    :param int numUsers: The number of users in the save
+    :param int numCustomVariants: The number of different custom items that users may own (Default 2000)
+    :return: The save, mapping string user IDs to serialized users
+    :rtype: dict[str, dict]
+    """
+    shipNames = list(bbData.builtInShipData)
+    weaponNames = list(bbData.builtInWeaponObjs)
+    moduleNames = list(bbData.builtInModuleObjs)
+    turretNames = list(bbData.builtInTurretObjs)
+    customItems = [customItemDict(itemNum) for itemNum in range(numCustomVariants)]
+
+    def shipDict() -> dict:
+        return {"name": random.choice(shipNames), "builtIn": True,
+                "weapons": [{"name": name, "builtIn": True} for name in random.sample(weaponNames, 2)],
+                "modules": [{"name": name, "builtIn": True} for name in random.sample(moduleNames, 3)],
+                "turrets": [{"name": random.choice(turretNames), "builtIn": True}],
+                "nickname": random.choice(["", "", "Nickname"])}
+
+    save = {}
+    for userID in range(numUsers):
+        inactiveWeapons = listingsDicts(weaponNames, random.randint(0, 4))
+        inactiveModules = listingsDicts(moduleNames, random.randint(0, 6))
+        for itemDict in random.sample(customItems, random.randint(0, 2)):
+            # Weapons are saved without their type, as in BasedUser.toDict
+            if itemDict["type"] == "PrimaryWeapon":
+                inactiveWeapons.append({"item": {k: v for k, v in itemDict.items() if k != "type"}, "count": 1})
+            else:
+                inactiveModules.append({"item": itemDict, "count": 1})
+        save[str(userID)] = {"credits": random.randint(0, 100000), "lifetimeCredits": random.randint(0, 1000000),
+                                "bountyCooldownEnd": 0, "systemsChecked": random.randint(0, 5000),
+                                "bountyWins": random.randint(0, 500), "activeShip": shipDict(),
+                                "inactiveShips": [{"item": shipDict(), "count": 1} for _ in range(random.randint(0, 2))],
+                                "inactiveWeapons": inactiveWeapons, "inactiveModules": inactiveModules,
+                                "inactiveTurrets": listingsDicts(turretNames, random.randint(0, 2)),
+                                "homeGuildID": random.randint(0, 100)}
+    return save
+
+
+def instanceSize(obj : object) -> int:
+    """Get the size of an object, including its __dict__ if it has one but excluding the objects it refers to.
+
+    :param object obj: The object to measure
+    :return: The size of obj in bytes
+    :rtype: int
+    """
+    return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0)
+
+
+def main(numUsers : int = 50000):
+    random.seed(0)
+    makeCatalogue()
+    save = makeSave(numUsers)
+    gc.collect()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    db = userDB.UserDB.fromDict(save)
+    loadTime = time.perf_counter() - start
+    gc.collect()
+    loadedBytes, peakBytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(str(numUsers) + " users loaded in " + str(round(loadTime, 2)) + "s")
+    print("memory allocated by the load: " + str(round(loadedBytes / 1024 / 1024, 1)) + "MiB (" \
+            + str(round(loadedBytes / numUsers)) + " bytes per user), peak " \
+            + str(round(peakBytes / 1024 / 1024, 1)) + "MiB")
+
+    user = db.getUser(0)
+    sampleObjs = {"Ship": user.activeShip, "PrimaryWeapon": user.activeShip.weapons[0],
+                    "ArmourModule": user.activeShip.modules[0],
+                    "InventoryListing": inventoryListing.InventoryListing(user.activeShip.weapons[0], 1)}
+    for objName, obj in sampleObjs.items():
+        print(objName + " instance: " + str(instanceSize(obj)) + " bytes")
+    print(str(len(gameItem.internedItems)) + " interned custom items")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
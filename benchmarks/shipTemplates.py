@@ -0,0 +1,89 @@
+"""Benchmark the construction time and memory of builtIn ships, which share the static stats of their model in a
+ShipTemplate.
+Compares ships sharing their model's template against ships that each build a template of their own, as every builtIn
+ship did before templates were shared, for saved ships as loaded with a user, and for the unequipped ships from bbData
+built by shop refreshes and ship info lookups.
+
+Run from the repository root:
+    python -m benchmarks.shipTemplates [numShips]
+"""
+from __future__ import annotations
+from typing import List, Tuple
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from benchmarks import saveMemory
+from bot.cfg import bbData
+from bot.gameObjects.items import shipItem
+
+
+def buildShips(shipDicts : List[dict], shareTemplates : bool) -> Tuple[List[shipItem.Ship], float, int]:
+    """Construct a ship from each of shipDicts, measuring the time taken and the memory allocated.
+
+    :param list[dict] shipDicts: The serialized ships to construct
+    :param bool shareTemplates: Whether ships of the same model should share a template. If False, every ship is built
+                                with a template of its own.
+    :return: The constructed ships, the mean time per ship in microseconds, and the mean bytes allocated per ship
+    :rtype: tuple[list[Ship], float, int]
+    """
+    def build() -> List[shipItem.Ship]:
+        shipItem.builtInTemplates.clear()
+        ships = []
+        for shipDict in shipDicts:
+            if not shareTemplates:
+                shipItem.builtInTemplates.clear()
+            ships.append(shipItem.Ship.fromDict(shipDict))
+        return ships
+
+    # Construction is timed and measured separately, as tracemalloc slows down allocation
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    buildTime = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    ships = build()
+    gc.collect()
+    allocatedBytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ships, buildTime * 1000000 / len(shipDicts), allocatedBytes // len(shipDicts)
+
+
+def main(numShips : int = 100000):
+    random.seed(0)
+    saveMemory.makeCatalogue()
+    shipNames = list(bbData.builtInShipData)
+    weaponNames = list(bbData.builtInWeaponObjs)
+    moduleNames = list(bbData.builtInModuleObjs)
+    savedShips = [{"name": random.choice(shipNames), "builtIn": True,
+                    "weapons": [{"name": name, "builtIn": True} for name in random.sample(weaponNames, 2)],
+                    "modules": [{"name": name, "builtIn": True} for name in random.sample(moduleNames, 3)],
+                    "nickname": random.choice(["", "", "Nickname"])}
+                    for _ in range(numShips)]
+    # Every builtIn ship, as built by an info lookup or a shop refresh
+    modelShips = [bbData.builtInShipData[random.choice(shipNames)] for _ in range(numShips)]
+
+    for scenarioName, shipDicts in (("saved ships", savedShips), ("ships from bbData", modelShips)):
+        results = {}
+        for shareTemplates in (False, True):
+            ships, buildTime, shipBytes = buildShips(shipDicts, shareTemplates)
+            results[shareTemplates] = (buildTime, shipBytes,
+                                        [(ship.name, ship.armour, ship.value, ship.nickname) for ship in ships])
+            del ships
+
+        if results[False][2] != results[True][2]:
+            raise RuntimeError("Ships built with and without shared templates disagree for " + scenarioName)
+        ownTime, ownBytes = results[False][:2]
+        sharedTime, sharedBytes = results[True][:2]
+        print(str(numShips) + " " + scenarioName + ": own template " + str(round(ownTime, 2)) + "us, " \
+                + str(ownBytes) + " bytes per ship; shared template " + str(round(sharedTime, 2)) + "us, " \
+                + str(sharedBytes) + " bytes per ship (" + str(round(ownTime / sharedTime, 1)) + "x faster, " \
+                + str(round(ownBytes / sharedBytes, 1)) + "x smaller)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,122 @@
+"""Synthetic game data for running benchmarks without the bot's game object data files.
+Populates bbData with a grid-shaped galaxy of SolarSystems, where each system neighbours the systems directly
+adjacent to it, and provides helpers for generating criminals and bounties over that galaxy.
+"""
+from __future__ import annotations
+from typing import List
+import random
+
+from bot.cfg import bbData
+from bot.gameObjects.bounties import solarSystem, criminal, bounty, bountyConfig
+from bot.databases import bountyDB
+
+
+def systemName(x : int, y : int) -> str:
+    """Get the name of the synthetic system at the given grid coordinates.
+
+    :param int x: The column of the system in the grid
+    :param int y: The row of the system in the grid
+    :return: The name of the system at (x, y)
+    :rtype: str
+    """
+    return "System " + str(x) + "-" + str(y)
+
+
+def makeGalaxy(width : int = 10, height : int = 10):
+    """Replace bbData.builtInSystemObjs with a grid of width * height systems.
+    All systems have jump gates connecting them to the systems above, below, left and right of them.
+
+    :param int width: The number of columns of systems in the galaxy (Default 10)
+    :param int height: The number of rows of systems in the galaxy (Default 10)
+    """
+    bbData.builtInSystemObjs.clear()
+    for x in range(width):
+        for y in range(height):
+            neighbours = []
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if 0 <= nx < width and 0 <= ny < height:
+                    neighbours.append(systemName(nx, ny))
+            bbData.builtInSystemObjs[systemName(x, y)] = solarSystem.SolarSystem(systemName(x, y),
+                                                            bbData.factions[(x + y) % len(bbData.factions)], neighbours,
+                                                            (x * y) % len(bbData.securityLevels), (x, y), aliases=[])
+
+
+def makeRoute(minLength : int = 3, maxLength : int = 12) -> List[str]:
+    """Generate a random route through the synthetic galaxy, without repeating systems.
+    The route travels horizontally then vertically between two random systems, as a stand-in for
+    lib.pathfinding.bbAStar, which is not bounded for large galaxies.
+
+    :param int minLength: The minimum number of systems in the route (Default 3)
+    :param int maxLength: The maximum number of systems in the route (Default 12)
+    :return: A list of adjacent system names
+    :rtype: list[str]
+    """
+    width = max(coords[0] for coords in (syst.coordinates for syst in bbData.builtInSystemObjs.values())) + 1
+    height = max(coords[1] for coords in (syst.coordinates for syst in bbData.builtInSystemObjs.values())) + 1
+    while True:
+        x, y = random.randrange(width), random.randrange(height)
+        endX, endY = random.randrange(width), random.randrange(height)
+        route = [systemName(x, y)]
+        while x != endX:
+            x += 1 if endX > x else -1
+            route.append(systemName(x, y))
+        while y != endY:
+            y += 1 if endY > y else -1
+            route.append(systemName(x, y))
+        if minLength <= len(route) <= maxLength:
+            return route
+
+
+def makeCriminal(name : str, faction : str) -> criminal.Criminal:
+    """Create a custom, non-player criminal with a single alias.
+
+    :param str name: The name of the criminal
+    :param str faction: The faction wanting the criminal
+    :return: A new criminal
+    :rtype: criminal.Criminal
+    """
+    return criminal.Criminal(name, faction, bbData.rocketIcon, aliases=[name.split(" ")[-1] + " " + faction])
+
+
+def makeBounty(owningDB : bountyDB.BountyDB, faction : str, name : str) -> bounty.Bounty:
+    """Create a bounty for a new custom criminal over a random synthetic route, without adding it to owningDB.
+
+    :param BountyDB owningDB: The database which the bounty will be added to
+    :param str faction: The faction to issue the bounty
+    :param str name: The name of the criminal to create
+    :return: A new bounty, ready to be added to owningDB
+    :rtype: bounty.Bounty
+    """
+    newCriminal = makeCriminal(name, faction)
+    config = bountyConfig.BountyConfig(faction=faction, name=name, route=makeRoute())
+    return bounty.Bounty(criminalObj=newCriminal, config=config, owningDB=owningDB)
+
+
+def fillBountyDB(owningDB : bountyDB.BountyDB, namePrefix : str = "Criminal"):
+    """Fill all of the factions in owningDB with bounties, up to cfg.maxBountiesPerFaction.
+
+    :param BountyDB owningDB: The database to fill
+    :param str namePrefix: A prefix to give all generated criminal names (Default "Criminal")
+    """
+    crimNum = 0
+    for fac in owningDB.getFactions():
+        while owningDB.factionCanMakeBounty(fac):
+            crimNum += 1
+            owningDB.addBounty(makeBounty(owningDB, fac, namePrefix + " " + str(crimNum)))
+
+
+def makeBuiltInCriminals(numPerFaction : int = 20):
+    """Replace bbData.builtInCriminalObjs and bbData.bountyNames with numPerFaction builtIn criminals for each bounty
+    faction, so that bounties can be generated by BountyConfig.generate without loading the bot's game object data.
+
+    :param int numPerFaction: The number of criminals to create for each faction in bbData.bountyFactions (Default 20)
+    """
+    bbData.builtInCriminalObjs.clear()
+    bbData.bountyNames.clear()
+    for fac in bbData.bountyFactions:
+        bbData.bountyNames[fac] = []
+        for crimNum in range(numPerFaction):
+            name = fac.title() + " Criminal " + str(crimNum)
+            bbData.builtInCriminalObjs[name] = criminal.Criminal(name, fac, bbData.rocketIcon, builtIn=True, aliases=[])
+            bbData.bountyNames[fac].append(name)
+            bbData.longestBountyNameLength = max(bbData.longestBountyNameLength, len(name))
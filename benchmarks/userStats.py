@@ -0,0 +1,158 @@
+"""Benchmark economy-wide aggregates over a large UserStatsStore.
+Compares the store's column aggregates against walking every user object, as economy-wide questions required before
+the store was introduced, for all users and for the members of a single guild.
+Rows are created from lightweight synthetic users, as constructing a million BasedUsers would dominate the run time.
+
+Run from the repository root:
+    python -m benchmarks.userStats [numUsers] [guildSize]
+"""
+from __future__ import annotations
+from typing import Callable, List, Set, Union
+import math
+import random
+import sys
+import time
+
+from bot.users import userStats
+
+
+class SyntheticUser:
+    """A stand-in for BasedUser holding only the stats kept by UserStatsStore.
+
+    :var id: The user's ID
+    :vartype id: int
+    :var stats: The user's value for each stat in userStats.storedStats
+    :vartype stats: dict[str, int or float]
+    :var statsStore: The store holding this user's stats
+    :vartype statsStore: UserStatsStore
+    """
+
+    def __init__(self, userID : int):
+        """
+        :param int userID: The user's ID
+        """
+        self.id = userID
+        self.stats = {"credits": random.randint(0, 100000), "lifetimeCredits": random.randint(0, 1000000),
+                        "systemsChecked": random.randint(0, 5000), "bountyWins": int(random.expovariate(0.05)),
+                        "duelWins": random.randint(0, 50), "duelLosses": random.randint(0, 50),
+                        "duelCreditsWins": random.randint(0, 10000), "duelCreditsLosses": random.randint(0, 10000)}
+        self.stats["value"] = self.stats["credits"] + random.randint(1000, 50000) * 1.0
+        self.statsStore = None
+
+
+    def getStatByName(self, stat : str) -> Union[int, float]:
+        """Get one of the user's stats by name, as BasedUser.getStatByName does.
+
+        :param str stat: The name of the stat
+        :return: The user's value for the stat
+        :rtype: int or float
+        """
+        return self.stats[stat]
+
+
+def timeQuery(queryFunc : Callable[[], object], numQueries : int) -> float:
+    """Time numQueries calls of queryFunc.
+
+    :param queryFunc: The query to benchmark
+    :param int numQueries: The number of times to call queryFunc
+    :return: The mean time per query, in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for _ in range(numQueries):
+        queryFunc()
+    return (time.perf_counter() - start) * 1000 / numQueries
+
+
+def walkTotal(users : List[SyntheticUser], stat : str, userIDs : Set[int] = None) -> Union[int, float]:
+    """Sum a stat by visiting every user object.
+
+    :param list[SyntheticUser] users: All users
+    :param str stat: The stat to sum
+    :param set[int] userIDs: The IDs of the users to include, or None for all users
+    :return: The sum of the stat
+    :rtype: int or float
+    """
+    return sum(user.getStatByName(stat) for user in users if userIDs is None or user.id in userIDs)
+
+
+def walkMedian(users : List[SyntheticUser], stat : str, userIDs : Set[int] = None) -> Union[int, float]:
+    """Find the median of a stat by visiting every user object, using the same nearest rank method as the store.
+
+    :param list[SyntheticUser] users: All users
+    :param str stat: The stat to find the median of
+    :param set[int] userIDs: The IDs of the users to include, or None for all users
+    :return: The median of the stat
+    :rtype: int or float
+    """
+    values = sorted(user.getStatByName(stat) for user in users if userIDs is None or user.id in userIDs)
+    return values[max(0, math.ceil(len(values) / 2) - 1)]
+
+
+def walkTop(users : List[SyntheticUser], stat : str, userIDs : Set[int] = None) -> List[Union[int, float]]:
+    """Find the top 10 scores for a stat by visiting every user object and sorting them.
+
+    :param list[SyntheticUser] users: All users
+    :param str stat: The stat to rank by
+    :param set[int] userIDs: The IDs of the users to include, or None for all users
+    :return: The top 10 scores
+    :rtype: list[int or float]
+    """
+    return sorted((user.getStatByName(stat) for user in users if userIDs is None or user.id in userIDs), reverse=True)[:10]
+
+
+def main(numUsers : int = 1000000, guildSize : int = 5000):
+    random.seed(0)
+    start = time.perf_counter()
+    users = [SyntheticUser(userID) for userID in range(numUsers)]
+    store = userStats.UserStatsStore()
+    for user in users:
+        store.addUser(user)
+    print(str(numUsers) + " rows created in " + str(round(time.perf_counter() - start, 2)) + "s")
+
+    guildMembers : Set[int] = set(random.sample(range(numUsers), guildSize))
+    for scopeName, userIDs in (("all users", None), ("guild of " + str(guildSize), guildMembers)):
+        if store.total("credits", userIDs=userIDs) != walkTotal(users, "credits", userIDs=userIDs) \
+                or store.percentiles("bountyWins", (50,), userIDs=userIDs)[0] != walkMedian(users, "bountyWins", userIDs) \
+                or [score for userID, score in store.top("value", 10, userIDs=userIDs)] != walkTop(users, "value", userIDs):
+            raise RuntimeError("Store and walk aggregates disagree for " + scopeName)
+
+        for queryName, storeQuery, walkQuery in (
+                ("total credits", lambda: store.total("credits", userIDs=userIDs),
+                    lambda: walkTotal(users, "credits", userIDs=userIDs)),
+                ("median bountyWins", lambda: store.percentiles("bountyWins", (50,), userIDs=userIDs),
+                    lambda: walkMedian(users, "bountyWins", userIDs=userIDs)),
+                ("top 10 value", lambda: store.top("value", 10, userIDs=userIDs),
+                    lambda: walkTop(users, "value", userIDs=userIDs))):
+            walkTime = timeQuery(walkQuery, 3)
+            storeTime = timeQuery(storeQuery, 3)
+            print(scopeName + " " + queryName + ": walk " + str(round(walkTime, 2)) + "ms, store " \
+                    + str(round(storeTime, 2)) + "ms (" + str(round(walkTime / storeTime, 1)) + "x)")
+
+    histTime = timeQuery(lambda: store.histogram("bountyWins", [1, 5, 10, 50, 100]), 3)
+    print("all users bountyWins histogram: " + str(round(histTime, 2)) + "ms")
+
+    # Ship sales may give fractional credits, which are truncated in the store's integer columns
+    for user in random.sample(users, 1000):
+        user.stats["credits"] += 0.75
+        store.statChanged(user, "credits")
+    if store.total("credits") != sum(int(user.stats["credits"]) for user in users) \
+            or store.total("value") != walkTotal(users, "value"):
+        raise RuntimeError("Store and walk aggregates disagree after fractional credits changes")
+
+    # Measure the cost of keeping the store in sync
+    numUpdates = 100000
+    start = time.perf_counter()
+    for user in random.choices(users, k=numUpdates):
+        user.stats["credits"] += 1
+        store.statChanged(user, "credits")
+    print(str(numUpdates) + " credits changes: " \
+            + str(round((time.perf_counter() - start) * 1000000 / numUpdates, 2)) + "us per change")
+    start = time.perf_counter()
+    for user in random.sample(users, 1000):
+        store.removeUser(user.id)
+    print("1000 removals: " + str(round((time.perf_counter() - start) * 1000000 / 1000, 2)) + "us per removal")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
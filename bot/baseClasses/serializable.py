@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod, abstractclassmethod
 
 
 class Serializable(ABC):
+    # Declare no instance attributes, so that slotted subclasses do not get a __dict__
+    __slots__ = ()
 
     @abstractmethod
     def toDict(self, **kwargs) -> dict:
@@ -23,7 +23,10 @@ import aiohttp
 
 from . import lib, botState, logging
 from .databases import guildDB, reactionMenuDB, userDB
+from .users import basedGuild, guildMembership
+from .gameObjects.bounties.bountyPool import BountyPool
 from .scheduling.timedTask import TimedTask
+from .scheduling.messageQueue import MessageQueue
 from .scheduling.timedTaskHeap import TimedTaskHeap
 from bot.scheduling import timedTaskHeap
 
@@ -96,13 +99,34 @@ def setHelpEmbedThumbnails():
                 embed.set_thumbnail(url=botState.client.user.avatar_url_as(size=64))
 
 
+async def initializeBountyBoardChannel(guild : basedGuild.BasedGuild, initSlots : asyncio.Semaphore):
+    """Load the bounty board listings of the given guild, once a slot is available in initSlots.
+
+    :param BasedGuild guild: The guild whose bountyBoardChannel to initialize
+    :param asyncio.Semaphore initSlots: Semaphore limiting the number of bountyBoardChannels loaded at once
+    """
+    async with initSlots:
+        try:
+            await guild.bountyBoardChannel.init(botState.client, bbData.bountyFactions)
+        except Exception as e:
+            botState.logger.log("Main", "initBBCs", "Unexpected " + type(e).__name__ + " when initializing " \
+                                + "bountyBoardChannel for guild #" + str(guild.id), category="bountyBoards",
+                                eventType="INIT_UNKWNERR", trace=traceback.format_exc())
+
+
 async def initializeBountyBoardChannels():
+    """Load the bounty board listings of all guilds concurrently, with at most cfg.bbcInitMaxConcurrent loading at once.
+    Bounty board channels which no longer exist are removed.
+    """
+    initSlots = asyncio.Semaphore(cfg.bbcInitMaxConcurrent)
+    toInit = []
     for guild in botState.guildsDB.getGuilds():
         if guild.hasBountyBoardChannel:
             if botState.client.get_channel(guild.bountyBoardChannel.channelIDToBeLoaded) is None:
                 guild.removeBountyBoardChannel()
             else:
-                await guild.bountyBoardChannel.init(botState.client, bbData.bountyFactions)
+                toInit.append(initializeBountyBoardChannel(guild, initSlots))
+    await asyncio.gather(*toInit)
 
 
 def inferUserPermissions(message: discord.Message) -> int:
@@ -207,6 +231,7 @@ class BasedClient(ClientBaseClass):
 
         This currently:
         - expires all non-saveable reaction menus
+        - sends all queued messages
         - logs out of discord
         - saves all savedata to file
         """
@@ -218,6 +243,9 @@ class BasedClient(ClientBaseClass):
                 if not menu.saveable:
                     await menu.delete()
 
+        # send any messages still queued
+        await botState.messageQueue.stop()
+
         # log out of discord
         self.loggedIn = False
         await self.logout()
@@ -237,6 +265,9 @@ botState.logger = logging.Logger(categories=cfg.loggingCategories)
 botState.client = BasedClient(storeUsers=True,
                               storeGuilds=True,
                               storeMenus=True)
+# Index of guild members, kept up to date by member and guild events from as soon as the client can receive them.
+# Filled from the member cache in on_ready.
+botState.guildMembership = guildMembership.GuildMembership()
 
 # commands DB
 from . import commands
@@ -291,11 +322,9 @@ async def announceNewShopStock(guildID : int = -1):
                         (Default -1)
     """
     if guildID == -1:
-        # loop over all guilds
-        for guild in botState.guildsDB.guilds.values():
-            # ensure guild has a valid playChannel
-            if not guild.shopDisabled:
-                await guild.announceNewShopStock()
+        # Queue announcements to all guilds at once, so they are sent as fast as the message queue allows
+        await asyncio.gather(*(guild.announceNewShopStock() for guild in botState.guildsDB.guilds.values() \
+                                if not guild.shopDisabled))
     else:
         guild = botState.guildsDB.getGuild(guildID)
         # ensure guild has a valid playChannel
@@ -370,6 +399,7 @@ async def on_guild_join(guild: discord.Guild):
 
     :param discord.Guild guild: the guild just joined.
     """
+    botState.guildMembership.addGuild(guild)
     if botState.client.storeGuilds:
         guildExists = True
         if not botState.guildsDB.idExists(guild.id):
@@ -390,10 +420,12 @@ async def on_guild_remove(guild: discord.Guild):
 
     :param discord.Guild guild: the guild just left.
     """
+    botState.guildMembership.removeGuild(guild.id)
     if botState.client.storeGuilds:
         guildExists = False
         if botState.guildsDB.idExists(guild.id):
             guildExists = True
+            botState.guildsDB.getGuild(guild.id).unscheduleAllBountyExpiries()
             botState.guildsDB.removeID(guild.id)
 
         botState.logger.log("Main", "guild_remove",
@@ -402,6 +434,24 @@ async def on_guild_remove(guild: discord.Guild):
                                 category="guildsDB", eventType="LEAVE_GUILD")
 
 
+@botState.client.event
+async def on_member_join(member: discord.Member):
+    """Record new guild members in the guild membership index.
+
+    :param discord.Member member: the member that just joined a guild.
+    """
+    botState.guildMembership.addMember(member.guild.id, member.id)
+
+
+@botState.client.event
+async def on_member_remove(member: discord.Member):
+    """Remove guild members that leave, or are kicked or banned, from the guild membership index.
+
+    :param discord.Member member: the member that just left a guild.
+    """
+    botState.guildMembership.removeMember(member.guild.id, member.id)
+
+
 @botState.client.event
 async def on_ready():
     """Bot initialisation (called on bot login) and behaviour loops.
@@ -422,6 +472,12 @@ async def on_ready():
     else:
         raise ValueError("Unsupported cfg.timedTaskCheckingType: " + str(cfg.timedTaskCheckingType))
 
+    # Reaction menu timeouts are checked by the main task scheduler
+    botState.reactionMenusTTDB = botState.taskScheduler
+
+    botState.messageQueue = MessageQueue()
+    botState.messageQueue.start()
+
     # Set custom bot status
     await botState.client.change_presence(activity=discord.Game("BASED APP"))
     # bot is now logged in
@@ -467,6 +523,13 @@ async def on_ready():
     botState.taskScheduler.scheduleTask(botState.dbSaveTT)
     botState.taskScheduler.scheduleTask(botState.updatesCheckTT)
 
+    # Fill the shared bounty pool, then top it up in small batches between bounty spawns
+    botState.bountyPool = BountyPool()
+    botState.bountyPool.refill(botState.bountyPool.maxSize)
+    botState.bountyPoolRefillTT = TimedTask(expiryDelta=lib.timeUtil.timeDeltaFromDict(cfg.timeouts.bountyPoolRefill),
+                                            autoReschedule=True, expiryFunction=botState.bountyPool.refill)
+    botState.taskScheduler.scheduleTask(botState.bountyPoolRefillTT)
+
 
     ##### DATABASE INITIALIZATION #####
 
@@ -474,17 +537,31 @@ async def on_ready():
     botState.usersDB = loadUsersDB(cfg.paths.usersDB)
     botState.guildsDB = loadGuildsDB(cfg.paths.guildsDB)
     botState.reactionMenusDB = await loadReactionMenusDB(cfg.paths.reactionMenusDB)
+    # Schedule regular checks for reaction menus whose messages were deleted without the bot noticing
+    botState.reactionMenuSweepTT = TimedTask(expiryDelta=lib.timeUtil.timeDeltaFromDict(cfg.timeouts.reactionMenuSweep),
+                                                autoReschedule=True, expiryFunction=botState.reactionMenusDB.sweepDeletedMenus)
+    botState.taskScheduler.scheduleTask(botState.reactionMenuSweepTT)
 
     # Create BasedGuild instances for any guilds that the bot joined whilst it was offline
     for guild in botState.client.guilds:
         if not botState.guildsDB.idExists(guild.id):
             botState.guildsDB.addDcGuild(guild)
 
+    # Index the members of all guilds from the member cache. Members of each guild replace any recorded by earlier events.
+    botState.guildMembership.addGuilds(botState.client.guilds)
+
 
     ##### CLEANUP #####
 
     await initializeBountyBoardChannels()
 
+    # Schedule the expiry of all loaded bounties in one heap rebuild. Bounties that expired while the bot was offline
+    # are escaped at the next task check, now that bounty boards are ready to be updated.
+    bountyExpiryTTs = []
+    for guild in botState.guildsDB.getGuilds():
+        bountyExpiryTTs += guild.makeAllBountyExpiryTTs()
+    botState.taskScheduler.scheduleTasks(bountyExpiryTTs)
+
     # Set help embed thumbnails
     setHelpEmbedThumbnails()
 
@@ -591,18 +668,24 @@ async def on_raw_reaction_add(payload: discord.RawReactionActionEvent):
 
     :param discord.RawReactionActionEvent payload: An event describing the message and the reaction added
     """
-    # ignore bot reactions
-    if payload.user_id != botState.client.user.id:
-        # Get rich, useable reaction data
-        _, user, emoji = await lib.discordUtil.reactionFromRaw(payload)
-        if None in [user, emoji]:
-            return
+    # ignore bot reactions, and reactions to messages that are not reaction menus, without making any API calls
+    if payload.user_id == botState.client.user.id or payload.message_id not in botState.reactionMenusDB:
+        return
+    menu = botState.reactionMenusDB[payload.message_id]
+
+    # Ignore emojis that are not options in the menu
+    emoji = lib.discordUtil.emojiFromRaw(payload)
+    if emoji is None or not menu.hasEmojiRegistered(emoji):
+        return
+
+    # Find the reacting user, fetching them only if they are not cached
+    user = await lib.discordUtil.reactingUserFromRaw(payload)
+    if user is None:
+        return
 
-        # If the message reacted to is a reaction menu
-        if payload.message_id in botState.reactionMenusDB and \
-                botState.reactionMenusDB[payload.message_id].hasEmojiRegistered(emoji):
-            # Envoke the reacted option's behaviour
-            await botState.reactionMenusDB[payload.message_id].reactionAdded(emoji, user)
+    # Envoke the reacted option's behaviour
+    botState.reactionMenusDB.touch(payload.message_id)
+    await menu.reactionAdded(emoji, user)
 
 
 @botState.client.event
@@ -612,18 +695,24 @@ async def on_raw_reaction_remove(payload: discord.RawReactionActionEvent):
 
     :param discord.RawReactionActionEvent payload: An event describing the message and the reaction removed
     """
-    # ignore bot reactions
-    if payload.user_id != botState.client.user.id:
-        # Get rich, useable reaction data
-        _, user, emoji = await lib.discordUtil.reactionFromRaw(payload)
-        if None in [user, emoji]:
-            return
+    # ignore bot reactions, and reactions to messages that are not reaction menus, without making any API calls
+    if payload.user_id == botState.client.user.id or payload.message_id not in botState.reactionMenusDB:
+        return
+    menu = botState.reactionMenusDB[payload.message_id]
+
+    # Ignore emojis that are not options in the menu
+    emoji = lib.discordUtil.emojiFromRaw(payload)
+    if emoji is None or not menu.hasEmojiRegistered(emoji):
+        return
+
+    # Find the reacting user, fetching them only if they are not cached
+    user = await lib.discordUtil.reactingUserFromRaw(payload)
+    if user is None:
+        return
 
-        # If the message reacted to is a reaction menu
-        if payload.message_id in botState.reactionMenusDB and \
-                botState.reactionMenusDB[payload.message_id].hasEmojiRegistered(emoji):
-            # Envoke the reacted option's behaviour
-            await botState.reactionMenusDB[payload.message_id].reactionRemoved(emoji, user)
+    # Envoke the reacted option's behaviour
+    botState.reactionMenusDB.touch(payload.message_id)
+    await menu.reactionRemoved(emoji, user)
 
 
 @botState.client.event
@@ -10,14 +10,25 @@ shutdown = ShutDownState.restart
 usersDB = None
 guildsDB = None
 reactionMenusDB = None
+# Index of which users are members of which guilds
+guildMembership = None
 
 newBountiesTTDB = None
 duelRequestTTDB = None
+reactionMenusTTDB = None
+reactionMenuSweepTT = None
 shopRefreshTT = None
 
+# Pre-generated bounty routes shared between all guilds
+bountyPool = None
+bountyPoolRefillTT = None
+
 taskScheduler = None
 logger = None
 
+# Central outbound message delivery queue
+messageQueue = None
+
 dbSaveTT = None
 updatesCheckTT = None
 
@@ -86,6 +86,15 @@ builtInWeaponObjs = {}
 builtInUpgradeObjs = {}
 builtInTurretObjs = {}
 
+# An index of all of the above objects, and a Ship object for each builtIn ship, by lower case name and alias.
+# The categories are systems, criminals, ships, weapons, modules, turrets, tools and skins.
+# A lib.aliasIndex.AliasIndex, created by gameConfigurator.loadAllGameObjects.
+nameIndex = None
+
+# The embeds sent by info commands for the above objects, built as they are requested.
+# A lib.embedCache.EmbedCache, created by gameConfigurator.loadAllGameObjects.
+infoEmbeds = None
+
 # References to the above item objects, sorted by techLevel.
 shipKeysByTL = []
 moduleObjsByTL = []
@@ -51,10 +51,16 @@ timeouts = {
     # time to put users on cooldown between using !bb check
     "checkCooldown": {"minutes": 3},
 
+    # Amount of time to wait between generating batches of bounty routes for the shared bounty pool
+    "bountyPoolRefill": {"seconds": 30},
+
     # Default amount of time reaction menus should be active for
     "roleMenuExpiry": {"days": 1},
     "duelChallengeMenuExpiry": {"hours": 2},
-    "pollMenuExpiry": {"minutes": 5}
+    "pollMenuExpiry": {"minutes": 5},
+
+    # Amount of time to wait between checking for reaction menus whose messages have been deleted
+    "reactionMenuSweep": {"hours": 1}
 }
 
 paths = {
@@ -102,6 +108,13 @@ includedCommandModules = (  "usr_misc", "usr_homeguilds", "usr_gof2-info", "usr_
 # Default prefix for commands
 defaultCommandPrefix = "$"
 
+# The maximum number of similar names to suggest when a command is given a game object name that is not recognised
+maxNameSuggestions = 3
+
+# The minimum similarity, between 0 and 1, of a game object name to suggest in place of an unrecognised name.
+# Similarity is the proportion of three character sequences shared by the two names.
+nameSuggestionMinSimilarity = 0.3
+
 
 
 ##### REACTION MENUS #####
@@ -116,6 +129,16 @@ maxRoleMenusPerGuild = 10
 toolUseConfirmTimeoutSeconds = 60
 # Amount of time to allow for response to the cmd_transfer confirmation menu
 homeGuildTransferConfirmTimeoutSeconds = 60
+# The maximum number of saved menu messages to fetch at once when restoring reaction menus on startup
+reactionMenuRestoreMaxConcurrent = 10
+# The maximum number of reaction menus to keep active. When exceeded, the least recently used menus are expired early
+reactionMenuDBMaxSize = 1000
+# The maximum number of menu messages to fetch at once when sweeping for menus with deleted messages
+reactionMenuSweepMaxConcurrent = 10
+# The maximum number of reaction removals to send at once when updating a reaction menu's options
+reactionMenuMaxConcurrentReactionOps = 5
+# The maximum number of built pages to keep in memory for each paged reaction menu
+pagedMenuPageCacheSize = 5
 
 
 
@@ -131,6 +154,19 @@ timedTaskLatenessThresholdSeconds = 10
 # Whether or not to check for updates to BASED
 BASED_checkForUpdates = True
 
+# Outbound message rate limits, shared by all channels and for each individual channel.
+# Rates are in messages per second, bursts are the number of messages that may be sent at once before rate limiting.
+messageQueueGlobalRate = 45
+messageQueueGlobalBurst = 45
+messageQueueChannelRate = 1
+messageQueueChannelBurst = 5
+# The maximum number of messages that may be awaiting a response from discord at once
+messageQueueMaxConcurrentSends = 10
+# Rate limiters for idle channels are discarded when more than this many are stored
+messageQueueMaxIdleBuckets = 1000
+# The maximum number of seconds to wait for queued messages to be sent on shutdown
+messageQueueShutdownTimeoutSeconds = 10
+
 
 
 ##### ADMINISTRATION #####
@@ -162,6 +198,10 @@ userAlertsIDsDefaults = {   "bounties_new": False,
 
 homeGuildTransferCooldown = {"weeks": 1}
 
+# Whether to check users' cached total value against a full recalculation whenever it is read, logging and repairing
+# any mismatch. This is slow, and is intended only for debugging.
+debugValueCache = False
+
 
 
 ##### GAME MATHS #####
@@ -219,6 +259,9 @@ maxBountiesPerFaction = 5
 # The maximum number of bounties a player is allowed to win each day
 maxDailyBountyWins = 10
 
+# The number of expired bounties to retain per faction in each guild's escaped bounties, oldest first to be discarded
+maxEscapedBountiesPerFaction = 10
+
 # can be "fixed" or "random"
 newBountyDelayType = "random-routeScale"
 
@@ -239,6 +282,12 @@ newBountyDelayRandomRange = {"min": 5 * 60, "max": 7 * 60}
 newBountyDelayRouteScaleCoefficient = 1
 fallbackRouteScale = 5
 
+### bounty pool config
+# The number of bounty routes to pre-generate, shared between all guilds
+bountyPoolSize = 50
+# The maximum number of bounty routes to generate each time the bounty pool is refilled
+bountyPoolRefillBatchSize = 5
+
 
 # The number of credits to award for each bPoint (each system in a criminal route)
 bPointsToCreditsRatio = 1000
@@ -246,6 +295,18 @@ bPointsToCreditsRatio = 1000
 # number of bounties ahead of a checked system in a route to report a recent criminal spotting (+1)
 closeBountyThreshold = 4
 
+# The minimum number of seconds between edits to a BountyBoardChannel's listings. Listing updates requested in between
+# are coalesced, and only the latest state of each listing is sent.
+bbcEditIntervalSeconds = 5
+
+# When loading a BountyBoardChannel with at least this many stored messages, find them all in a single sweep of the
+# channel's history rather than fetching each message individually
+bbcHistorySweepThreshold = 5
+# The maximum number of messages to read in a BountyBoardChannel history sweep
+bbcHistorySweepLimit = 500
+# The maximum number of BountyBoardChannels to load at once on startup
+bbcInitMaxConcurrent = 10
+
 # Text to send to a BountyBoardChannel when no bounties are currently active
 bbcNoBountiesMsg = "```css\n[ NO ACTIVE BOUNTIES ]\n\nThere are currently no active bounty listings.\n" \
                     + "Please check back later, or use [ $notify bounties ] to be pinged when new ones become available!\n```"
@@ -333,12 +394,23 @@ botToken_envVarName = ""
 # The number of times to retry API calls when HTTP exceptions are thrown
 httpErrRetries = 3
 
-# The number of seconds to wait between API call retries upon HTTP exception catching
-httpErrRetryDelaySeconds = 1
+# The delay before the first API call retry. Each further retry doubles the maximum delay, up to
+# httpErrRetryMaxDelaySeconds. The actual delay is randomly chosen between zero and this maximum.
+httpErrRetryBaseDelaySeconds = 1
+httpErrRetryMaxDelaySeconds = 30
+
+# The maximum number of API call retries allowed across the whole bot within httpErrRetryBudgetWindowSeconds
+httpErrRetryBudget = 30
+httpErrRetryBudgetWindowSeconds = 60
+
+# The number of consecutive failed API calls to a channel after which calls to that channel are stopped,
+# and the number of seconds to stop them for
+httpCircuitBreakerThreshold = 5
+httpCircuitBreakerResetSeconds = 60
 
 # The categories to sort and save logs into
 loggingCategories = [   "usersDB", "guildsDB", "bountiesDB", "shop", "escapedBounties", "bountyConfig", "duels", "hangar",
-                        "bountyBoards", "newBounties", "reactionMenus", "userAlerts"]
+                        "bountyBoards", "newBounties", "reactionMenus", "userAlerts", "messageQueue"]
 
 # The maximum recursion depth of directory-walking when loading gameObjects from their JSON representation
 gameObjectCfgMaxRecursion = 6
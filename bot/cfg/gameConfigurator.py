@@ -6,7 +6,7 @@ from types import FunctionType
 from . import cfg, bbData
 from ..gameObjects import shipUpgrade, shipSkin
 from ..gameObjects.bounties import criminal, solarSystem
-from ..gameObjects.items import moduleItemFactory
+from ..gameObjects.items import moduleItemFactory, gameItem, shipItem
 from ..gameObjects.items.weapons import primaryWeapon, turretWeapon
 from ..gameObjects.items.tools import shipSkinTool, toolItemFactory
 from .. import lib
@@ -150,8 +150,12 @@ def _loadGameObjects(dataDB : Dict[str, dict], objsDB : Dict[str, Any], deserial
     No new dictionaries are created.
     """
     for objDict in dataDB.values():
-        objsDB[objDict["name"]] = deserializer(objDict)
-        objsDB[objDict["name"]].builtIn = True
+        newObj = deserializer(objDict)
+        # Deserializers intern custom items, but builtIn items are already unique
+        if isinstance(newObj, gameItem.GameItem):
+            gameItem.uninternItem(newObj)
+        newObj.builtIn = True
+        objsDB[objDict["name"]] = newObj
         dataDB[objDict["name"]]["builtIn"] = True
 
 
@@ -202,6 +206,28 @@ def _makeItemSpawnRates(objsDB : Dict[str, Any]):
         item.shopSpawnRate = gameMaths.truncItemSpawnResolution(normalizedChance * 100)
 
 
+def _buildNameIndex():
+    """Index all builtIn game objects by name and alias, for constant time lookups and name suggestions in commands.
+    Ship objects are created for builtIn ships, all sharing the template of their model.
+    Must be called after shop spawn rates have been calculated, as they are included in ship templates.
+    """
+    bbData.nameIndex = lib.aliasIndex.AliasIndex()
+    for category, objsDB in (   ("systems",     bbData.builtInSystemObjs),
+                                ("criminals",   bbData.builtInCriminalObjs),
+                                ("weapons",     bbData.builtInWeaponObjs),
+                                ("modules",     bbData.builtInModuleObjs),
+                                ("turrets",     bbData.builtInTurretObjs),
+                                ("tools",       bbData.builtInToolObjs)):
+        for obj in objsDB.values():
+            bbData.nameIndex.addAliasable(category, obj)
+
+    for shipData in bbData.builtInShipData.values():
+        bbData.nameIndex.addAliasable("ships", shipItem.Ship.fromDict(shipData))
+
+    for skin in bbData.builtInShipSkins.values():
+        bbData.nameIndex.add("skins", skin, skin.name)
+
+
 def loadAllGameObjectData():
     """Load json descriptions of all configured game objects into bbData variables.
     This function populates:
@@ -237,7 +263,7 @@ def loadAllGameObjects():
     """Instance all objects described by the metadata found in bbData, and store those instances in bbData variables.
     ShipSkinTools are created for all ShipSkins for which there is no existing tool in builtInToolData.
     Shop spawn rates are then calculated for each instanced game object.
-    Finally, sorted references to these objects are placed into bbData variables.
+    Finally, sorted references to these objects are placed into bbData variables, and all objects are indexed by name.
 
     This function populates:
 
@@ -255,10 +281,16 @@ def loadAllGameObjects():
     bbData.weaponObjsByTL
     bbData.turretObjsByTL
 
+    bbData.nameIndex
+    bbData.infoEmbeds
+
     This function currently does NOT populate:
     bbData.builtInCommodityObjs
     bbData.builtInSecondariesObjs
     """
+    # Discard the templates of previously loaded ships, so that ships are built from the newly loaded data
+    shipItem.builtInTemplates.clear()
+
     for dataDB, objsDB, deserializer in (
                 (bbData.builtInCriminalData,bbData.builtInCriminalObjs, criminal.Criminal.fromDict),
                 (bbData.builtInSystemData,  bbData.builtInSystemObjs,   solarSystem.SolarSystem.fromDict),
@@ -295,3 +327,7 @@ def loadAllGameObjects():
         bbData.bountyNames[bbData.builtInCriminalData[criminalName]["faction"]].append(criminalName)
         if len(criminalName) > bbData.longestBountyNameLength:
             bbData.longestBountyNameLength = len(criminalName)
+
+    _buildNameIndex()
+    # Discard any embeds describing previously loaded objects
+    bbData.infoEmbeds = lib.embedCache.EmbedCache()
@@ -10,7 +10,6 @@ from ..cfg import cfg, bbData
 from ..userAlerts import userAlerts
 from ..scheduling import timedTask
 from ..reactionMenus import reactionRolePicker, reactionSkinRegionPicker
-from ..gameObjects.items import shipItem
 from ..shipRenderer import shipRenderer
 
 CWD = os.getcwd()
@@ -444,18 +443,16 @@ async def admin_cmd_showmeHD(message : discord.Message, args : str, isDM : bool)
 
     # look up the ship object
     itemName = args.rstrip(" ").title()
-    itemObj = None
-    for ship in bbData.builtInShipData.values():
-        shipObj = shipItem.Ship.fromDict(ship)
-        if shipObj.isCalled(itemName):
-            itemObj = shipObj
+    itemObj = bbData.nameIndex.get("ships", itemName)
 
     # report unrecognised ship names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         return
 
     shipData = bbData.builtInShipData[itemObj.name]
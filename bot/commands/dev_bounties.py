@@ -22,6 +22,7 @@ async def dev_cmd_clear_bounties(message : discord.Message, args : str, isDM : b
             if not guild.bountiesDisabled:
                 if guild.hasBountyBoardChannel:
                     await guild.bountyBoardChannel.clear()
+                guild.unscheduleAllBountyExpiries()
                 guild.bountiesDB.clearBounties()
         await message.channel.send(":ballot_box_with_check: All active bounties cleared.")
         return
@@ -48,6 +49,7 @@ async def dev_cmd_clear_bounties(message : discord.Message, args : str, isDM : b
 
     if callingBBGuild.hasBountyBoardChannel:
         await callingBBGuild.bountyBoardChannel.clear()
+    callingBBGuild.unscheduleAllBountyExpiries()
     callingBBGuild.bountiesDB.clearBounties()
     await message.channel.send(":ballot_box_with_check: Active bounties cleared" + ((" for '" + callingBBGuild.dcGuild.name \
                                 + "'.") if callingBBGuild.dcGuild is not None else "."))
@@ -333,12 +335,10 @@ async def dev_cmd_make_bounty(message : discord.Message, args : str, isDM : bool
             newName = ""
         else:
             # if a criminal name was given, see if it corresponds to a builtIn criminal
-            for crim in bbData.builtInCriminalObjs.values():
-                if crim.isCalled(newName):
-                    builtIn = True
-                    builtInCrimObj = crim
-                    newName = crim.name
-                    break
+            builtInCrimObj = bbData.nameIndex.get("criminals", newName)
+            if builtInCrimObj is not None:
+                builtIn = True
+                newName = builtInCrimObj.name
 
             # if a criminal name was given, ensure it does not already exist as a bounty
             if newName != "" and callingBBGuild.bountiesDB.bountyNameExists(newName):
@@ -407,6 +407,7 @@ async def dev_cmd_make_bounty(message : discord.Message, args : str, isDM : bool
 
     # activate and announce the new bounty
     callingBBGuild.bountiesDB.addBounty(newBounty)
+    callingBBGuild.scheduleBountyExpiry(newBounty)
     await callingBBGuild.announceNewBounty(newBounty)
 
 botCommands.register("make-bounty", dev_cmd_make_bounty, 2, forceKeepArgsCasing=True, allowDM=True, helpSection="bounties",
@@ -562,6 +563,7 @@ async def dev_cmd_make_player_bounty(message : discord.Message, args : str, isDM
 
     # activate and announce the bounty
     callingBBGuild.bountiesDB.addBounty(newBounty)
+    callingBBGuild.scheduleBountyExpiry(newBounty)
     await callingBBGuild.announceNewBounty(newBounty)
 
 botCommands.register("make-player-bounty", dev_cmd_make_player_bounty, 2, forceKeepArgsCasing=True, allowDM=True,
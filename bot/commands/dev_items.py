@@ -274,20 +274,12 @@ async def dev_cmd_del_item_key(message : discord.Message, args : str, isDM : boo
     else:
         itemName = requestedItem.name + "\n" + requestedItem.statsStringShort()
 
-    if requestedItem not in userItemInactives.items:
-        userItemInactives.keys.remove(requestedItem)
-        userItemInactives.numKeys -= 1
-        await message.channel.send(":white_check_mark: **Erroneous key** deleted from " \
-                                    + lib.discordUtil.userOrMemberName(requestedUser, message.guild) \
-                                    + "'s inventory: " + itemName, embed=itemEmbed)
-    else:
-        itemCount = userItemInactives.items[requestedItem].count
-        del userItemInactives.items[requestedItem]
-        userItemInactives.keys.remove(requestedItem)
-        userItemInactives.numKeys -= 1
-        await message.channel.send(":white_check_mark: " + str(itemCount) + " item(s) deleted from " \
-                                    + lib.discordUtil.userOrMemberName(requestedUser, message.guild) \
-                                    + "'s inventory: " + itemName, embed=itemEmbed)
+    # Inventory keys are read from the inventory's listings, so a key cannot exist without a listing
+    itemCount = userItemInactives.items[requestedItem].count
+    userItemInactives.removeItem(requestedItem, quantity=itemCount)
+    await message.channel.send(":white_check_mark: " + str(itemCount) + " item(s) deleted from " \
+                                + lib.discordUtil.userOrMemberName(requestedUser, message.guild) \
+                                + "'s inventory: " + itemName, embed=itemEmbed)
 
 botCommands.register("del-item-key", dev_cmd_del_item_key, 2, allowDM=True, helpSection="items", useDoc=True)
 
@@ -88,13 +88,18 @@ async def dev_cmd_broadcast(message : discord.Message, args : str, isDM : bool):
         sendArgs = lib.discordUtil.messageArgsFromStr(args)
 
         if args.split(" ")[0].lower() == "announce-channel":
-            for guild in botState.guildsDB.guilds.values():
-                if guild.hasAnnounceChannel():
-                    await guild.getAnnounceChannel().send(sendArgs)
+            channels = [guild.getAnnounceChannel() for guild in botState.guildsDB.guilds.values() \
+                        if guild.hasAnnounceChannel()]
         else:
-            for guild in botState.guildsDB.guilds.values():
-                if guild.hasPlayChannel():
-                    await guild.getPlayChannel().send(sendArgs)
+            channels = [guild.getPlayChannel() for guild in botState.guildsDB.guilds.values() if guild.hasPlayChannel()]
+
+        results = await botState.messageQueue.broadcast(channels, **sendArgs)
+        failed = [channel for channel, result in results.items() if isinstance(result, Exception)]
+        resultMsg = "Broadcast sent to " + str(len(channels) - len(failed)) + "/" + str(len(channels)) + " channels."
+        if failed:
+            resultMsg += "\nFailed channels: " + ", ".join(str(channel.id) for channel in failed[:20]) \
+                            + (" and " + str(len(failed) - 20) + " more" if len(failed) > 20 else "")
+        await message.channel.send(resultMsg)
 
 botCommands.register("broadcast", dev_cmd_broadcast, 2, forceKeepArgsCasing=True, allowDM=True, useDoc=True)
 
@@ -118,6 +123,74 @@ async def dev_cmd_reset_has_poll(message : discord.Message, args : str, isDM : b
 botCommands.register("reset-has-poll", dev_cmd_reset_has_poll, 2, allowDM=True, useDoc=True)
 
 
+async def dev_cmd_menu_counts(message : discord.Message, args : str, isDM : bool):
+    """developer command listing the number of active reaction menus of each type.
+
+    :param discord.Message message: the discord message calling the command
+    :param str args: ignored
+    :param bool isDM: Whether or not the command is being called from a DM channel
+    """
+    menuCounts = botState.reactionMenusDB.countByType()
+    countsStr = "\n".join(menuType + ": " + str(menuCounts[menuType]) for menuType in sorted(menuCounts))
+    await message.channel.send("**" + str(len(botState.reactionMenusDB)) + "/" + str(botState.reactionMenusDB.maxSize) \
+                                + " active reaction menus**" + ("\n" + countsStr if countsStr else ""))
+
+botCommands.register("menu-counts", dev_cmd_menu_counts, 2, allowDM=True, useDoc=True)
+
+
+async def dev_cmd_economy_stats(message : discord.Message, args : str, isDM : bool):
+    """developer command printing economy-wide aggregates of user stats, such as the total credits in circulation.
+    Give a guild ID to aggregate over only the members of that guild, or 'local' for the calling guild.
+
+    :param discord.Message message: the discord message calling the command
+    :param str args: string containing either nothing, a guild ID, or 'local'
+    :param bool isDM: Whether or not the command is being called from a DM channel
+    """
+    if args == "":
+        userIDs = None
+        scopeStr = "all users"
+    elif args == "local":
+        if isDM:
+            await message.channel.send(":x: Either give a guild id or call from within a guild")
+            return
+        userIDs = botState.guildMembership.membersOf(message.guild.id)
+        scopeStr = "members of " + message.guild.name
+    elif lib.stringTyping.isInt(args):
+        userIDs = botState.guildMembership.membersOf(int(args))
+        scopeStr = "members of guild #" + args
+    else:
+        await message.channel.send(":x: Unrecognised parameter: " + args)
+        return
+
+    statsStore = botState.usersDB.statsStore
+    numUsers = len(statsStore) if userIDs is None else sum(1 for userID in userIDs if userID in statsStore.rows)
+    if numUsers == 0:
+        await message.channel.send("No users found for " + scopeStr)
+        return
+
+    statsStr = "**Economy stats for " + str(numUsers) + " " + scopeStr + "**"
+    for stat in ("credits", "value"):
+        p50, p90, p99 = statsStore.percentiles(stat, (50, 90, 99), userIDs=userIDs)
+        statsStr += "\n" + stat + ": total " + str(int(statsStore.total(stat, userIDs=userIDs))) \
+                    + ", mean " + str(int(statsStore.mean(stat, userIDs=userIDs))) \
+                    + ", median " + str(int(p50)) + ", p90 " + str(int(p90)) + ", p99 " + str(int(p99))
+
+    winsBins = [1, 5, 10, 50, 100]
+    winsCounts = statsStore.histogram("bountyWins", winsBins, userIDs=userIDs)
+    binNames = ["0"] + [str(winsBins[i]) + "-" + str(winsBins[i + 1] - 1) for i in range(len(winsBins) - 1)] \
+                + [str(winsBins[-1]) + "+"]
+    statsStr += "\nbountyWins: " + ", ".join(binNames[i] + ": " + str(winsCounts[i]) for i in range(len(binNames)))
+    statsStr += "\nduels: " + str(statsStore.total("duelWins", userIDs=userIDs)) + " won, " \
+                + str(statsStore.total("duelCreditsWins", userIDs=userIDs)) + " credits won"
+
+    topEarners = statsStore.top("lifetimeCredits", 3, userIDs=userIDs)
+    statsStr += "\ntop bounty earners: " + ", ".join("#" + str(userID) + " (" + str(score) + ")"
+                                                    for userID, score in topEarners)
+    await message.channel.send(statsStr)
+
+botCommands.register("economy-stats", dev_cmd_economy_stats, 2, allowDM=True, useDoc=True)
+
+
 async def dev_cmd_bot_update(message: discord.Message, args: str, isDM: bool):
     """developer command that gracefully shuts down the bot, performs git pull, and then reboots the bot.
 
@@ -2,7 +2,6 @@ import discord
 
 from . import commandsDB as botCommands
 from ..cfg import cfg, bbData
-from ..gameObjects.items import shipItem
 from .. import lib, botState
 
 
@@ -35,27 +34,27 @@ async def dev_cmd_addSkin(message : discord.Message, args : str, isDM : bool):
 
     # look up the ship object
     itemName = args.rstrip(" ").title()
-    itemObj = None
-    for ship in bbData.builtInShipData.values():
-        shipObj = shipItem.Ship.fromDict(ship)
-        if shipObj.isCalled(itemName):
-            itemObj = shipObj
+    itemObj = bbData.nameIndex.get("ships", itemName)
 
     # report unrecognised ship names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         return
 
     if skin != "":
         skin = skin.lstrip(" ").lower()
         if skin not in bbData.builtInShipSkins:
             if len(skin) < 20:
-                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
             else:
-                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
 
         elif skin in bbData.builtInShipData[itemObj.name]["compatibleSkins"]:
             await message.channel.send(":x: That skin is already compatible with the **" + itemObj.name + "**!")
@@ -98,27 +97,27 @@ async def dev_cmd_delSkin(message : discord.Message, args : str, isDM : bool):
 
     # look up the ship object
     itemName = args.rstrip(" ").title()
-    itemObj = None
-    for ship in bbData.builtInShipData.values():
-        shipObj = shipItem.Ship.fromDict(ship)
-        if shipObj.isCalled(itemName):
-            itemObj = shipObj
+    itemObj = bbData.nameIndex.get("ships", itemName)
 
     # report unrecognised ship names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         return
 
     if skin != "":
         skin = skin.lstrip(" ").lower()
         if skin not in bbData.builtInShipSkins:
             if len(skin) < 20:
-                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
             else:
-                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
 
         elif skin not in bbData.builtInShipData[itemObj.name]["compatibleSkins"]:
             await message.channel.send(":x: That skin is already incompatible with the **" + itemObj.name + "**!")
@@ -159,27 +158,27 @@ async def dev_cmd_makeSkin(message : discord.Message, args : str, isDM : bool):
 
     # look up the ship object
     itemName = args.rstrip(" ").title()
-    itemObj = None
-    for ship in bbData.builtInShipData.values():
-        shipObj = shipItem.Ship.fromDict(ship)
-        if shipObj.isCalled(itemName):
-            itemObj = shipObj
+    itemObj = bbData.nameIndex.get("ships", itemName)
 
     # report unrecognised ship names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         return
 
     if skin != "":
         skin = skin.lstrip(" ").lower()
         if skin not in bbData.builtInShipSkins:
             if len(skin) < 20:
-                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
             else:
-                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
 
         elif skin in bbData.builtInShipData[itemObj.name]["compatibleSkins"]:
             await message.channel.send(":x: That skin is already compatible with the **" + itemObj.name + "**!")
@@ -215,9 +214,11 @@ async def dev_cmd_applySkin(message : discord.Message, args : str, isDM : bool):
         skin = args.lower()
         if skin not in bbData.builtInShipSkins:
             if len(skin) < 20:
-                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
             else:
-                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+                await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                           + bbData.nameIndex.suggestionStr("skins", skin))
 
         elif skin not in bbData.builtInShipData[activeShip.name]["compatibleSkins"]:
             await message.channel.send(":x: That skin is incompatible with your active ship! (" + activeShip.name + ")")
@@ -245,7 +246,6 @@ async def dev_cmd_unapplySkin(message : discord.Message, args : str, isDM : bool
     else:
         activeShip.icon = bbData.builtInShipData[activeShip.name]["icon"]
         activeShip.skin = ""
-        activeShip.isSkinned = False
         await message.channel.send("Done!")
 
 botCommands.register("unApplySkin", dev_cmd_unapplySkin, 2, helpSection="skins", useDoc=True)
@@ -266,9 +266,11 @@ async def dev_cmd_add_skin_to_all_ships(message : discord.Message, args : str, i
     skin = args.strip(" ").lower()
     if skin not in bbData.builtInShipSkins:
         if len(skin) < 20:
-            await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+            await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("skins", skin))
         else:
-            await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+            await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("skins", skin))
 
     await lib.discordUtil.startLongProcess(message)
 
@@ -297,9 +299,11 @@ async def dev_cmd_del_skin_from_all_ships(message : discord.Message, args : str,
     skin = args.strip(" ").lower()
     if skin not in bbData.builtInShipSkins:
         if len(skin) < 20:
-            await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+            await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("skins", skin))
         else:
-            await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+            await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("skins", skin))
 
     await lib.discordUtil.startLongProcess(message)
 
@@ -47,19 +47,18 @@ async def cmd_check(message : discord.Message, args : str, isDM : bool):
         return
 
     requestedSystem = args.title()
-    systObj = None
 
     # attempt to find the requested system in the database
-    for syst in bbData.builtInSystemObjs.keys():
-        if bbData.builtInSystemObjs[syst].isCalled(requestedSystem):
-            systObj = bbData.builtInSystemObjs[syst]
+    systObj = bbData.nameIndex.get("systems", requestedSystem)
 
     # reject if the requested system is not in the database
     if systObj is None:
         if len(requestedSystem) < 20:
-            await message.channel.send(":x: The **" + requestedSystem + "** system is not on my star map! :map:")
+            await message.channel.send(":x: The **" + requestedSystem + "** system is not on my star map! :map:" \
+                                       + bbData.nameIndex.suggestionStr("systems", requestedSystem))
         else:
-            await message.channel.send(":x: The **" + requestedSystem[0:15] + "**... system is not on my star map! :map:")
+            await message.channel.send(":x: The **" + requestedSystem[0:15] + "**... system is not on my star map! :map:" \
+                                       + bbData.nameIndex.suggestionStr("systems", requestedSystem))
         return
 
     requestedSystem = systObj.name
@@ -84,52 +83,51 @@ async def cmd_check(message : discord.Message, args : str, isDM : bool):
         systemInBountyRoute = False
         dailyBountiesMaxReached = False
 
-        # Loop over all bounties in the database
-        for fac in callingGuild.bountiesDB.getFactions():
-            # list of completed bounties to remove from the bounties database
-            toPop = []
-            for bounty in callingGuild.bountiesDB.getFactionBounties(fac):
-
-                # Check the passed system in current bounty
-                # If current bounty resides in the requested system
-                checkResult = bounty.check(requestedSystem, message.author.id)
-                if checkResult == 3:
-                    requestedBBUser.bountyWinsToday += 1
-                    if not dailyBountiesMaxReached and requestedBBUser.bountyWinsToday >= cfg.maxDailyBountyWins:
-                        requestedBBUser.dailyBountyWinsReset = lib.timeUtil.tomorrow()
-                        dailyBountiesMaxReached = True
-
-                    bountyWon = True
-                    # reward all contributing users
-                    rewards = bounty.calcRewards()
-                    for userID in rewards:
-                        botState.usersDB.getUser(
-                            userID).credits += rewards[userID]["reward"]
-                        botState.usersDB.getUser(
-                            userID).lifetimeCredits += rewards[userID]["reward"]
-                    # add this bounty to the list of bounties to be removed
-                    toPop += [bounty]
-                    # Announce the bounty has ben completed
-                    await callingGuild.announceBountyWon(bounty, rewards, message.author)
-
-                if checkResult != 0:
-                    systemInBountyRoute = True
-                    await callingGuild.updateBountyBoardChannel(bounty, bountyComplete=checkResult == 3)
-
-            # remove all completed bounties
-            for bounty in toPop:
+        # list of completed bounties to remove from the bounties database
+        toPop = []
+        # Loop over all bounties whose route passes through the requested system.
+        # Take a copy of the index entry, as bounty board updates may yield to other commands.
+        for bounty, position in list(callingGuild.bountiesDB.getSystemBounties(requestedSystem)):
+            # Check the passed system in current bounty
+            # If current bounty resides in the requested system
+            checkResult = bounty.check(requestedSystem, message.author.id)
+            if checkResult == 3:
+                requestedBBUser.bountyWinsToday += 1
+                if not dailyBountiesMaxReached and requestedBBUser.bountyWinsToday >= cfg.maxDailyBountyWins:
+                    requestedBBUser.dailyBountyWinsReset = lib.timeUtil.tomorrow()
+                    dailyBountiesMaxReached = True
+
+                bountyWon = True
+                # reward all contributing users
+                rewards = bounty.calcRewards()
+                for userID in rewards:
+                    botState.usersDB.getUser(
+                        userID).credits += rewards[userID]["reward"]
+                    botState.usersDB.getUser(
+                        userID).lifetimeCredits += rewards[userID]["reward"]
+                # add this bounty to the list of bounties to be removed
+                toPop += [bounty]
+                # Announce the bounty has ben completed
+                await callingGuild.announceBountyWon(bounty, rewards, message.author)
+
+            if checkResult != 0:
+                systemInBountyRoute = True
+                await callingGuild.updateBountyBoardChannel(bounty, bountyComplete=checkResult == 3)
+
+        # remove all completed bounties
+        for bounty in toPop:
+            if callingGuild.bountiesDB.bountyObjExists(bounty):
                 callingGuild.bountiesDB.removeBountyObj(bounty)
+                callingGuild.unscheduleBountyExpiry(bounty)
 
         sightedCriminalsStr = ""
         # Check if any bounties are close to the requested system in their route, defined by cfg.closeBountyThreshold
-        for fac in callingGuild.bountiesDB.getFactions():
-            for bounty in callingGuild.bountiesDB.getFactionBounties(fac):
-                if requestedSystem in bounty.route:
-                    if 0 < bounty.route.index(bounty.answer) - bounty.route.index(requestedSystem) < cfg.closeBountyThreshold:
-                        # Print any close bounty names
-                        sightedCriminalsStr += "**       **• Local security forces spotted **" \
-                                                + lib.discordUtil.criminalNameOrDiscrim(bounty.criminal) \
-                                                + "** here recently.\n"
+        for bounty, position in callingGuild.bountiesDB.getSystemBounties(requestedSystem):
+            if 0 < bounty.answerPosition - position < cfg.closeBountyThreshold:
+                # Print any close bounty names
+                sightedCriminalsStr += "**       **• Local security forces spotted **" \
+                                        + lib.discordUtil.criminalNameOrDiscrim(bounty.criminal) \
+                                        + "** here recently.\n"
         sightedCriminalsStr = sightedCriminalsStr[:-1]
 
         # If a bounty was won, print a congratulatory message
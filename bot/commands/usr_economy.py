@@ -589,13 +589,7 @@ botCommands.register("pay", cmd_pay, 0, forceKeepArgsCasing=True, allowDM=True,
 
 
 async def cmd_total_value(message : discord.Message, args : str, isDM : bool):
-    """⚠ WARNING: MARKED FOR CHANGE ⚠
-    The following function is provisional and marked as planned for overhaul.
-    Details: The command output is finalised. However, the inner workings of the command are to be replaced with attribute
-    getters. It is inefficient to calculate total value measurements on every call, so current totals should be cached in
-    object attributes whenever modified.
-
-    print the total value of the specified user, use the calling user if no user is specified.
+    """print the total value of the specified user, use the calling user if no user is specified.
 
     :param discord.Message message: the discord message calling the command
     :param str args: string, can be empty or contain a user mention or ID
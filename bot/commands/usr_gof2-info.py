@@ -5,7 +5,10 @@ import asyncio
 from . import commandsDB as botCommands
 from ..cfg import bbData, cfg
 from .. import lib, botState
+from ..gameObjects.bounties import criminal, solarSystem
 from ..gameObjects.items import shipItem
+from ..gameObjects.items.modules import moduleItem
+from ..gameObjects.items.weapons import primaryWeapon, turretWeapon
 from ..reactionMenus.reactionSkinRegionPicker import ReactionSkinRegionPicker
 from ..shipRenderer import shipRenderer
 
@@ -56,27 +59,23 @@ async def cmd_make_route(message : discord.Message, args : str, isDM : bool):
 
     requestedStart = args.split(",")[0].title()
     requestedEnd = args.split(",")[1][1:].title()
-    startSyst = ""
-    endSyst = ""
 
     # attempt to look up the requested systems in the built in systems database
-    systemsFound = {requestedStart: False, requestedEnd: False}
-    for syst in bbData.builtInSystemObjs.keys():
-        if bbData.builtInSystemObjs[syst].isCalled(requestedStart):
-            systemsFound[requestedStart] = True
-            startSyst = syst
-        if bbData.builtInSystemObjs[syst].isCalled(requestedEnd):
-            systemsFound[requestedEnd] = True
-            endSyst = syst
+    systemsFound = {requestedStart: bbData.nameIndex.get("systems", requestedStart),
+                    requestedEnd: bbData.nameIndex.get("systems", requestedEnd)}
 
     # report any unrecognised systems
     for syst in [requestedStart, requestedEnd]:
-        if not systemsFound[syst]:
+        if systemsFound[syst] is None:
             if len(syst) < 20:
-                await message.channel.send(":x: The **" + syst + "** system is not on my star map! :map:")
+                await message.channel.send(":x: The **" + syst + "** system is not on my star map! :map:" \
+                                           + bbData.nameIndex.suggestionStr("systems", syst))
             else:
-                await message.channel.send(":x: The **" + syst[0:15] + "**... system is not on my star map! :map:")
+                await message.channel.send(":x: The **" + syst[0:15] + "**... system is not on my star map! :map:" \
+                                           + bbData.nameIndex.suggestionStr("systems", syst))
             return
+    startSyst = systemsFound[requestedStart].name
+    endSyst = systemsFound[requestedEnd].name
 
     # report any systems that were recognised, but do not have any neighbours
     for syst in [startSyst, endSyst]:
@@ -108,6 +107,41 @@ botCommands.register("make-route", cmd_make_route, 0, allowDM=True, helpSection=
                                     + "gates. To find out if a system has a jump gate, use `info`.")
 
 
+def _systemInfoEmbed(systObj : solarSystem.SolarSystem) -> discord.Embed:
+    """Build the embed describing a builtIn system, as sent by cmd_info_system.
+
+    :param SolarSystem systObj: The system to describe
+    :return: A new embed describing systObj
+    :rtype: discord.Embed
+    """
+    # build the neighbours statistic into a string
+    neighboursStr = ""
+    for x in systObj.neighbours:
+        neighboursStr += x + ", "
+    if neighboursStr == "":
+        neighboursStr = "No Jumpgate"
+    else:
+        neighboursStr = neighboursStr[:-2]
+
+    # build the statistics embed
+    statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[systObj.faction], desc="__System Information__",
+                                            titleTxt=systObj.name, footerTxt=systObj.faction.title(),
+                                            thumb=bbData.factionIcons[systObj.faction])
+    statsEmbed.add_field(name="Security Level:", value=bbData.securityLevels[systObj.security].title())
+    statsEmbed.add_field(name="Neighbour Systems:", value=neighboursStr)
+
+    # list the system's aliases as a string
+    if len(systObj.aliases) > 1:
+        aliasStr = ""
+        for alias in systObj.aliases:
+            aliasStr += alias + ", "
+        statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
+    # list the system's wiki if one exists
+    if systObj.hasWiki:
+        statsEmbed.add_field(name="‎", value="[Wiki](" + systObj.wiki + ")", inline=False)
+    return statsEmbed
+
+
 async def cmd_info_system(message : discord.Message, args : str, isDM : bool):
     """return statistics about a specified system
 
@@ -126,49 +160,46 @@ async def cmd_info_system(message : discord.Message, args : str, isDM : bool):
 
     # attempt to look up the specified system
     systArg = args.title()
-    systObj = None
-    for syst in bbData.builtInSystemObjs.keys():
-        if bbData.builtInSystemObjs[syst].isCalled(systArg):
-            systObj = bbData.builtInSystemObjs[syst]
+    systObj = bbData.nameIndex.get("systems", systArg)
 
     # report unrecognised systems
     if systObj is None:
         if len(systArg) < 20:
-            await message.channel.send(":x: The **" + systArg + "** system is not on my star map! :map:")
+            await message.channel.send(":x: The **" + systArg + "** system is not on my star map! :map:" \
+                                       + bbData.nameIndex.suggestionStr("systems", systArg))
         else:
-            await message.channel.send(":x: The **" + systArg[0:15] + "**... system is not on my star map! :map:")
+            await message.channel.send(":x: The **" + systArg[0:15] + "**... system is not on my star map! :map:" \
+                                       + bbData.nameIndex.suggestionStr("systems", systArg))
     else:
-        # build the neighbours statistic into a string
-        neighboursStr = ""
-        for x in systObj.neighbours:
-            neighboursStr += x + ", "
-        if neighboursStr == "":
-            neighboursStr = "No Jumpgate"
-        else:
-            neighboursStr = neighboursStr[:-2]
-
-        # build the statistics embed
-        statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[systObj.faction], desc="__System Information__",
-                                                titleTxt=systObj.name, footerTxt=systObj.faction.title(),
-                                                thumb=bbData.factionIcons[systObj.faction])
-        statsEmbed.add_field(name="Security Level:", value=bbData.securityLevels[systObj.security].title())
-        statsEmbed.add_field(name="Neighbour Systems:", value=neighboursStr)
-
-        # list the system's aliases as a string
-        if len(systObj.aliases) > 1:
-            aliasStr = ""
-            for alias in systObj.aliases:
-                aliasStr += alias + ", "
-            statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
-        # list the system's wiki if one exists
-        if systObj.hasWiki:
-            statsEmbed.add_field(name="‎", value="[Wiki](" + systObj.wiki + ")", inline=False)
+        # build the stats embed, or reuse the embed built when this system was first looked up
+        statsEmbed = bbData.infoEmbeds.get("systems", systObj.name, lambda: _systemInfoEmbed(systObj))
         # send the embed
         await message.channel.send(embed=statsEmbed)
 
 # botCommands.register("info-system", 0, cmd_system)
 
 
+def _criminalInfoEmbed(criminalObj : criminal.Criminal) -> discord.Embed:
+    """Build the embed describing a builtIn criminal, as sent by cmd_info_criminal.
+
+    :param Criminal criminalObj: The criminal to describe
+    :return: A new embed describing criminalObj
+    :rtype: discord.Embed
+    """
+    statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[criminalObj.faction],
+                                            desc="__Criminal File__", titleTxt=criminalObj.name, thumb=criminalObj.icon)
+    statsEmbed.add_field(name="Wanted By:", value=criminalObj.faction.title() + "s")
+    # include the criminal's aliases and wiki if they exist
+    if len(criminalObj.aliases) > 1:
+        aliasStr = ""
+        for alias in criminalObj.aliases:
+            aliasStr += alias + ", "
+        statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
+    if criminalObj.hasWiki:
+        statsEmbed.add_field(name="‎", value="[Wiki](" + criminalObj.wiki + ")", inline=False)
+    return statsEmbed
+
+
 async def cmd_info_criminal(message : discord.Message, args : str, isDM : bool):
     """return statistics about a specified inbuilt criminal
 
@@ -187,37 +218,81 @@ async def cmd_info_criminal(message : discord.Message, args : str, isDM : bool):
 
     # look up the criminal object
     criminalName = args.title()
-    criminalObj = None
-    for crim in bbData.builtInCriminalObjs.keys():
-        if bbData.builtInCriminalObjs[crim].isCalled(criminalName):
-            criminalObj = bbData.builtInCriminalObjs[crim]
+    criminalObj = bbData.nameIndex.get("criminals", criminalName)
 
     # report unrecognised criminal names
     if criminalObj is None:
         if len(criminalName) < 20:
-            await message.channel.send(":x: **" + criminalName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + criminalName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("criminals", criminalName))
         else:
-            await message.channel.send(":x: **" + criminalName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + criminalName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("criminals", criminalName))
 
     else:
-        # build the stats embed
-        statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[criminalObj.faction],
-                                                desc="__Criminal File__", titleTxt=criminalObj.name, thumb=criminalObj.icon)
-        statsEmbed.add_field(name="Wanted By:", value=criminalObj.faction.title() + "s")
-        # include the criminal's aliases and wiki if they exist
-        if len(criminalObj.aliases) > 1:
-            aliasStr = ""
-            for alias in criminalObj.aliases:
-                aliasStr += alias + ", "
-            statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
-        if criminalObj.hasWiki:
-            statsEmbed.add_field(name="‎", value="[Wiki](" + criminalObj.wiki + ")", inline=False)
+        # build the stats embed, or reuse the embed built when this criminal was first looked up
+        statsEmbed = bbData.infoEmbeds.get("criminals", criminalObj.name, lambda: _criminalInfoEmbed(criminalObj))
         # send the embed
         await message.channel.send(embed=statsEmbed)
 
 # botCommands.register("info-criminal", 0, cmd_criminal)
 
 
+def _shipInfoEmbed(itemObj : shipItem.Ship) -> discord.Embed:
+    """Build the embed describing a builtIn ship, as sent by cmd_info_ship.
+
+    :param Ship itemObj: The ship to describe
+    :return: A new embed describing itemObj
+    :rtype: discord.Embed
+    """
+    statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
+                                                if itemObj.manufacturer in bbData.factionColours else \
+                                                bbData.factionColours["neutral"], desc="__Ship File__",
+                                            titleTxt=itemObj.name,
+                                            thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
+    statsEmbed.add_field(name="Value:",
+                            value=lib.stringTyping.commaSplitNum(str(itemObj.getValue(shipUpgradesOnly=True))) \
+                                    + " Credits")
+    statsEmbed.add_field(name="Armour:", value=str(itemObj.getArmour()))
+    statsEmbed.add_field(name="Cargo:", value=str(itemObj.getCargo()))
+    statsEmbed.add_field( name="Handling:", value=str(itemObj.getHandling()))
+    statsEmbed.add_field(name="Max Primaries:", value=str(itemObj.getMaxPrimaries()))
+    if len(itemObj.weapons) > 0:
+        weaponStr = "*["
+        for weapon in itemObj.weapons:
+            weaponStr += weapon.name + ", "
+        statsEmbed.add_field(name="Equipped Primaries:", value=weaponStr[:-2] + "]*")
+    statsEmbed.add_field(name="Max Secondaries:", value=str(itemObj.getMaxSecondaries()))
+    # if len(itemObj.secondaries) > 0:
+    #     secondariesStr = "*["
+    #     for secondary in itemObj.secondaries:
+    #         secondariesStr += secondary.name + ", "
+    #     statsEmbed.add_field(name="Equipped Secondaries",value=secondariesStr[:-2] + "]*")
+    statsEmbed.add_field(name="Turret Slots:", value=str(itemObj.getMaxTurrets()))
+    if len(itemObj.turrets) > 0:
+        turretsStr = "*["
+        for turret in itemObj.turrets:
+            turretsStr += turret.name + ", "
+        statsEmbed.add_field(name="Equipped Turrets:", value=turretsStr[:-2] + "]*")
+    statsEmbed.add_field(name="Modules Slots:", value=str(itemObj.getMaxModules()))
+    if len(itemObj.modules) > 0:
+        modulesStr = "*["
+        for module in itemObj.modules:
+            modulesStr += module.name + ", "
+        statsEmbed.add_field(name="Equipped Modules:", value=modulesStr[:-2] + "]*")
+    statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
+                                                                + str(itemObj.techLevel))
+    # include the item's aliases and wiki if they exist
+    if len(itemObj.aliases) > 1:
+        aliasStr = ""
+        for alias in itemObj.aliases:
+            aliasStr += alias + ", "
+        statsEmbed.add_field( name="Aliases:", value=aliasStr[:-2], inline=False)
+    if itemObj.hasWiki:
+        statsEmbed.add_field( name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+    return statsEmbed
+
+
 async def cmd_info_ship(message : discord.Message, args : str, isDM : bool):
     """return statistics about a specified inbuilt ship
 
@@ -236,72 +311,55 @@ async def cmd_info_ship(message : discord.Message, args : str, isDM : bool):
 
     # look up the ship object
     itemName = args.title()
-    itemObj = None
-    for ship in bbData.builtInShipData.values():
-        shipObj = shipItem.Ship.fromDict(ship)
-        if shipObj.isCalled(itemName):
-            itemObj = shipObj
+    itemObj = bbData.nameIndex.get("ships", itemName)
 
     # report unrecognised ship names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
 
     else:
-        # build the stats embed
-        statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
-                                                    if itemObj.manufacturer in bbData.factionColours else \
-                                                    bbData.factionColours["neutral"], desc="__Ship File__",
-                                                titleTxt=itemObj.name,
-                                                thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
-        statsEmbed.add_field(name="Value:",
-                                value=lib.stringTyping.commaSplitNum(str(itemObj.getValue(shipUpgradesOnly=True))) \
-                                        + " Credits")
-        statsEmbed.add_field(name="Armour:", value=str(itemObj.getArmour()))
-        statsEmbed.add_field(name="Cargo:", value=str(itemObj.getCargo()))
-        statsEmbed.add_field( name="Handling:", value=str(itemObj.getHandling()))
-        statsEmbed.add_field(name="Max Primaries:", value=str(itemObj.getMaxPrimaries()))
-        if len(itemObj.weapons) > 0:
-            weaponStr = "*["
-            for weapon in itemObj.weapons:
-                weaponStr += weapon.name + ", "
-            statsEmbed.add_field(name="Equipped Primaries:", value=weaponStr[:-2] + "]*")
-        statsEmbed.add_field(name="Max Secondaries:", value=str(itemObj.getMaxSecondaries()))
-        # if len(itemObj.secondaries) > 0:
-        #     secondariesStr = "*["
-        #     for secondary in itemObj.secondaries:
-        #         secondariesStr += secondary.name + ", "
-        #     statsEmbed.add_field(name="Equipped Secondaries",value=secondariesStr[:-2] + "]*")
-        statsEmbed.add_field(name="Turret Slots:", value=str(itemObj.getMaxTurrets()))
-        if len(itemObj.turrets) > 0:
-            turretsStr = "*["
-            for turret in itemObj.turrets:
-                turretsStr += turret.name + ", "
-            statsEmbed.add_field(name="Equipped Turrets:", value=turretsStr[:-2] + "]*")
-        statsEmbed.add_field(name="Modules Slots:", value=str(itemObj.getMaxModules()))
-        if len(itemObj.modules) > 0:
-            modulesStr = "*["
-            for module in itemObj.modules:
-                modulesStr += module.name + ", "
-            statsEmbed.add_field(name="Equipped Modules:", value=modulesStr[:-2] + "]*")
-        statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
-                                                                    + str(itemObj.techLevel))
-        # include the item's aliases and wiki if they exist
-        if len(itemObj.aliases) > 1:
-            aliasStr = ""
-            for alias in itemObj.aliases:
-                aliasStr += alias + ", "
-            statsEmbed.add_field( name="Aliases:", value=aliasStr[:-2], inline=False)
-        if itemObj.hasWiki:
-            statsEmbed.add_field( name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+        # build the stats embed, or reuse the embed built when this ship was first looked up
+        statsEmbed = bbData.infoEmbeds.get("ships", itemObj.name, lambda: _shipInfoEmbed(itemObj))
         # send the embed
         await message.channel.send(embed=statsEmbed)
 
 # botCommands.register("info-ship", 0, cmd_ship)
 
 
+def _weaponInfoEmbed(itemObj : primaryWeapon.PrimaryWeapon) -> discord.Embed:
+    """Build the embed describing a builtIn weapon, as sent by cmd_info_weapon.
+
+    :param PrimaryWeapon itemObj: The weapon to describe
+    :return: A new embed describing itemObj
+    :rtype: discord.Embed
+    """
+    statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
+                                                if itemObj.manufacturer in bbData.factionColours else \
+                                                bbData.factionColours["neutral"],
+                                            desc="__Weapon File__", titleTxt=itemObj.name,
+                                            thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
+    if itemObj.hasTechLevel:
+        statsEmbed.add_field(name="Tech Level:", value=itemObj.techLevel)
+    statsEmbed.add_field(name="Value:", value=str(itemObj.value))
+    statsEmbed.add_field(name="DPS:", value=str(itemObj.dps))
+    statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
+                                                                + str(itemObj.techLevel))
+    # include the item's aliases and wiki if they exist
+    if len(itemObj.aliases) > 1:
+        aliasStr = ""
+        for alias in itemObj.aliases:
+            aliasStr += alias + ", "
+        statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
+    if itemObj.hasWiki:
+        statsEmbed.add_field(name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+    return statsEmbed
+
+
 async def cmd_info_weapon(message : discord.Message, args : str, isDM : bool):
     """return statistics about a specified inbuilt weapon
 
@@ -320,45 +378,56 @@ async def cmd_info_weapon(message : discord.Message, args : str, isDM : bool):
 
     # look up the weapon object
     itemName = args.title()
-    itemObj = None
-    for weap in bbData.builtInWeaponObjs.keys():
-        if bbData.builtInWeaponObjs[weap].isCalled(itemName):
-            itemObj = bbData.builtInWeaponObjs[weap]
+    itemObj = bbData.nameIndex.get("weapons", itemName)
 
     # report unrecognised weapon names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("weapons", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("weapons", itemName))
 
     else:
-        # build the stats embed
-        statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
-                                                    if itemObj.manufacturer in bbData.factionColours else \
-                                                    bbData.factionColours["neutral"],
-                                                desc="__Weapon File__", titleTxt=itemObj.name,
-                                                thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
-        if itemObj.hasTechLevel:
-            statsEmbed.add_field(name="Tech Level:", value=itemObj.techLevel)
-        statsEmbed.add_field(name="Value:", value=str(itemObj.value))
-        statsEmbed.add_field(name="DPS:", value=str(itemObj.dps))
-        statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
-                                                                    + str(itemObj.techLevel))
-        # include the item's aliases and wiki if they exist
-        if len(itemObj.aliases) > 1:
-            aliasStr = ""
-            for alias in itemObj.aliases:
-                aliasStr += alias + ", "
-            statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
-        if itemObj.hasWiki:
-            statsEmbed.add_field(name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+        # build the stats embed, or reuse the embed built when this weapon was first looked up
+        statsEmbed = bbData.infoEmbeds.get("weapons", itemObj.name, lambda: _weaponInfoEmbed(itemObj))
         # send the embed
         await message.channel.send(embed=statsEmbed)
 
 # botCommands.register("info-weapon", 0, cmd_weapon)
 
 
+def _moduleInfoEmbed(itemObj : moduleItem.ModuleItem) -> discord.Embed:
+    """Build the embed describing a builtIn module, as sent by cmd_info_module.
+
+    :param ModuleItem itemObj: The module to describe
+    :return: A new embed describing itemObj
+    :rtype: discord.Embed
+    """
+    statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
+                                                if itemObj.manufacturer in bbData.factionColours \
+                                                else bbData.factionColours["neutral"],
+                                            desc="__Module File__", titleTxt=itemObj.name,
+                                            thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
+    if itemObj.hasTechLevel:
+        statsEmbed.add_field(name="Tech Level:", value=itemObj.techLevel)
+    statsEmbed.add_field(name="Value:", value=str(itemObj.value))
+    statsEmbed.add_field(name="Stats:", value=str(
+        itemObj.statsStringShort()))
+    statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
+                                                                + str(itemObj.techLevel))
+    # include the item's aliases and wiki if they exist
+    if len(itemObj.aliases) > 1:
+        aliasStr = ""
+        for alias in itemObj.aliases:
+            aliasStr += alias + ", "
+        statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
+    if itemObj.hasWiki:
+        statsEmbed.add_field(name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+    return statsEmbed
+
+
 async def cmd_info_module(message : discord.Message, args : str, isDM : bool):
     """return statistics about a specified inbuilt module
 
@@ -377,46 +446,55 @@ async def cmd_info_module(message : discord.Message, args : str, isDM : bool):
 
     # look up the module object
     itemName = args.title()
-    itemObj = None
-    for module in bbData.builtInModuleObjs.keys():
-        if bbData.builtInModuleObjs[module].isCalled(itemName):
-            itemObj = bbData.builtInModuleObjs[module]
+    itemObj = bbData.nameIndex.get("modules", itemName)
 
     # report unrecognised module names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("modules", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("modules", itemName))
 
     else:
-        # build the stats embed
-        statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
-                                                    if itemObj.manufacturer in bbData.factionColours \
-                                                    else bbData.factionColours["neutral"],
-                                                desc="__Module File__", titleTxt=itemObj.name,
-                                                thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
-        if itemObj.hasTechLevel:
-            statsEmbed.add_field(name="Tech Level:", value=itemObj.techLevel)
-        statsEmbed.add_field(name="Value:", value=str(itemObj.value))
-        statsEmbed.add_field(name="Stats:", value=str(
-            itemObj.statsStringShort()))
-        statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
-                                                                    + str(itemObj.techLevel))
-        # include the item's aliases and wiki if they exist
-        if len(itemObj.aliases) > 1:
-            aliasStr = ""
-            for alias in itemObj.aliases:
-                aliasStr += alias + ", "
-            statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
-        if itemObj.hasWiki:
-            statsEmbed.add_field(name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+        # build the stats embed, or reuse the embed built when this module was first looked up
+        statsEmbed = bbData.infoEmbeds.get("modules", itemObj.name, lambda: _moduleInfoEmbed(itemObj))
         # send the embed
         await message.channel.send(embed=statsEmbed)
 
 # botCommands.register("info-module", 0, cmd_module)
 
 
+def _turretInfoEmbed(itemObj : turretWeapon.TurretWeapon) -> discord.Embed:
+    """Build the embed describing a builtIn turret, as sent by cmd_info_turret.
+
+    :param TurretWeapon itemObj: The turret to describe
+    :return: A new embed describing itemObj
+    :rtype: discord.Embed
+    """
+    statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
+                                                if itemObj.manufacturer in bbData.factionColours \
+                                                else bbData.factionColours["neutral"],
+                                            desc="__Turret File__", titleTxt=itemObj.name,
+                                            thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
+    if itemObj.hasTechLevel:
+        statsEmbed.add_field(name="Tech Level:", value=itemObj.techLevel)
+    statsEmbed.add_field(name="Value:", value=str(itemObj.value))
+    statsEmbed.add_field(name="DPS:", value=str(itemObj.dps))
+    statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
+                                                                + str(itemObj.techLevel))
+    # include the item's aliases and wiki if they exist
+    if len(itemObj.aliases) > 1:
+        aliasStr = ""
+        for alias in itemObj.aliases:
+            aliasStr += alias + ", "
+        statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
+    if itemObj.hasWiki:
+        statsEmbed.add_field(name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+    return statsEmbed
+
+
 async def cmd_info_turret(message : discord.Message, args : str, isDM : bool):
     """return statistics about a specified inbuilt turret
 
@@ -435,39 +513,20 @@ async def cmd_info_turret(message : discord.Message, args : str, isDM : bool):
 
     # look up the turret object
     itemName = args.title()
-    itemObj = None
-    for turr in bbData.builtInTurretObjs.keys():
-        if bbData.builtInTurretObjs[turr].isCalled(itemName):
-            itemObj = bbData.builtInTurretObjs[turr]
+    itemObj = bbData.nameIndex.get("turrets", itemName)
 
     # report unrecognised turret names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("turrets", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("turrets", itemName))
 
     else:
-        # build the stats embed
-        statsEmbed = lib.discordUtil.makeEmbed(col=bbData.factionColours[itemObj.manufacturer] \
-                                                    if itemObj.manufacturer in bbData.factionColours \
-                                                    else bbData.factionColours["neutral"],
-                                                desc="__Turret File__", titleTxt=itemObj.name,
-                                                thumb=itemObj.icon if itemObj.hasIcon else bbData.rocketIcon)
-        if itemObj.hasTechLevel:
-            statsEmbed.add_field(name="Tech Level:", value=itemObj.techLevel)
-        statsEmbed.add_field(name="Value:", value=str(itemObj.value))
-        statsEmbed.add_field(name="DPS:", value=str(itemObj.dps))
-        statsEmbed.add_field(name="Max Shop Spawn Chance:", value=str(itemObj.shopSpawnRate) + "%\nFor shop level " \
-                                                                    + str(itemObj.techLevel))
-        # include the item's aliases and wiki if they exist
-        if len(itemObj.aliases) > 1:
-            aliasStr = ""
-            for alias in itemObj.aliases:
-                aliasStr += alias + ", "
-            statsEmbed.add_field(name="Aliases:", value=aliasStr[:-2], inline=False)
-        if itemObj.hasWiki:
-            statsEmbed.add_field(name="‎", value="[Wiki](" + itemObj.wiki + ")", inline=False)
+        # build the stats embed, or reuse the embed built when this turret was first looked up
+        statsEmbed = bbData.infoEmbeds.get("turrets", itemObj.name, lambda: _turretInfoEmbed(itemObj))
         # send the embed
         await message.channel.send(embed=statsEmbed)
 
@@ -496,17 +555,16 @@ async def cmd_info_commodity(message : discord.Message, args : str, isDM : bool)
 
     # look up the commodity object
     itemName = args.title()
-    itemObj = None
-    for crim in bbData.builtInCommodityObjs.keys():
-        if bbData.builtInCommodityObjs[crim].isCalled(itemName):
-            itemObj = bbData.builtInCommodityObjs[crim]
+    itemObj = bbData.nameIndex.get("commodities", itemName)
 
     # report unrecognised commodity names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("commodities", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("commodities", itemName))
 
     else:
         # build the stats embed
@@ -547,9 +605,11 @@ async def cmd_info_skin(message : discord.Message, args : str, isDM : bool):
     skin = args.lower()
     if skin not in bbData.builtInShipSkins:
         if len(skin) < 20:
-            await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+            await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("skins", skin))
         else:
-            await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+            await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("skins", skin))
     else:
         requestedSkin = bbData.builtInShipSkins[skin]
         # build the stats embed
@@ -635,16 +695,15 @@ async def cmd_showme_criminal(message : discord.Message, args : str, isDM : bool
         return
     # look up the criminal object
     criminalName = args.title()
-    criminalObj = None
-    for crim in bbData.builtInCriminalObjs.keys():
-        if bbData.builtInCriminalObjs[crim].isCalled(criminalName):
-            criminalObj = bbData.builtInCriminalObjs[crim]
+    criminalObj = bbData.nameIndex.get("criminals", criminalName)
     # report unrecognised criminal names
     if criminalObj is None:
         if len(criminalName) < 20:
-            await message.channel.send(":x: **" + criminalName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + criminalName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("criminals", criminalName))
         else:
-            await message.channel.send(":x: **" + criminalName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + criminalName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("criminals", criminalName))
     else:
         itemEmbed = lib.discordUtil.makeEmbed(col=discord.Colour.random(), img=criminalObj.icon,
                                                 titleTxt=criminalObj.name, footerTxt="Wanted criminal")
@@ -688,17 +747,15 @@ async def cmd_showme_ship(message : discord.Message, args : str, isDM : bool):
 
     # look up the ship object
     itemName = args.rstrip(" ").title()
-    itemObj = None
-    for ship in bbData.builtInShipData.values():
-        shipObj = shipItem.Ship.fromDict(ship)
-        if shipObj.isCalled(itemName):
-            itemObj = shipObj
+    itemObj = bbData.nameIndex.get("ships", itemName)
     # report unrecognised ship names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("ships", itemName))
         return
     if skin != "":
         shipData = bbData.builtInShipData[itemObj.name]
@@ -870,9 +927,11 @@ async def cmd_showme_ship(message : discord.Message, args : str, isDM : bool):
             skin = skin.lstrip(" ").lower()
             if skin not in bbData.builtInShipSkins:
                 if len(itemName) < 20:
-                    await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:")
+                    await message.channel.send(":x: The **" + skin + "** skin is not in my database! :detective:" \
+                                               + bbData.nameIndex.suggestionStr("skins", skin))
                 else:
-                    await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:")
+                    await message.channel.send(":x: The **" + skin[0:15] + "**... skin is not in my database! :detective:" \
+                                               + bbData.nameIndex.suggestionStr("skins", skin))
             elif skin not in bbData.builtInShipData[itemObj.name]["compatibleSkins"]:
                 await message.channel.send(":x: That skin is not compatible with the **" + itemObj.name + "**!")
 
@@ -910,16 +969,15 @@ async def cmd_showme_weapon(message : discord.Message, args : str, isDM : bool):
         return
     # look up the weapon object
     itemName = args.title()
-    itemObj = None
-    for weap in bbData.builtInWeaponObjs.keys():
-        if bbData.builtInWeaponObjs[weap].isCalled(itemName):
-            itemObj = bbData.builtInWeaponObjs[weap]
+    itemObj = bbData.nameIndex.get("weapons", itemName)
     # report unrecognised weapon names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("weapons", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("weapons", itemName))
     else:
         if not itemObj.hasIcon:
             await message.channel.send(":x: I don't have an icon for **" + itemObj.name.title() + "**!")
@@ -948,16 +1006,15 @@ async def cmd_showme_module(message : discord.Message, args : str, isDM : bool):
         return
     # look up the module object
     itemName = args.title()
-    itemObj = None
-    for module in bbData.builtInModuleObjs.keys():
-        if bbData.builtInModuleObjs[module].isCalled(itemName):
-            itemObj = bbData.builtInModuleObjs[module]
+    itemObj = bbData.nameIndex.get("modules", itemName)
     # report unrecognised module names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("modules", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("modules", itemName))
     else:
         if not itemObj.hasIcon:
             await message.channel.send(":x: I don't have an icon for **" + itemObj.name.title() + "**!")
@@ -985,16 +1042,15 @@ async def cmd_showme_turret(message : discord.Message, args : str, isDM : bool):
         return
     # look up the turret object
     itemName = args.title()
-    itemObj = None
-    for turr in bbData.builtInTurretObjs.keys():
-        if bbData.builtInTurretObjs[turr].isCalled(itemName):
-            itemObj = bbData.builtInTurretObjs[turr]
+    itemObj = bbData.nameIndex.get("turrets", itemName)
     # report unrecognised turret names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("turrets", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("turrets", itemName))
     else:
         if not itemObj.hasIcon:
             await message.channel.send(":x: I don't have an icon for **" + itemObj.name.title() + "**!")
@@ -1024,16 +1080,15 @@ async def cmd_showme_commodity(message : discord.Message, args : str, isDM : boo
         return
     # look up the commodity object
     itemName = args.title()
-    itemObj = None
-    for crim in bbData.builtInCommodityObjs.keys():
-        if bbData.builtInCommodityObjs[crim].isCalled(itemName):
-            itemObj = bbData.builtInCommodityObjs[crim]
+    itemObj = bbData.nameIndex.get("commodities", itemName)
     # report unrecognised commodity names
     if itemObj is None:
         if len(itemName) < 20:
-            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName + "** is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("commodities", itemName))
         else:
-            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:")
+            await message.channel.send(":x: **" + itemName[0:15] + "**... is not in my database! :detective:" \
+                                       + bbData.nameIndex.suggestionStr("commodities", itemName))
     else:
         if not itemObj.hasIcon:
             await message.channel.send(":x: I don't have an icon for **" + itemObj.name.title() + "**!")
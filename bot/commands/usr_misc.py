@@ -1,7 +1,6 @@
 import discord
 from datetime import datetime
 from aiohttp import client_exceptions
-import operator
 import traceback
 
 from . import commandsDB as botCommands
@@ -299,13 +298,13 @@ async def cmd_leaderboard(message : discord.Message, args : str, isDM : bool):
 
     boardDesc += ".*"
 
-    # get the requested stats and sort users by the stat
-    inputDict = {}
-    for user in botState.usersDB.getUsers():
-        if (globalBoard and botState.client.get_user(user.id) is not None) or \
-                (not globalBoard and message.guild.get_member(user.id) is not None):
-            inputDict[user.id] = user.getStatByName(stat)
-    sortedUsers = sorted(inputDict.items(), key=operator.itemgetter(1))[::-1]
+    # get the top 10 users by the requested stat from the leaderboard index
+    if globalBoard:
+        sortedUsers = botState.usersDB.leaderboards.top(stat, 10,
+                                                        userFilter=lambda userID: botState.client.get_user(userID) is not None)
+    else:
+        sortedUsers = botState.usersDB.leaderboards.top(stat, 10,
+                                                        userIDs=botState.guildMembership.membersOf(message.guild.id))
 
     # build the leaderboard embed
     leaderboardEmbed = lib.discordUtil.makeEmbed(titleTxt=boardTitle, authorName=boardScope,
@@ -54,7 +54,6 @@ async def util_autohelp(message: discord.Message, args: str, isDM: bool, userAcc
                                                     thumb=botState.client.user.avatar_url_as(size=64),
                                                     footerTxt="This menu will expire in " + helpMenuTimeoutStr + ".")
             sectionsStr = ""
-            pages = {indexEmbed: {}}
             for sectionNum in range(len(botCommands.helpSectionEmbeds[userAccessLevel])):
                 sectionsStr += "\n" + str(sectionNum + 1) + ") " \
                                 + list(botCommands.helpSectionEmbeds[userAccessLevel].keys())[sectionNum].title()
@@ -66,16 +65,21 @@ async def util_autohelp(message: discord.Message, args: str, isDM: bool, userAcc
                 #                     cfg.defaultEmojis.menuOptions[sectionNum + 1], addFunc=pagedReactionMenu.menuJumpToPage,
                 #                     addArgs={"menuID": menuMsg.id, "pageNum": sectionNum})
             indexEmbed.add_field(name="Contents", value=sectionsStr)
-            pageNum = 0
-            for helpSectionEmbedList in botCommands.helpSectionEmbeds[userAccessLevel].values():
-                for helpEmbed in helpSectionEmbedList:
-                    pageNum += 1
-                    newEmbed = helpEmbed.copy()
-                    newEmbed.set_footer(text="Page " + str(pageNum) + " of " + str(botCommands.totalEmbeds[userAccessLevel]) \
-                                            + " | This menu will expire in " + helpMenuTimeoutStr + ".")
-                    pages[newEmbed] = {}
+            helpEmbeds = [helpEmbed for helpSectionEmbedList in botCommands.helpSectionEmbeds[userAccessLevel].values()
+                            for helpEmbed in helpSectionEmbedList]
+
+            # Pages are only built when viewed, page 0 being the index
+            def makeHelpPage(pageNum):
+                if pageNum == 0:
+                    return indexEmbed, {}
+                newEmbed = helpEmbeds[pageNum - 1].copy()
+                newEmbed.set_footer(text="Page " + str(pageNum) + " of " + str(botCommands.totalEmbeds[userAccessLevel]) \
+                                        + " | This menu will expire in " + helpMenuTimeoutStr + ".")
+                return newEmbed, {}
+
             helpMenu = pagedReactionMenu.PagedReactionMenu(
-                menuMsg, pages, timeout=helpTT, targetMember=message.author, owningBasedUser=owningUser)
+                menuMsg, timeout=helpTT, targetMember=message.author, owningBasedUser=owningUser,
+                pageProvider=makeHelpPage, numPages=len(helpEmbeds) + 1)
             await helpMenu.updateMessage()
             botState.reactionMenusDB[menuMsg.id] = helpMenu
 
@@ -94,14 +98,17 @@ async def util_autohelp(message: discord.Message, args: str, isDM: bool, userAcc
                 helpTT = timedTask.TimedTask(expiryDelta=lib.timeUtil.timeDeltaFromDict(
                     cfg.timeouts.helpMenu), expiryFunction=expiryFunctions.expireHelpMenu, expiryFunctionArgs=menuMsg.id)
                 botState.taskScheduler.scheduleTask(helpTT)
-                pages = {}
-                for helpEmbed in botCommands.helpSectionEmbeds[userAccessLevel][args]:
-                    newEmbed = helpEmbed.copy()
-                    newEmbed.set_footer(text=helpEmbed.footer.text + " | This menu will expire in " \
+                helpEmbeds = botCommands.helpSectionEmbeds[userAccessLevel][args]
+
+                def makeSectionPage(pageNum):
+                    newEmbed = helpEmbeds[pageNum].copy()
+                    newEmbed.set_footer(text=helpEmbeds[pageNum].footer.text + " | This menu will expire in " \
                                         + helpMenuTimeoutStr + ".")
-                    pages[newEmbed] = {}
+                    return newEmbed, {}
+
                 helpMenu = pagedReactionMenu.PagedReactionMenu(
-                    menuMsg, pages, timeout=helpTT, targetMember=message.author, owningBasedUser=owningUser)
+                    menuMsg, timeout=helpTT, targetMember=message.author, owningBasedUser=owningUser,
+                    pageProvider=makeSectionPage, numPages=len(helpEmbeds))
                 await helpMenu.updateMessage()
                 botState.reactionMenusDB[menuMsg.id] = helpMenu
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from ..gameObjects.bounties import bounty
-from typing import List
+from typing import List, Tuple
 from ..baseClasses import serializable
 from ..cfg import cfg
 
@@ -20,6 +20,14 @@ class BountyDB(serializable.Serializable):
     :var latestBounty: The most recent bounty to be added to this db.As of writing,
                         this is only used when scaling new bounty delays by the most recent length
     :vartype latestBounty: gameObjects.bounties.bounty.Bounty
+    :var aliasIndex: Dictionary of lowercase criminal name or alias to the list of active bounties for criminals called
+                        that name, in the order that they were added. Used for constant time bounty lookups by name.
+    :vartype aliasIndex: dict[str, list[gameObjects.bounties.bounty.Bounty]]
+    :var factionNumBounties: Dictionary of faction name to the number of active bounties stored under that faction
+    :vartype factionNumBounties: dict[str, int]
+    :var systemIndex: Dictionary of system name to a list of (bounty, position) tuples, for every active bounty whose
+                        route passes through the system, where position is the index of the system in the bounty's route
+    :vartype systemIndex: dict[str, list[tuple[gameObjects.bounties.bounty.Bounty, int]]]
     """
 
     def __init__(self, factions: str):
@@ -30,11 +38,17 @@ class BountyDB(serializable.Serializable):
         # TODO: add criminal.__hash__, and change bountyDB.bounties into dict of faction:{criminal:bounty}
         self.bounties = {}
         self.escapedBounties = {}
+        # Lookup indices, kept in sync with self.bounties by addBounty, removeBountyObj and clearBounties
+        self.aliasIndex = {}
+        self.factionNumBounties = {}
+        self.systemIndex = {}
 
         # Useable faction names for this bountyDB
         self.factions = factions
         for fac in factions:
             self.bounties[fac] = []
+            self.escapedBounties[fac] = []
+            self.factionNumBounties[fac] = 0
 
         self.latestBounty = None
 
@@ -50,6 +64,8 @@ class BountyDB(serializable.Serializable):
             raise KeyError("Attempted to add a faction that already exists: " + faction)
         # Initialise faction's database to empty
         self.bounties[faction] = []
+        self.escapedBounties[faction] = []
+        self.factionNumBounties[faction] = 0
 
 
     def removeFaction(self, faction: str):
@@ -61,8 +77,12 @@ class BountyDB(serializable.Serializable):
         # Ensure the faction name exists
         if not self.factionExists(faction):
             raise KeyError("Unrecognised faction: " + faction)
+        # Remove the faction's bounties from the lookup indices
+        self.clearBounties(faction=faction)
         # Remove the faction name from the DB
         self.bounties.pop(faction)
+        self.escapedBounties.pop(faction)
+        self.factionNumBounties.pop(faction)
 
 
     def clearBounties(self, faction : str = None):
@@ -76,8 +96,12 @@ class BountyDB(serializable.Serializable):
             # Ensure the faction name exists
             if not self.factionExists(faction):
                 raise KeyError("Unrecognised faction: " + faction)
+            # Remove the faction's bounties from the lookup indices
+            for currentBounty in self.bounties[faction]:
+                self.unindexBounty(currentBounty)
             # Empty the faction's bounties
             self.bounties[faction] = []
+            self.factionNumBounties[faction] = 0
         # If no faction is given
         else:
             # clearBounties for each faction in the DB
@@ -127,12 +151,13 @@ class BountyDB(serializable.Serializable):
         :return: Integer number of bounties stored by a faction
         :rtype: int
         """
-        return len(self.bounties[faction])
+        return self.factionNumBounties[faction]
 
 
     def getBounty(self, name : str, faction : str = None) -> bounty.Bounty:
         """Get the bounty object for a given criminal name or alias.
-        This process is much more efficient when given the faction that the criminal is wanted by.
+        Lookups are made in constant time through the DB's alias index. If multiple active criminals share the
+        given alias, the earliest added bounty is returned.
 
         :param str name: A name or alias for the criminal whose bounty is to be fetched.
         :param str faction: The faction by which the criminal is wanted. Give None if this is not known,
@@ -143,26 +168,37 @@ class BountyDB(serializable.Serializable):
 
         :raise KeyError: If the requested criminal name does not exist in this DB
         """
-        # If the criminal's faction is known
-        if faction is not None:
-            # Search the given faction's bounties
-            for currentBounty in self.bounties[faction]:
-                # Return the named criminal's bounty if the name is found
-                if currentBounty.criminal.isCalled(name):
-                    return currentBounty
+        nameBounties = self.aliasIndex.get(name.lower(), [])
+        # If the criminal's faction is not known, return the first bounty called name
+        if faction is None:
+            if nameBounties:
+                return nameBounties[0]
 
-        # If the criminal's faction is not known, search all factions
+        # If the criminal's faction is known, only return bounties under that faction
         else:
-            for fac in self.getFactions():
-                # Return the named criminal's bounty if the name is found
-                for currentBounty in self.bounties[fac]:
-                    if currentBounty.criminal.isCalled(name):
-                        return currentBounty
+            # Preserve the KeyError for unknown factions
+            if faction not in self.bounties:
+                raise KeyError(faction)
+            for currentBounty in nameBounties:
+                if currentBounty.faction == faction:
+                    return currentBounty
 
         # The criminal was not recognised, raise an error
         raise KeyError("Bounty not found: " + name)
 
 
+    def getSystemBounties(self, system : str) -> List[Tuple[bounty.Bounty, int]]:
+        """Get all active bounties whose routes pass through the given system, along with the position of the system in
+        each bounty's route.
+
+        :param str system: The name of the system to look up. Case sensitive.
+        :return: A list of (bounty, position) tuples for each bounty passing through system. Empty if no bounties are found.
+                    ⚠ Muteable, and can alter the DB! Take a copy if removing bounties while iterating.
+        :rtype: list[tuple[gameObjects.bounties.bounty.Bounty, int]]
+        """
+        return self.systemIndex.get(system, [])
+
+
     def canMakeBounty(self) -> bounty.Bounty:
         """Check whether this DB has space for more bounties
 
@@ -192,7 +228,6 @@ class BountyDB(serializable.Serializable):
 
     def bountyNameExists(self, name : str, faction : str = None) -> bool:
         """Check whether a criminal with the given name or alias exists in the DB
-        The process is much more efficient if the faction where the criminal should reside is known.
 
         :param str name: The name or alias to check for criminal existence against
         :param str faction: The faction whose bounties to check for the named criminal.
@@ -234,6 +269,54 @@ class BountyDB(serializable.Serializable):
     """
 
 
+    def indexBounty(self, bounty : bounty.Bounty):
+        """Internal method registering a bounty's criminal name and aliases in the alias index, and the bounty's route
+        in the system index.
+        This does not add the bounty to the database; use addBounty for that.
+
+        :param bounty.Bounty bounty: the bounty to index
+        """
+        # Criminal.aliases always contains the criminal's lowercase name, but is not guaranteed to be unique
+        for alias in set(bounty.criminal.aliases + [bounty.criminal.name.lower()]):
+            if alias in self.aliasIndex:
+                self.aliasIndex[alias].append(bounty)
+            else:
+                self.aliasIndex[alias] = [bounty]
+
+        for system, position in bounty.routePositions.items():
+            if system in self.systemIndex:
+                self.systemIndex[system].append((bounty, position))
+            else:
+                self.systemIndex[system] = [(bounty, position)]
+
+
+    def unindexBounty(self, bounty : bounty.Bounty):
+        """Internal method removing a bounty from the alias and system indices.
+        This does not remove the bounty from the database; use removeBountyObj for that.
+
+        :param bounty.Bounty bounty: the bounty to remove from the index
+        """
+        for alias in set(bounty.criminal.aliases + [bounty.criminal.name.lower()]):
+            if alias in self.aliasIndex:
+                nameBounties = self.aliasIndex[alias]
+                for bountyIndex in range(len(nameBounties)):
+                    if nameBounties[bountyIndex] is bounty:
+                        nameBounties.pop(bountyIndex)
+                        break
+                if not nameBounties:
+                    del self.aliasIndex[alias]
+
+        for system in bounty.routePositions:
+            if system in self.systemIndex:
+                systemBounties = self.systemIndex[system]
+                for bountyIndex in range(len(systemBounties)):
+                    if systemBounties[bountyIndex][0] is bounty:
+                        systemBounties.pop(bountyIndex)
+                        break
+                if not systemBounties:
+                    del self.systemIndex[system]
+
+
     def addBounty(self, bounty : bounty.Bounty):
         """Add a given bounty object to the database.
         Bounties cannot be added if the bounty.faction does not have space for more bounties.
@@ -249,26 +332,49 @@ class BountyDB(serializable.Serializable):
 
         # ensure the given bounty does not already exist
         if self.bountyNameExists(bounty.criminal.name):
-            raise ValueError("Attempted to add a bounty whose name already exists: " + bounty.name)
+            raise ValueError("Attempted to add a bounty whose name already exists: " + bounty.criminal.name)
 
         # Add the bounty to the database
         self.bounties[bounty.faction].append(bounty)
+        self.factionNumBounties[bounty.faction] += 1
+        self.indexBounty(bounty)
         self.latestBounty = bounty
 
 
     def addEscapedBounty(self, bounty : bounty.Bounty):
         """Add a given bounty object to the escaped bounties database.
-        Bounties cannot be added if the object or name already exists in the database.
+        Bounties cannot be added if the name already exists in the escaped bounties database.
+        Escaped criminals may be wanted again in new active bounties, so active bounties are not checked.
+        At most cfg.maxEscapedBountiesPerFaction escaped bounties are retained per faction, discarding the oldest first.
 
         :param bounty.Bounty bounty: the bounty object to add to the database
-        :raise ValueError: if the requested bounty's name already exists in the database
+        :raise ValueError: if the requested bounty's name already exists in the escaped bounties database
         """
         # ensure the given bounty does not already exist
-        if self.bountyNameExists(bounty.criminal.name) or bounty.criminal.name in self.escapedBounties[bounty.faction]:
-            raise ValueError("Attempted to add a bounty whose name already exists: " + bounty.name)
+        if any(escaped.criminal.isCalled(bounty.criminal.name) for escaped in self.escapedBounties[bounty.faction]):
+            raise ValueError("Attempted to add a bounty whose name already exists: " + bounty.criminal.name)
 
         # Add the bounty to the database
         self.escapedBounties[bounty.faction].append(bounty)
+        # Discard the oldest escaped bounties over the retention limit
+        if len(self.escapedBounties[bounty.faction]) > cfg.maxEscapedBountiesPerFaction:
+            del self.escapedBounties[bounty.faction][:-cfg.maxEscapedBountiesPerFaction]
+
+
+    def escapeBounty(self, bounty : bounty.Bounty):
+        """Move an active bounty into the escaped bounties database, freeing up its faction's slot for a new bounty.
+        If the same criminal has escaped previously, the older escaped bounty is discarded.
+
+        :param bounty.Bounty bounty: the active bounty to mark as escaped
+        :raise ValueError: if the given bounty is not active in this database
+        """
+        if not self.bountyObjExists(bounty):
+            raise ValueError("Attempted to escape a bounty that is not active: " + bounty.criminal.name)
+        self.removeBountyObj(bounty)
+        # Only the most recent escape of each criminal is kept
+        self.escapedBounties[bounty.faction] = [escaped for escaped in self.escapedBounties[bounty.faction]
+                                                if not escaped.criminal.isCalled(bounty.criminal.name)]
+        self.addEscapedBounty(bounty)
 
 
     def removeBountyName(self, name : str, faction : str = None):
@@ -290,6 +396,8 @@ class BountyDB(serializable.Serializable):
         if bounty is self.latestBounty:
             self.latestBounty = None
         self.bounties[bounty.faction].remove(bounty)
+        self.factionNumBounties[bounty.faction] -= 1
+        self.unindexBounty(bounty)
 
 
     def hasBounties(self, faction : str = None) -> bool:
@@ -363,7 +471,7 @@ class BountyDB(serializable.Serializable):
         activeBountiesData = bountyDBDict["active"] if "active" in bountyDBDict else {}
 
         # Instanciate a new bountyDB
-        newDB = BountyDB(activeBountiesData.keys())
+        newDB = BountyDB(list(activeBountiesData.keys()))
         # Iterate over all factions in the DB
         for fac in activeBountiesData.keys():
             # Convert each serialised bounty into a bounty object
@@ -1,4 +1,17 @@
-from .. import botState
+# Typing imports
+from __future__ import annotations
+from typing import Tuple, Union, Dict
+
+import asyncio
+import traceback
+
+from discord import TextChannel, HTTPException, NotFound, Forbidden
+
+from .. import botState, lib
+from ..cfg import cfg
+from ..reactionMenus import reactionMenu
+# Import all saveable menu types, so that they are registered in reactionMenu.saveableMenuTypes
+from ..reactionMenus import reactionPollMenu, reactionRolePicker # noqa: F401
 
 # ReactionMenu subclasses that cannot be saved to dictionary
 # TODO: change to a class-variable reference e.g type(menu).SAVEABLE
@@ -6,8 +19,134 @@ unsaveableMenuTypes = ["ReactionDuelChallengeMenu"]
 
 
 class ReactionMenuDB(dict):
-    """A database of ReactionMenu instances.
-    Currently just an extension of dict to add toDict()."""
+    """A database of ReactionMenu instances, by menu message ID.
+    Menus are kept in least recently used order: menus move to the end when added, or when touch is called on a reaction.
+    When the database holds more than maxSize menus, the least recently used menus are evicted by running their expiry
+    functions, as if they had timed out.
+
+    :var maxSize: The maximum number of menus to hold before evicting menus
+    :vartype maxSize: int
+    :var evicting: The IDs of menus currently being evicted
+    :vartype evicting: set[int]
+    """
+
+    def __init__(self, maxSize : int = None):
+        """
+        :param int maxSize: The maximum number of menus to hold before evicting menus.
+                            Give None to use cfg.reactionMenuDBMaxSize. (Default None)
+        """
+        super().__init__()
+        self.maxSize = maxSize if maxSize is not None else cfg.reactionMenuDBMaxSize
+        self.evicting = set()
+
+
+    def __setitem__(self, msgID : int, menu : reactionMenu.ReactionMenu):
+        """Add a menu to the database as the most recently used menu, evicting the least recently used menus if the
+        database is over capacity.
+
+        :param int msgID: The ID of the menu's message
+        :param ReactionMenu menu: The menu to add
+        """
+        if msgID in self:
+            super().__delitem__(msgID)
+        super().__setitem__(msgID, menu)
+        if len(self) - len(self.evicting) > self.maxSize:
+            self.evictIdleMenus()
+
+
+    def touch(self, msgID : int):
+        """Mark a menu as the most recently used menu, e.g when it is reacted to.
+
+        :param int msgID: The ID of the menu's message
+        """
+        super().__setitem__(msgID, super().pop(msgID))
+
+
+    def evictIdleMenus(self):
+        """Schedule the eviction of least recently used menus until the database is within maxSize.
+        Menus already being evicted are not counted.
+        """
+        numToEvict = len(self) - len(self.evicting) - self.maxSize
+        for msgID in list(self.keys()):
+            if numToEvict <= 0:
+                break
+            if msgID not in self.evicting:
+                self.evicting.add(msgID)
+                asyncio.create_task(self.expireMenu(msgID, "EVICT"))
+                numToEvict -= 1
+
+
+    async def expireMenu(self, msgID : int, reason : str):
+        """Run a menu's expiry function, and ensure that the menu is removed from the database
+        even if the expiry function fails.
+
+        :param int msgID: The ID of the menu's message
+        :param str reason: A short code describing why the menu is being expired, for logging
+        """
+        if msgID not in self:
+            self.evicting.discard(msgID)
+            return
+        menu = self[msgID]
+        try:
+            await menu.delete()
+        except Exception as e:
+            botState.logger.log("reactionMenuDB", "expireMenu", type(e).__name__ + " when expiring " + type(menu).__name__ \
+                                + " #" + str(msgID) + " (" + reason + ")", category="reactionMenus",
+                                eventType=reason + "-ERR", trace=traceback.format_exc())
+            # Prevent the menu's TimedTask from expiring the now removed menu again
+            if menu.timeout is not None:
+                menu.timeout.gravestone = True
+        finally:
+            self.evicting.discard(msgID)
+        if msgID in self:
+            del self[msgID]
+
+
+    async def sweepDeletedMenus(self) -> int:
+        """Expire all menus whose messages no longer exist or can no longer be seen, e.g because they were deleted
+        while the bot was offline. Messages are fetched at most cfg.reactionMenuSweepMaxConcurrent at once.
+
+        :return: The number of menus expired
+        :rtype: int
+        """
+        fetchSlots = asyncio.Semaphore(cfg.reactionMenuSweepMaxConcurrent)
+
+        async def menuIsGone(menu):
+            try:
+                async with fetchSlots:
+                    await lib.httpRetry.retryHTTP(lambda: menu.msg.channel.fetch_message(menu.msg.id), menu.msg.channel.id)
+            except (NotFound, Forbidden):
+                return True
+            except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                pass
+            return False
+
+        menus = [menu for msgID, menu in self.items() if msgID not in self.evicting]
+        goneMenus = [menu for menu, isGone in zip(menus, await asyncio.gather(*(menuIsGone(menu) for menu in menus)))
+                        if isGone]
+        for menu in goneMenus:
+            if menu.msg.id in self and menu.msg.id not in self.evicting:
+                await self.expireMenu(menu.msg.id, "SWEEP")
+
+        if goneMenus:
+            botState.logger.log("reactionMenuDB", "sweepDeletedMenus", "Expired " + str(len(goneMenus)) + "/" \
+                                + str(len(menus)) + " reaction menus with missing messages", category="reactionMenus",
+                                eventType="SWEEP", noPrint=True)
+        return len(goneMenus)
+
+
+    def countByType(self) -> Dict[str, int]:
+        """Count the menus in the database of each ReactionMenu type.
+
+        :return: The number of menus of each type, by type name
+        :rtype: dict[str, int]
+        """
+        counts = {}
+        for menu in self.values():
+            menuType = type(menu).__name__
+            counts[menuType] = counts.get(menuType, 0) + 1
+        return counts
+
 
     def toDict(self, **kwargs) -> dict:
         """Serialise all saveable ReactionMenus in this DB into a single dictionary.
@@ -23,9 +162,42 @@ class ReactionMenuDB(dict):
         return data
 
 
+async def restoreMenu(menuDict : dict, channel : TextChannel, fetchSlots : asyncio.Semaphore) \
+        -> Tuple[Union[reactionMenu.ReactionMenu, None], str]:
+    """Fetch the message of a saved ReactionMenu, and reconstruct the menu with its type's fromDict.
+
+    :param dict menuDict: The dictionary-serialized menu to restore
+    :param discord.TextChannel channel: The channel containing the menu's message
+    :param asyncio.Semaphore fetchSlots: Semaphore limiting the number of messages fetched at once
+    :return: The restored menu, or None if the menu could not be restored, and a description of the outcome;
+            one of "restored", "deleted" or "failed"
+    :rtype: tuple[ReactionMenu or None, str]
+    """
+    try:
+        async with fetchSlots:
+            msg = await lib.httpRetry.retryHTTP(lambda: channel.fetch_message(menuDict["msg"]), channel.id)
+    except NotFound:
+        return None, "deleted"
+    except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+        botState.logger.log("reactionMenuDB", "restoreMenu", "HTTPException thrown when fetching menu message #" \
+                            + str(menuDict["msg"]), category="reactionMenus", eventType="RESTORE-HTTPERR")
+        return None, "failed"
+
+    try:
+        return reactionMenu.saveableMenuTypes[menuDict["type"]].fromDict(menuDict, msg=msg), "restored"
+    except Exception as e:
+        botState.logger.log("reactionMenuDB", "restoreMenu", "Unexpected " + type(e).__name__ + " when restoring " \
+                            + menuDict["type"] + " #" + str(menuDict["msg"]), category="reactionMenus",
+                            eventType="RESTORE-UNKWNERR", trace=traceback.format_exc())
+        return None, "failed"
+
+
 async def fromDict(dbDict: dict) -> ReactionMenuDB:
     """Factory function constructing a new ReactionMenuDB from dictionary-serialized format;
     the opposite of ReactionMenuDB.toDict
+    Menus whose type is not registered as saveable or whose channel no longer exists are dropped without any requests.
+    The remaining menus' messages are fetched concurrently, at most cfg.reactionMenuRestoreMaxConcurrent at once,
+    and each menu is reconstructed by its type's fromDict. Menus whose messages no longer exist are dropped.
 
     :param dict dbDict: A dictionary containing all info needed to reconstruct a ReactionMenuDB,
                         in accordance with ReactionMenuDB.toDict
@@ -33,17 +205,28 @@ async def fromDict(dbDict: dict) -> ReactionMenuDB:
     :rtype: ReactionMenuDB
     """
     newDB = ReactionMenuDB()
+    outcomes = {"restored": 0, "unknown type": 0, "channel gone": 0, "deleted": 0, "failed": 0}
 
-    for msgID in dbDict:
-        dcGuild = botState.client.get_guild(dbDict[msgID]["guild"])
-        msg = await dcGuild.get_channel(dbDict[msgID]["channel"]).fetch_message(dbDict[msgID]["msg"])
-
-        if botState.client.get_channel(dbDict[msgID]["channel"]) is None:
+    toRestore = []
+    for menuDict in dbDict.values():
+        if menuDict.get("type") not in reactionMenu.saveableMenuTypes:
+            outcomes["unknown type"] += 1
             continue
-        if "type" in dbDict[msgID]:
-            # if dbDict[msgID]["type"] == "ReactionInventoryPicker":
-            #     # newDB[int(msgID)] = ReactionInventoryPicker.fromDict(dbDict[msgID], msg=msg)
-            #     continue
+        channel = botState.client.get_channel(menuDict["channel"])
+        if channel is None:
+            outcomes["channel gone"] += 1
             continue
+        toRestore.append((menuDict, channel))
+
+    fetchSlots = asyncio.Semaphore(cfg.reactionMenuRestoreMaxConcurrent)
+    for menu, outcome in await asyncio.gather(*(restoreMenu(menuDict, channel, fetchSlots) \
+                                                    for menuDict, channel in toRestore)):
+        outcomes[outcome] += 1
+        if menu is not None:
+            newDB[menu.msg.id] = menu
 
+    botState.logger.log("reactionMenuDB", "fromDict", "Restored " + str(outcomes["restored"]) + "/" + str(len(dbDict)) \
+                        + " reaction menus. Dropped: " + ", ".join(str(outcomes[outcome]) + " " + outcome \
+                            for outcome in outcomes if outcome != "restored"),
+                        category="reactionMenus", eventType="RESTORE", noPrint=True)
     return newDB
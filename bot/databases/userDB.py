@@ -1,5 +1,6 @@
 from __future__ import annotations
-from ..users.basedUser import BasedUser
+from ..users.basedUser import BasedUser, defaultUserDict
+from ..users import leaderboards, userStats
 from .. import lib
 from .. import botState
 import traceback
@@ -13,11 +14,17 @@ class UserDB(serializable.Serializable):
     :var users: Dictionary of users in the database, where values are the BasedUser objects and keys are the ids
                 of their respective BasedUser
     :vartype users: dict[int, BasedUser]
+    :var leaderboards: Rankings of the users in the database by each leaderboard stat
+    :vartype leaderboards: leaderboards.Leaderboards
+    :var statsStore: The stats of the users in the database, stored in columns for economy-wide aggregates
+    :vartype statsStore: userStats.UserStatsStore
     """
 
     def __init__(self):
         # Store users as a dict of user.id: user
         self.users = {}
+        self.leaderboards = leaderboards.Leaderboards()
+        self.statsStore = userStats.UserStatsStore()
 
 
     def idExists(self, userID: int) -> bool:
@@ -89,8 +96,10 @@ class UserDB(serializable.Serializable):
         if self.idExists(userID):
             raise KeyError("Attempted to add a user that is already in this UserDB")
         # Create and return a new user
-        newUser = BasedUser.fromDict(BasedUser.defaultUserDict, id=id)
+        newUser = BasedUser.fromDict(defaultUserDict, id=userID)
         self.users[userID] = newUser
+        self.statsStore.addUser(newUser)
+        self.leaderboards.addUser(newUser)
         return newUser
 
 
@@ -105,6 +114,23 @@ class UserDB(serializable.Serializable):
             raise KeyError("Attempted to add a user that is already in this UserDB: " + str(userObj))
         # Store the passed BasedUser
         self.users[userObj.id] = userObj
+        self.statsStore.addUser(userObj)
+        self.leaderboards.addUser(userObj)
+
+
+    def addUsers(self, userObjs: List[BasedUser]):
+        """Store many BasedUser objects in the database at once, e.g when loading the database.
+        This is faster than calling addUser for each user, as the leaderboards are only sorted once.
+
+        :param list[BasedUser] userObjs: BasedUsers to store
+        :raise KeyError: If a BasedUser already exists in the database with the same ID as one of the given BasedUsers
+        """
+        for userObj in userObjs:
+            if self.idExists(userObj.id):
+                raise KeyError("Attempted to add a user that is already in this UserDB: " + str(userObj))
+            self.users[userObj.id] = userObj
+            self.statsStore.addUser(userObj)
+        self.leaderboards.addUsers(userObjs, self.statsStore)
 
 
     def getOrAddID(self, userID: int) -> BasedUser:
@@ -128,6 +154,8 @@ class UserDB(serializable.Serializable):
         userID = self.validateID(userID)
         if not self.idExists(userID):
             raise KeyError("user not found: " + str(userID))
+        self.leaderboards.removeUser(userID)
+        self.statsStore.removeUser(userID)
         del self.users[userID]
 
 
@@ -199,9 +227,7 @@ class UserDB(serializable.Serializable):
         """
         # Instance the new UserDB
         newDB = UserDB()
-        # iterate over all user IDs to spawn
-        for userID in userDBDict.keys():
-            # Construct new BasedUsers for each ID in the database
-            # JSON stores properties as strings, so ids must be converted to int first.
-            newDB.addUser(BasedUser.fromDict(userDBDict[userID], id=int(userID)))
+        # Construct new BasedUsers for each ID in the database, and add them all at once
+        # JSON stores properties as strings, so ids must be converted to int first.
+        newDB.addUsers([BasedUser.fromDict(userDBDict[userID], id=int(userID)) for userID in userDBDict.keys()])
         return newDB
@@ -3,6 +3,7 @@ from ...cfg import cfg
 from discord import Embed, User, Message
 from ...users import basedUser
 from ...scheduling import timedTask
+from ...scheduling.messageQueue import MessagePriority
 from ...users import basedGuild
 from ..items import shipItem
 import random
@@ -205,19 +206,22 @@ async def fightDuel(sourceUser : User, targetUser : User, duelReq : DuelRequest,
     #                     (sourceBasedUser if winningBasedUser is targetBasedUser else targetBasedUser)
 
     if winningBasedUser is None:
-        await acceptMsg.channel.send(":crossed_swords: **Stalemate!** " \
-                                        + str(targetUser) + " and " + sourceUser.mention + " drew in a duel!")
+        botState.messageQueue.post(acceptMsg.channel, ":crossed_swords: **Stalemate!** " \
+                                   + str(targetUser) + " and " + sourceUser.mention + " drew in a duel!",
+                                   priority=MessagePriority.reply)
         if acceptMsg.guild.get_member(targetUser.id) is None:
             targetDCGuild = lib.discordUtil.findBasedUserDCGuild(targetBasedUser)
             if targetDCGuild is not None:
                 targetBasedGuild = botState.guildsDB.getGuild(targetDCGuild.id)
                 if targetBasedGuild.hasPlayChannel():
-                    await targetBasedGuild.getPlayChannel().send(":crossed_swords: **Stalemate!** " \
-                                                                    + targetDCGuild.get_member(targetUser.id).mention \
-                                                                    + " and " + str(sourceUser) + " drew in a duel!")
+                    botState.messageQueue.post(targetBasedGuild.getPlayChannel(),
+                                               ":crossed_swords: **Stalemate!** " \
+                                               + targetDCGuild.get_member(targetUser.id).mention \
+                                               + " and " + str(sourceUser) + " drew in a duel!")
         else:
-            await acceptMsg.channel.send(":crossed_swords: **Stalemate!** " + targetUser.mention + " and " \
-                                            + sourceUser.mention + " drew in a duel!")
+            botState.messageQueue.post(acceptMsg.channel, ":crossed_swords: **Stalemate!** " + targetUser.mention \
+                                       + " and " + sourceUser.mention + " drew in a duel!",
+                                       priority=MessagePriority.reply)
     else:
         winningBasedUser.duelWins += 1
         losingBasedUser.duelLosses += 1
@@ -239,38 +243,40 @@ async def fightDuel(sourceUser : User, targetUser : User, duelReq : DuelRequest,
         statsEmbed = makeDuelStatsEmbed(duelResults, sourceUser, targetUser)
 
         if acceptMsg.guild.get_member(winningBasedUser.id) is None:
-            await acceptMsg.channel.send(":crossed_swords: **Fight!** " + str(botState.client.get_user(winningBasedUser.id)) \
-                                            + " beat " + botState.client.get_user(losingBasedUser.id).mention \
-                                            + " in a duel!\n" + creditsMsg, embed=statsEmbed)
+            botState.messageQueue.post(acceptMsg.channel, ":crossed_swords: **Fight!** " \
+                                       + str(botState.client.get_user(winningBasedUser.id)) \
+                                       + " beat " + botState.client.get_user(losingBasedUser.id).mention \
+                                       + " in a duel!\n" + creditsMsg, embed=statsEmbed,
+                                       priority=MessagePriority.reply)
             winnerDCGuild = lib.discordUtil.findBasedUserDCGuild(winningBasedUser)
             if winnerDCGuild is not None:
                 winnerBasedGuild = botState.guildsDB.getGuild(winnerDCGuild.id)
                 if winnerBasedGuild.hasPlayChannel():
-                    await winnerBasedGuild.getPlayChannel().send(":crossed_swords: **Fight!** " \
-                                                                    + winnerDCGuild.get_member(winningBasedUser.id).mention \
-                                                                    + " beat " \
-                                                                    + str(botState.client.get_user(losingBasedUser.id)) \
-                                                                    + " in a duel!\n" + creditsMsg, embed=statsEmbed)
+                    botState.messageQueue.post(winnerBasedGuild.getPlayChannel(), ":crossed_swords: **Fight!** " \
+                                               + winnerDCGuild.get_member(winningBasedUser.id).mention \
+                                               + " beat " \
+                                               + str(botState.client.get_user(losingBasedUser.id)) \
+                                               + " in a duel!\n" + creditsMsg, embed=statsEmbed)
         else:
             if acceptMsg.guild.get_member(losingBasedUser.id) is None:
-                await acceptMsg.channel.send(":crossed_swords: **Fight!** " \
-                                                + botState.client.get_user(winningBasedUser.id).mention + " beat " \
-                                                + str(botState.client.get_user(losingBasedUser.id)) + " in a duel!\n" \
-                                                    + creditsMsg, embed=statsEmbed)
+                botState.messageQueue.post(acceptMsg.channel, ":crossed_swords: **Fight!** " \
+                                           + botState.client.get_user(winningBasedUser.id).mention + " beat " \
+                                           + str(botState.client.get_user(losingBasedUser.id)) + " in a duel!\n" \
+                                           + creditsMsg, embed=statsEmbed, priority=MessagePriority.reply)
                 loserDCGuild = lib.discordUtil.findBasedUserDCGuild(losingBasedUser)
                 if loserDCGuild is not None:
                     loserBasedGuild = botState.guildsDB.getGuild(loserDCGuild.id)
                     if loserBasedGuild.hasPlayChannel():
-                        await loserBasedGuild.getPlayChannel().send(":crossed_swords: **Fight!** " \
-                                                                    + str(botState.client.get_user(winningBasedUser.id)) \
-                                                                    + " beat " \
-                                                                    + loserDCGuild.get_member(losingBasedUser.id).mention \
-                                                                    + " in a duel!\n" + creditsMsg, embed=statsEmbed)
+                        botState.messageQueue.post(loserBasedGuild.getPlayChannel(), ":crossed_swords: **Fight!** " \
+                                                   + str(botState.client.get_user(winningBasedUser.id)) \
+                                                   + " beat " \
+                                                   + loserDCGuild.get_member(losingBasedUser.id).mention \
+                                                   + " in a duel!\n" + creditsMsg, embed=statsEmbed)
             else:
-                await acceptMsg.channel.send(":crossed_swords: **Fight!** " \
-                                                + botState.client.get_user(winningBasedUser.id).mention + " beat " \
-                                                + botState.client.get_user(losingBasedUser.id).mention + " in a duel!\n" \
-                                                + creditsMsg, embed=statsEmbed)
+                botState.messageQueue.post(acceptMsg.channel, ":crossed_swords: **Fight!** " \
+                                           + botState.client.get_user(winningBasedUser.id).mention + " beat " \
+                                           + botState.client.get_user(losingBasedUser.id).mention + " in a duel!\n" \
+                                           + creditsMsg, embed=statsEmbed, priority=MessagePriority.reply)
 
     await targetBasedUser.duelRequests[sourceBasedUser].duelTimeoutTask.forceExpire(callExpiryFunc=False)
     targetBasedUser.removeDuelChallengeObj(duelReq)
@@ -30,7 +30,13 @@ class Bounty(serializable.Serializable):
     :vartype checked: dict[str, int]
     :var answer: The name of the system where the criminal is located
     :vartype answer: str
+    :var routePositions: A dictionary mapping the name of each system in the route to its index in the route
+    :vartype routePositions: dict[str, int]
+    :var answerPosition: The index of answer in the route
+    :vartype answerPosition: int
     """
+    __slots__ = ("criminal", "faction", "issueTime", "endTime", "route", "reward", "checked", "answer", "routePositions",
+                    "answerPosition")
 
     def __init__(self, criminalObj : criminal = None, config : bountyConfig.BountyConfig = None,
                     owningDB : bountyDB.BountyDB = None, dbReload : bool = False):
@@ -81,6 +87,14 @@ class Bounty(serializable.Serializable):
         self.checked = config.checked
         self.answer = config.answer
 
+        # Record the position of each system in the route, for constant time membership and distance checking.
+        # Systems are recorded at their first position in the route, matching list.index.
+        self.routePositions = {}
+        for position in range(len(self.route)):
+            if self.route[position] not in self.routePositions:
+                self.routePositions[self.route[position]] = position
+        self.answerPosition = self.routePositions[self.answer]
+
 
     def check(self, system : str, userID : int) -> int:
         """Check a system along the route. The integer returned by this method indicates the results of the check:
@@ -94,7 +108,7 @@ class Bounty(serializable.Serializable):
         :return: A symbollic integer representing the result of the check, as defined above
         :rtype: int
         """
-        if system not in self.route:
+        if system not in self.routePositions:
             return 0
         elif self.systemChecked(system):
             return 1
@@ -115,6 +129,18 @@ class Bounty(serializable.Serializable):
         return self.checked[system] != -1
 
 
+    def distanceToAnswer(self, system : str) -> int:
+        """Get the number of systems along the route from the given system to the answer.
+        This is negative if the answer is earlier in the route than system.
+
+        :param str system: The name of the system in the route to measure from
+        :return: The index of the answer in the route, minus the index of system in the route
+        :rtype: int
+        :raise KeyError: If system is not in the route
+        """
+        return self.answerPosition - self.routePositions[system]
+
+
     def calcRewards(self) -> Dict[int, Dict[str, Union[int, bool]]]:
         """Calculate the winning user and how many credits (and in the future, xp points) to award to which contributing users
 
@@ -124,22 +150,24 @@ class Bounty(serializable.Serializable):
         """
         rewards = {}
         checkedSystems = 0
+        systemReward = int(self.reward / len(self.route))
+        # Tally checked systems and rewards in a single pass over the route
         for system in self.route:
-            if self.systemChecked(system):
+            checkingUser = self.checked[system]
+            if checkingUser != -1:
                 checkedSystems += 1
-                if self.checked[system] not in rewards:
-                    rewards[self.checked[system]] = {"reward": 0, "checked": 0, "won": False}
-
-        uncheckedSystems = len(self.route) - checkedSystems
-
-        for system in self.route:
-            if self.systemChecked(system):
-                rewards[self.checked[system]]["checked"] += 1
-                if self.answer == system:
-                    rewards[self.checked[system]]["reward"] += int(self.reward / len(self.route)) * (uncheckedSystems + 1)
-                    rewards[self.checked[system]]["won"] = True
+                if checkingUser not in rewards:
+                    rewards[checkingUser] = {"reward": 0, "checked": 1, "won": False}
                 else:
-                    rewards[self.checked[system]]["reward"] += int(self.reward / len(self.route))
+                    rewards[checkingUser]["checked"] += 1
+                if self.answer != system:
+                    rewards[checkingUser]["reward"] += systemReward
+
+        # The winner's share depends on the number of unchecked systems, so must be awarded after tallying
+        winningUser = self.checked[self.answer]
+        if winningUser != -1:
+            rewards[winningUser]["reward"] += systemReward * (len(self.route) - checkedSystems + 1)
+            rewards[winningUser]["won"] = True
         return rewards
 
 
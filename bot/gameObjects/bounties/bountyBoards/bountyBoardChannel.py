@@ -1,13 +1,15 @@
 from __future__ import annotations
 import discord
-from discord import Embed, HTTPException, Forbidden, NotFound, Client, Message
+from discord import Embed, HTTPException, Forbidden, NotFound, Client, Message, Object
 from ....cfg import bbData, cfg
 from .... import lib
 from .. import criminal
 from ....botState import logger
 import asyncio
+import time
+import traceback
 from .. import bounty
-from typing import Dict, Union, List
+from typing import Dict, Union, List, Tuple
 from ....baseClasses import serializable
 
 
@@ -28,7 +30,7 @@ def makeBountyEmbed(bounty : bounty.Bounty) -> Embed:
     for system in bounty.route:
         if bounty.systemChecked(system):
             routeStr += "~~"
-            if 0 < bounty.route.index(bounty.answer) - bounty.route.index(system) < cfg.closeBountyThreshold:
+            if 0 < bounty.distanceToAnswer(system) < cfg.closeBountyThreshold:
                 routeStr += "**" + system + "**"
             else:
                 routeStr += system
@@ -76,6 +78,13 @@ class bountyBoardChannel(serializable.Serializable):
     :vartype noBountiesMessage: discord.message or None
     :var channel: The channel where this BBC's listings are to be posted
     :vartype channel: discord.TextChannel
+    :var pendingEdits: A dictionary of criminals to the bounties whose listings are awaiting an edit. Listings are edited
+                        from the bounty's state at flush time, so intermediate states between flushes are never sent.
+    :vartype pendingEdits: dict[criminal, bounty.Bounty]
+    :var flushTask: The task waiting to apply pendingEdits, or None if no flush is scheduled
+    :vartype flushTask: asyncio.Task or None
+    :var lastFlushTime: The time.monotonic time at which pendingEdits were last flushed
+    :vartype lastFlushTime: float
     """
 
     def __init__(self, channelIDToBeLoaded : int, messagesToBeLoaded : Dict[int, dict],
@@ -99,10 +108,41 @@ class bountyBoardChannel(serializable.Serializable):
         # discord channel object
         self.channel = None
 
+        # Coalesced listing edits, flushed at most once every cfg.bbcEditIntervalSeconds
+        self.pendingEdits = {}
+        self.flushTask = None
+        self.lastFlushTime = 0.0
+
+
+    async def sweepHistory(self, messageIDs : List[int]) -> Tuple[Dict[int, Message], bool]:
+        """Fetch many messages from this BBC's channel with a single sweep of the channel's history,
+        rather than one request per message. The sweep reads forwards from the oldest requested message,
+        and reads at most cfg.bbcHistorySweepLimit messages.
+
+        :param list[int] messageIDs: The IDs of the messages to fetch
+        :return: A dictionary of the found messages by ID, and whether the sweep read the entire channel history after the
+                oldest requested message. If it did, requested messages missing from the dictionary no longer exist.
+        :rtype: tuple[dict[int, discord.Message], bool]
+        :raise discord.HTTPException: If reading the channel history failed
+        """
+        wanted = set(messageIDs)
+        found = {}
+        numRead = 0
+        async for msg in self.channel.history(limit=cfg.bbcHistorySweepLimit, after=Object(id=min(wanted) - 1),
+                                                oldest_first=True):
+            numRead += 1
+            if msg.id in wanted:
+                found[msg.id] = msg
+                if len(found) == len(wanted):
+                    return found, True
+        return found, numRead < cfg.bbcHistorySweepLimit
+
 
     async def init(self, client : Client, factions : List[str]):
         """Initialise the BBC's attributes to allow it to function.
         Initialisation is done here rather than in the constructor as initialisation can only be done asynchronously.
+        If the BBC has at least cfg.bbcHistorySweepThreshold messages to load, they are found with a single sweep of the
+        channel history. Otherwise, or if the sweep fails, each message is fetched individually.
 
         :param discord.Client client: A logged in client instance used to fetch the BBC's message and channel instances
         :param list[str] factions: A list of faction names with which bounties can be associated
@@ -112,75 +152,71 @@ class bountyBoardChannel(serializable.Serializable):
 
         self.channel = client.get_channel(self.channelIDToBeLoaded)
 
+        # Message IDs are stored as strings when saved to JSON
+        toLoad = [int(id) for id in self.messagesToBeLoaded]
+        if self.noBountiesMsgToBeLoaded != -1:
+            toLoad.append(int(self.noBountiesMsgToBeLoaded))
+        sweptMessages, sweepComplete = {}, False
+        if toLoad and len(toLoad) >= cfg.bbcHistorySweepThreshold:
+            try:
+                sweptMessages, sweepComplete = await lib.httpRetry.retryHTTP(lambda: self.sweepHistory(toLoad),
+                                                                                self.channel.id)
+            except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                logger.log("BBC", "init", "HTTPException thrown when sweeping channel history, fetching " \
+                            + str(len(toLoad)) + " messages individually", category='bountyBoards',
+                            eventType="LISTING_SWEEP-HTTPERR")
+
         for id in self.messagesToBeLoaded:
             crim = criminal.Criminal.fromDict(self.messagesToBeLoaded[id])
 
+            if int(id) in sweptMessages:
+                self.bountyMessages[crim.faction][crim] = sweptMessages[int(id)]
+                continue
+            elif sweepComplete:
+                logger.log("BBC", "init", "Listing message for criminal no longer exists: " + crim.name,
+                            category='bountyBoards', eventType="LISTING_LOAD-NOT_FOUND")
+                continue
+
             try:
-                msg = await self.channel.fetch_message(id)
+                msg = await lib.httpRetry.retryHTTP(lambda: self.channel.fetch_message(id), self.channel.id)
                 self.bountyMessages[crim.faction][crim] = msg
-            except HTTPException:
-                succeeded = False
-                for tryNum in range(cfg.httpErrRetries):
-                    try:
-                        msg = await self.channel.fetch_message(id)
-                        self.bountyMessages[crim.faction][crim] = msg
-                        succeeded = True
-                    except HTTPException:
-                        await asyncio.sleep(cfg.httpErrRetryDelaySeconds)
-                        continue
-                    break
-                if not succeeded:
-                    logger.log("BBC", "init", "HTTPException thrown when fetching listing for criminal: " + crim.name,
-                                category='bountyBoards', eventType="LISTING_LOAD-HTTPERR")
             except Forbidden:
                 logger.log("BBC", "init", "Forbidden exception thrown when fetching listing for criminal: " + crim.name,
                             category='bountyBoards', eventType="LISTING_LOAD-FORBIDDENERR")
             except NotFound:
                 logger.log("BBC", "init", "Listing message for criminal no longer exists: " + crim.name,
                             category='bountyBoards', eventType="LISTING_LOAD-NOT_FOUND")
+            except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                logger.log("BBC", "init", "HTTPException thrown when fetching listing for criminal: " + crim.name,
+                            category='bountyBoards', eventType="LISTING_LOAD-HTTPERR")
 
         if self.noBountiesMsgToBeLoaded == -1:
             self.noBountiesMessage = None
             if self.isEmpty():
                 try:
                     # self.noBountiesMessage = await self.channel.send(cfg.bbcNoBountiesMsg)
-                    self.noBountiesMessage = await self.channel.send(embed=noBountiesEmbed)
-
-                except HTTPException:
-                    succeeded = False
-                    for tryNum in range(cfg.httpErrRetries):
-                        try:
-                            self.noBountiesMessage = await self.channel.send(embed=noBountiesEmbed)
-                            succeeded = True
-                        except HTTPException:
-                            await asyncio.sleep(cfg.httpErrRetryDelaySeconds)
-                            continue
-                        break
-                    if not succeeded:
-                        logger.log("BBC", "init", "HTTPException thrown when sending no bounties message",
-                                    category='bountyBoards', eventType="NOBTYMSG_LOAD-HTTPERR")
-                    self.noBountiesMessage = None
+                    self.noBountiesMessage = await lib.httpRetry.retryHTTP(
+                                                    lambda: self.channel.send(embed=noBountiesEmbed), self.channel.id)
                 except Forbidden:
                     logger.log("BBC", "init", "Forbidden exception thrown when sending no bounties message",
                                 category='bountyBoards', eventType="NOBTYMSG_LOAD-FORBIDDENERR")
                     self.noBountiesMessage = None
+                except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                    logger.log("BBC", "init", "HTTPException thrown when sending no bounties message",
+                                category='bountyBoards', eventType="NOBTYMSG_LOAD-HTTPERR")
+                    self.noBountiesMessage = None
 
+        elif int(self.noBountiesMsgToBeLoaded) in sweptMessages:
+            self.noBountiesMessage = sweptMessages[int(self.noBountiesMsgToBeLoaded)]
+        elif sweepComplete:
+            logger.log("BBC", "init", "No bounties message no longer exists", category='bountyBoards',
+                        eventType="NOBTYMSG_LOAD-NOT_FOUND")
+            self.noBountiesMessage = None
         else:
             try:
-                self.noBountiesMessage = await self.channel.fetch_message(self.noBountiesMsgToBeLoaded)
-            except HTTPException:
-                succeeded = False
-                for tryNum in range(cfg.httpErrRetries):
-                    try:
-                        self.noBountiesMessage = await self.channel.fetch_message(self.noBountiesMsgToBeLoaded)
-                        succeeded = True
-                    except HTTPException:
-                        await asyncio.sleep(cfg.httpErrRetryDelaySeconds)
-                        continue
-                    break
-                if not succeeded:
-                    logger.log("BBC", "init", "HTTPException thrown when fetching no bounties message",
-                                category='bountyBoards', eventType="NOBTYMSG_LOAD-HTTPERR")
+                self.noBountiesMessage = await lib.httpRetry.retryHTTP(
+                                                lambda: self.channel.fetch_message(self.noBountiesMsgToBeLoaded),
+                                                self.channel.id)
             except Forbidden:
                 logger.log("BBC", "init", "Forbidden exception thrown when fetching no bounties message",
                             category='bountyBoards', eventType="NOBTYMSG_LOAD-FORBIDDENERR")
@@ -188,6 +224,9 @@ class bountyBoardChannel(serializable.Serializable):
                 logger.log("BBC", "init", "No bounties message no longer exists", category='bountyBoards',
                             eventType="NOBTYMSG_LOAD-NOT_FOUND")
                 self.noBountiesMessage = None
+            except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                logger.log("BBC", "init", "HTTPException thrown when fetching no bounties message",
+                            category='bountyBoards', eventType="NOBTYMSG_LOAD-HTTPERR")
         # del self.messagesToBeLoaded
         # del self.channelIDToBeLoaded
         # del self.noBountiesMsgToBeLoaded
@@ -228,8 +267,8 @@ class bountyBoardChannel(serializable.Serializable):
     async def addBounty(self, bounty : bounty.Bounty, message : Message):
         """Treat the given message as a listing for the given bounty, and store it in the database.
         If the BBC was previously empty, remove the empty bounty board message if one exists.
-        If a HTTP error is thrown when attempting to remove the empty board message,
-        wait and retry the removal for the number of times defined in cfg
+        If a HTTP error is thrown when attempting to remove the empty board message, the removal is retried
+        according to lib.httpRetry
 
         :param Bounty bounty: The bounty to associate with the given message
         :param discord.Message message: The message acting as a listing for the given bounty
@@ -248,21 +287,11 @@ class bountyBoardChannel(serializable.Serializable):
 
         if removeMsg:
             try:
-                await self.noBountiesMessage.delete()
-            except HTTPException:
-                succeeded = False
-                for tryNum in range(cfg.httpErrRetries):
-                    try:
-                        await self.noBountiesMessage.delete()
-                        succeeded = True
-                    except HTTPException:
-                        await asyncio.sleep(cfg.httpErrRetryDelaySeconds)
-                        continue
-                    break
-                if not succeeded:
-                    print("addBounty HTTPException")
+                await lib.httpRetry.retryHTTP(self.noBountiesMessage.delete, self.channel.id)
             except Forbidden:
                 print("addBounty Forbidden")
+            except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                print("addBounty HTTPException")
             except AttributeError:
                 print("addBounty no message")
 
@@ -271,8 +300,7 @@ class bountyBoardChannel(serializable.Serializable):
         """Remove the listing message stored for the given bounty from the database.
         This does not attempt to delete the message from discord.
         If the BBC is now empty, send an empty bounty board message.
-        If a HTTP error is thrown when sending the empty BBC message,
-        wait and retry the removal for the number of times defined in cfg
+        If a HTTP error is thrown when sending the empty BBC message, the send is retried according to lib.httpRetry
 
         :param Bounty bounty: The bounty whose listing should be removed from the database
         :raise KeyError: If the database does not store a listing for the given bounty
@@ -284,38 +312,33 @@ class bountyBoardChannel(serializable.Serializable):
                         + "but the bounty is not listed: " + bounty.criminal.name,
                         category='bountyBoards', eventType="LISTING_REM-NO_EXST")
         del self.bountyMessages[bounty.criminal.faction][bounty.criminal]
+        # Cancel any edit still pending for the removed listing
+        self.pendingEdits.pop(bounty.criminal, None)
 
         if self.isEmpty():
             try:
                 # self.noBountiesMessage = await self.channel.send(cfg.bbcNoBountiesMsg)
-                self.noBountiesMessage = await self.channel.send(embed=noBountiesEmbed)
-
-            except HTTPException:
-                succeeded = False
-                for tryNum in range(cfg.httpErrRetries):
-                    try:
-                        self.noBountiesMessage = await self.channel.send(embed=noBountiesEmbed)
-                        succeeded = True
-                    except HTTPException:
-                        await asyncio.sleep(cfg.httpErrRetryDelaySeconds)
-                        continue
-                    break
-                if not succeeded:
-                    logger.log("BBC", "remBty", "HTTPException thrown when sending no bounties message",
-                                category='bountyBoards', eventType="NOBTYMSG_LOAD-HTTPERR")
-                self.noBountiesMessage = None
+                self.noBountiesMessage = await lib.httpRetry.retryHTTP(lambda: self.channel.send(embed=noBountiesEmbed),
+                                                                        self.channel.id)
             except Forbidden:
                 logger.log("BBC", "remBty", "Forbidden exception thrown when sending no bounties message",
                             category='bountyBoards', eventType="NOBTYMSG_LOAD-FORBIDDENERR")
                 self.noBountiesMessage = None
+            except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                logger.log("BBC", "remBty", "HTTPException thrown when sending no bounties message",
+                            category='bountyBoards', eventType="NOBTYMSG_LOAD-HTTPERR")
+                self.noBountiesMessage = None
 
 
-    async def updateBountyMessage(self, bounty : bounty.Bounty):
+    async def updateBountyMessage(self, bounty : bounty.Bounty, immediate : bool = False):
         """Update the embed for the listing associated with the given bounty.
         This includes newly checked and near-correct systems along the route.
-        If a HTTP error is thrown when updating the listing, wait and retry the edit for the number of times defined in cfg
+        Edits are coalesced: the listing is marked as needing an edit, and all marked listings are edited together
+        at most once every cfg.bbcEditIntervalSeconds, from the state of their bounties at that time.
 
         :param Bounty bounty: The bounty whose listing should be updated
+        :param bool immediate: Give True to edit the listing now rather than waiting for the next flush,
+                                e.g for newly posted listings. (Default False)
         :raise KeyError: If the database does not store a listing for the given bounty
         """
         if not self.hasMessageForBounty(bounty):
@@ -324,24 +347,58 @@ class bountyBoardChannel(serializable.Serializable):
             logger.log("BBC", "remBty", "Attempted to update a BBC message for a criminal that is not listed: " \
                         + bounty.criminal.name, category='bountyBoards', eventType="LISTING_UPD-NO_EXST")
 
-        content = self.bountyMessages[bounty.criminal.faction][bounty.criminal].content
-        try:
-            await self.bountyMessages[bounty.criminal.faction][bounty.criminal].edit(content=content,
-                                                                                        embed=makeBountyEmbed(bounty))
-        except HTTPException:
-            succeeded = False
-            for tryNum in range(cfg.httpErrRetries):
+        if immediate:
+            self.pendingEdits.pop(bounty.criminal, None)
+            await self.editBountyMessage(bounty)
+        else:
+            self.pendingEdits[bounty.criminal] = bounty
+            if self.flushTask is None:
+                self.flushTask = asyncio.ensure_future(self.flushPendingEdits())
+
+
+    async def flushPendingEdits(self):
+        """Wait until cfg.bbcEditIntervalSeconds have passed since the last flush, and then edit every listing with a
+        pending edit. Edits requested while this flush is in progress are applied by the next flush.
+        """
+        delay = self.lastFlushTime + cfg.bbcEditIntervalSeconds - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        toEdit = self.pendingEdits
+        self.pendingEdits = {}
+        self.lastFlushTime = time.monotonic()
+        self.flushTask = None
+
+        for currentBounty in toEdit.values():
+            # Listings may be removed while earlier edits are awaited
+            if self.hasMessageForBounty(currentBounty):
                 try:
-                    await self.bountyMessages[bounty.criminal.faction][bounty.criminal].edit(content=content,
-                                                                                                embed=makeBountyEmbed(bounty))
-                    succeeded = True
-                except HTTPException:
-                    await asyncio.sleep(cfg.httpErrRetryDelaySeconds)
-                    continue
-                break
-            if not succeeded:
-                logger.log("BBC", "updBtyMsg", "HTTPException thrown when updating bounty listing for criminal: " \
-                            + bounty.criminal.name, category='bountyBoards', eventType="UPD_LSTING-HTTPERR")
+                    await self.editBountyMessage(currentBounty)
+                except Exception as e:
+                    logger.log("BBC", "flushEdits", "Unexpected " + type(e).__name__ + " when editing bounty listing " \
+                                + "for criminal: " + currentBounty.criminal.name, category='bountyBoards',
+                                eventType="UPD_LSTING-UNKWNERR", trace=traceback.format_exc())
+
+
+    def cancelPendingEdits(self):
+        """Discard all listing edits that have not yet been flushed, and cancel the scheduled flush.
+        """
+        self.pendingEdits = {}
+        if self.flushTask is not None:
+            self.flushTask.cancel()
+            self.flushTask = None
+
+
+    async def editBountyMessage(self, bounty : bounty.Bounty):
+        """Edit the listing associated with the given bounty now, with a newly generated embed.
+        If a HTTP error is thrown when updating the listing, the edit is retried according to lib.httpRetry
+
+        :param Bounty bounty: The bounty whose listing should be edited
+        """
+        listing = self.bountyMessages[bounty.criminal.faction][bounty.criminal]
+        try:
+            await lib.httpRetry.retryHTTP(lambda: listing.edit(content=listing.content, embed=makeBountyEmbed(bounty)),
+                                            self.channel.id)
         except Forbidden:
             logger.log("BBC", "updBtyMsg", "Forbidden exception thrown when updating bounty listing for criminal: " \
                         + bounty.criminal.name, category='bountyBoards', eventType="UPD_LSTING-FORBIDDENERR")
@@ -349,11 +406,15 @@ class bountyBoardChannel(serializable.Serializable):
             logger.log("BBC", "updBtyMsg", "Bounty listing message no longer exists, BBC entry removed: " \
                         + bounty.criminal.name, category='bountyBoards', eventType="UPD_LSTING-NOT_FOUND")
             await self.removeBounty(bounty)
+        except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+            logger.log("BBC", "updBtyMsg", "HTTPException thrown when updating bounty listing for criminal: " \
+                        + bounty.criminal.name, category='bountyBoards', eventType="UPD_LSTING-HTTPERR")
 
 
     async def clear(self):
         """Clear all bounty listings on the board.
         """
+        self.cancelPendingEdits()
         for fac in self.bountyMessages:
             for currentBounty in self.bountyMessages[fac]:
                 await self.removeBounty(currentBounty)
@@ -169,6 +169,30 @@ class BountyConfig:
                 raise IndexError("BOUCONF_CONS_FACDBFULL: Attempted to generate new bounty config when " \
                                     + "no slots are available for faction: '" + self.faction + "'")
 
+        self.generateRoute()
+
+        if self.issueTime == -1.0:
+            self.issueTime = datetime.utcnow().replace(second=0).timestamp()
+        if self.endTime == -1.0:
+            self.endTime = (datetime.utcfromtimestamp(self.issueTime) + timedelta(days=len(self.route))).timestamp()
+
+        if not forceKeepChecked:
+            self.checked = {}
+        for station in self.route:
+            if (not forceKeepChecked) or station not in self.checked or self.checked == {}:
+                self.checked[station] = -1
+
+        self.generated = True
+
+
+    def generateRoute(self):
+        """Validate the given route, answer and reward, and randomly generate any that are missing.
+        These attributes do not depend on the bounty's faction or criminal, so this may be called ahead of time
+        to pre-generate routes for later bounties, as in bountyPool.BountyPool. generate calls this automatically.
+
+        :raise ValueError: When requesting an invalid reward amount
+        :raise KeyError: When requesting an unknown system name
+        """
         if self.route == []:
             if self.start == "":
                 self.start = random.choice(list(bbData.builtInSystemObjs.keys()))
@@ -197,15 +221,3 @@ class BountyConfig:
             self.reward = int(len(self.route) * cfg.bPointsToCreditsRatio)
         elif self.reward < 0:
             raise ValueError("Bounty constructor: Invalid reward requested '" + str(self.reward) + "'")
-        if self.issueTime == -1.0:
-            self.issueTime = datetime.utcnow().replace(second=0).timestamp()
-        if self.endTime == -1.0:
-            self.endTime = (datetime.utcfromtimestamp(self.issueTime) + timedelta(days=len(self.route))).timestamp()
-
-        if not forceKeepChecked:
-            self.checked = {}
-        for station in self.route:
-            if (not forceKeepChecked) or station not in self.checked or self.checked == {}:
-                self.checked[station] = -1
-
-        self.generated = True
@@ -0,0 +1,110 @@
+# Typing imports
+from __future__ import annotations
+
+from collections import deque
+import traceback
+
+from . import bountyConfig
+from ...cfg import cfg
+from ... import botState
+
+
+class BountyPool:
+    """A pool of pre-generated bounty routes, shared between all guilds.
+    Route generation (picking random start and end systems and pathfinding between them) is the most expensive part of
+    spawning a bounty, and does not depend on the guild, faction or criminal. The pool generates routes ahead of time
+    in small batches, so that when a guild spawns a new bounty it need only claim a route and pick a criminal.
+
+    :var configs: Pre-generated BountyConfigs, with their route, start, end, answer and reward generated, but no
+                    faction or criminal. The oldest configs are claimed first.
+    :vartype configs: collections.deque[BountyConfig]
+    :var maxSize: The maximum number of configs to pre-generate
+    :vartype maxSize: int
+    """
+
+    def __init__(self, maxSize : int = cfg.bountyPoolSize):
+        """
+        :param int maxSize: The maximum number of configs to pre-generate (Default cfg.bountyPoolSize)
+        """
+        self.configs = deque()
+        self.maxSize = maxSize
+
+
+    def isFull(self) -> bool:
+        """Decide whether the pool contains its maximum number of pre-generated configs.
+
+        :return: True if no more configs should be generated, False otherwise
+        :rtype: bool
+        """
+        return len(self.configs) >= self.maxSize
+
+
+    def generateConfig(self) -> bool:
+        """Generate a new BountyConfig route and add it to the pool.
+        Routes which pathfinding failed to generate are discarded.
+
+        :return: True if a new config was added to the pool, False if generation failed
+        :rtype: bool
+        """
+        newConfig = bountyConfig.BountyConfig()
+        try:
+            newConfig.generateRoute()
+        except (KeyError, IndexError):
+            botState.logger.log("BountyPool", "generateConfig", "Failed to generate a bounty route",
+                                category="bountyConfig", eventType="ROUTE_ERR", trace=traceback.format_exc())
+            return False
+
+        # bbAStar reports failed pathfinding as a string rather than a list of systems
+        if type(newConfig.route) != list:
+            botState.logger.log("BountyPool", "generateConfig",
+                                "Pathfinding failed from '" + newConfig.start + "' to '" + newConfig.end + "': " \
+                                + str(newConfig.route), category="bountyConfig", eventType="ROUTE_FAIL")
+            return False
+
+        self.configs.append(newConfig)
+        return True
+
+
+    def refill(self, maxNew : int = None) -> int:
+        """Generate new configs until the pool is full, or until maxNew configs have been attempted.
+        This is intended to be called regularly in small batches, e.g by a TimedTask, to spread generation over time.
+
+        :param int maxNew: The maximum number of configs to generate in this call. Give None to use
+                            cfg.bountyPoolRefillBatchSize. (Default None)
+        :return: The number of configs added to the pool
+        :rtype: int
+        """
+        if maxNew is None:
+            maxNew = cfg.bountyPoolRefillBatchSize
+        numAdded = 0
+        for _ in range(maxNew):
+            if self.isFull():
+                break
+            if self.generateConfig():
+                numAdded += 1
+        return numAdded
+
+
+    def claimConfig(self) -> bountyConfig.BountyConfig:
+        """Remove and return a pre-generated BountyConfig from the pool, for use in a new bounty.
+        The config's faction and criminal are not yet generated, and will be picked to avoid collisions with the claiming
+        guild's bounties when passed to the bounty.Bounty constructor.
+        If the pool is empty, a blank config is returned, and its route will be generated on bounty creation instead.
+
+        :return: A BountyConfig with a generated route, or a blank BountyConfig if the pool is empty
+        :rtype: BountyConfig
+        """
+        if self.configs:
+            return self.configs.popleft()
+        botState.logger.log("BountyPool", "claimConfig", "Bounty pool empty, generating route on demand",
+                            category="bountyConfig", eventType="POOL_EMPTY", noPrint=True)
+        return bountyConfig.BountyConfig()
+
+
+    def __len__(self) -> int:
+        """Get the number of configs currently in the pool.
+
+        :return: The number of pre-generated configs available to claim
+        :rtype: int
+        """
+        return len(self.configs)
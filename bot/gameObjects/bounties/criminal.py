@@ -29,6 +29,7 @@ class Criminal(aliasable.Aliasable):
     :var hasShip: Whether this criminal has a ship equipped or not
     :vartype hasShip: bool
     """
+    __slots__ = ("faction", "icon", "wiki", "isPlayer", "builtIn", "ship")
 
     def __init__(self, name : str, faction : str, icon : str, builtIn : bool = False,
             isPlayer : bool = False, aliases : List[str] = [], wiki : str = "", ship : bool = None):
@@ -54,14 +55,26 @@ class Criminal(aliasable.Aliasable):
         self.faction = faction
         self.icon = icon
         self.wiki = wiki
-        self.hasWiki = wiki != ""
         self.isPlayer = isPlayer
         self.builtIn = builtIn
 
+        self.ship = None
         if ship is not None:
             self.copyShip(ship)
-        else:
-            self.hasShip = False
+
+
+    @property
+    def hasWiki(self) -> bool:
+        """Whether or not this criminal has a wiki page
+        """
+        return self.wiki != ""
+
+
+    @property
+    def hasShip(self) -> bool:
+        """Whether this criminal has a ship equipped or not
+        """
+        return self.ship is not None
 
 
     def clearShip(self):
@@ -71,8 +84,7 @@ class Criminal(aliasable.Aliasable):
         """
         if not self.hasShip:
             raise RuntimeError("CRIM_CLEARSH_NOSHIP: Attempted to clearShip on a Criminal with no active ship")
-        del self.ship
-        self.hasShip = False
+        self.ship = None
 
 
     def unequipShip(self):
@@ -83,7 +95,6 @@ class Criminal(aliasable.Aliasable):
         if not self.hasShip:
             raise RuntimeError("CRIM_UNEQSH_NOSHIP: Attempted to unequipShip on a Criminal with no active ship")
         self.ship = None
-        self.hasShip = False
 
 
     def equipShip(self, ship : shipItem):
@@ -95,7 +106,6 @@ class Criminal(aliasable.Aliasable):
         if self.hasShip:
             raise RuntimeError("CRIM_EQUIPSH_HASSH: Attempted to equipShip on a Criminal that already has an active ship")
         self.ship = ship
-        self.hasShip = True
 
 
     def copyShip(self, ship : shipItem):
@@ -107,7 +117,6 @@ class Criminal(aliasable.Aliasable):
         if self.hasShip:
             raise RuntimeError("CRIM_COPYSH_HASSH: Attempted to copyShip on a Criminal that already has an active ship")
         self.ship = shipItem.Ship.fromDict(ship.toDict())
-        self.hasShip = True
 
 
     def __hash__(self) -> int:
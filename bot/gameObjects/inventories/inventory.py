@@ -1,36 +1,155 @@
 from __future__ import annotations
+from typing import List
+
 from . import inventoryListing
+from ..items import gameItem
 from ...baseClasses import serializable
 
 
 class Inventory(serializable.Serializable):
     """A database of InventoryListings.
     Aside from the use of InventoryListing for the purpose of item quantities, this class is type unaware.
-
-    :var items: The actual item listings
+    Listings are held in an insertion-ordered dict, so membership tests, adding and removing are constant time,
+    and items are listed in the order that they were first added. Items are compared by identity, not by name.
+    The exception is custom GameItems with content identity, which are stored as their interned instance, so that
+    equal custom items share one listing.
+    The stored items are also kept in a list for positional access and pagination. Removed items are replaced in the list
+    by None, rather than shifting the items after them, and a binary indexed tree counts the items remaining before each
+    position, so that removing an item and finding the item at a given position both take logarithmic time. The list is
+    compacted once it holds more removed items than stored ones, so its length stays proportional to numKeys.
+
+    :var items: The actual item listings, in the order that they were added
     :vartype items: dict[object, InventoryListing]
-    :var keys: The item types stored
-    :vartype keys: ist[object]
     :var totalItems: The total number of items stored; the sum of all item quantities
     :vartype totalItems: int
-    :var numKeys: The number of item types stored; the length of self.keys
-    :vartype numKeys: int
+    :var changeListener: A function to call whenever items are added or removed, or None. It is given this inventory,
+                            the item, and the signed change in the item's quantity.
+    :vartype changeListener: Callable[[Inventory, object, int], None] or None
     """
     def __init__(self):
         # The actual item listings
         self.items = {}
-        # The item types stored
-        self.keys = []
+        # The item types stored, in the order that they were added. Removed items are left as None until compaction.
+        self._order = []
+        # The position of each stored item in self._order
+        self._positions = {}
+        # Binary indexed tree over self._order, counting stored items. Index i + 1 of the tree corresponds to position i.
+        self._storedCounts = [0]
+        # The number of removed items left as None in self._order
+        self._numRemoved = 0
         # The total number of items stored; the sum of all item quantities
         self.totalItems = 0
-        # The number of item types stored; the length of self.keys
-        self.numKeys = 0
+        # Notified of every change to the inventory's contents
+        self.changeListener = None
+
+
+    @property
+    def keys(self) -> List[object]:
+        """The item types stored, in the order that they were added.
+        The returned list is shared with the inventory, and must not be modified.
+        """
+        if self._numRemoved:
+            self._compact()
+        return self._order
+
+
+    @property
+    def numKeys(self) -> int:
+        """The number of item types stored; the length of self.keys
+        """
+        return len(self.items)
+
+
+    def _compact(self):
+        """Drop removed items from the order list, and rebuild the positions of stored items and the tree counting them.
+        """
+        self._order = list(self.items)
+        self._positions = {item: position for position, item in enumerate(self._order)}
+        # Build the tree in linear time, by adding each node's count to its parent
+        self._storedCounts = [0] + [1] * len(self._order)
+        for index in range(1, len(self._storedCounts)):
+            parent = index + (index & -index)
+            if parent < len(self._storedCounts):
+                self._storedCounts[parent] += self._storedCounts[index]
+        self._numRemoved = 0
+
+
+    def _appendKey(self, item : object):
+        """Add a newly stored item to the end of the order list.
+
+        :param object item: The item to add. Must not already be stored.
+        """
+        self._positions[item] = len(self._order)
+        self._order.append(item)
+        # The new tree node counts itself, plus the nodes it covers that were added before it
+        index = len(self._storedCounts)
+        count = 1
+        child = index - 1
+        while child > index - (index & -index):
+            count += self._storedCounts[child]
+            child -= child & -child
+        self._storedCounts.append(count)
+
+
+    def _removeKey(self, item : object):
+        """Remove an item from the order list, leaving None in its place. Compacts the list once more of it is removed
+        items than stored ones.
+
+        :param object item: The item to remove. Must be stored.
+        """
+        position = self._positions.pop(item)
+        self._order[position] = None
+        self._numRemoved += 1
+        if self._numRemoved > len(self._positions):
+            self._compact()
+        else:
+            index = position + 1
+            while index < len(self._storedCounts):
+                self._storedCounts[index] -= 1
+                index += index & -index
+
+
+    def _orderPosition(self, index : int) -> int:
+        """Find the position in the order list of the stored item at a position in self.keys, without compacting the
+        order list.
+
+        :param int index: The position of the item, counting only stored items. Must be between 0 and numKeys - 1.
+        :return: The position of the item in self._order
+        :rtype: int
+        """
+        if not self._numRemoved:
+            return index
+        # Descend the tree to the last node with at most index stored items before it
+        treeIndex = 0
+        remaining = index + 1
+        step = 1 << (len(self._storedCounts) - 1).bit_length()
+        while step:
+            nextIndex = treeIndex + step
+            if nextIndex < len(self._storedCounts) and self._storedCounts[nextIndex] < remaining:
+                treeIndex = nextIndex
+                remaining -= self._storedCounts[nextIndex]
+            step >>= 1
+        return treeIndex
+
+
+    def _storedItem(self, item : object) -> object:
+        """Get the object that item is, or would be, listed under in this inventory.
+        This is item itself, unless item is a custom GameItem with content identity, in which case it is the interned
+        instance equal to item.
+
+        :param object item: The item to look up
+        :return: The key for item in self.items
+        :rtype: object
+        """
+        if item in self.items or not isinstance(item, gameItem.GameItem):
+            return item
+        return gameItem.internItem(item)
 
 
     def addItem(self, item : object, quantity : int = 1):
         """Add one or more of an item to the inventory.
-        If at least one of item is already in the inventory, that item's InventoryListing count will be incremented.
-        Otherwise, a new InventoryListing is created for item.
+        If at least one of item, or an item equal to it by content, is already in the inventory, that item's
+        InventoryListing count will be incremented. Otherwise, a new InventoryListing is created for item.
 
         :param object item: The item to add to the inventory
         :param int quantity: Integer amount of item to add to the inventory. Must be at least 1. (Default 1)
@@ -39,6 +158,7 @@ class Inventory(serializable.Serializable):
         if quantity < 0:
             raise ValueError("Quantity must be at least 1")
 
+        item = self._storedItem(item)
         # increment totalItems tracker
         self.totalItems += quantity
         # increment count for existing bbItemListing
@@ -47,9 +167,10 @@ class Inventory(serializable.Serializable):
         # Add a new bbItemListing if one does not exist
         else:
             self.items[item] = inventoryListing.InventoryListing(item, quantity)
-            # Update keys and numKeys trackers
-            self.keys.append(item)
-            self.numKeys += 1
+            self._appendKey(item)
+
+        if self.changeListener is not None:
+            self.changeListener(self, item, quantity)
 
 
     def _addListing(self, newListing : inventoryListing.InventoryListing):
@@ -59,6 +180,7 @@ class Inventory(serializable.Serializable):
 
         :param InventoryListing newListing: The inventory listing to add to the inventory
         """
+        newListing.item = self._storedItem(newListing.item)
         # update total items count
         self.totalItems += newListing.count
         # if item is already stored, increment its listing count
@@ -67,9 +189,10 @@ class Inventory(serializable.Serializable):
         # otherwise, store a reference to the given listing
         else:
             self.items[newListing.item] = newListing
-            self.keys.append(newListing.item)
-            # update keys counter
-            self.numKeys += 1
+            self._appendKey(newListing.item)
+
+        if self.changeListener is not None:
+            self.changeListener(self, newListing.item, newListing.count)
 
 
     def removeItem(self, item : object, quantity : int = 1):
@@ -82,6 +205,7 @@ class Inventory(serializable.Serializable):
                                 currently stored, both inclusive. (Default 1)
         :raise ValueError: When attempting to remove more of an item than is in the inventory
         """
+        item = self._storedItem(item)
         # Ensure enough of item is stored to remove quantity of it
         if item in self.items and self.items[item].count >= quantity:
             # Update item's count and inventory's totalItems tracker
@@ -89,14 +213,11 @@ class Inventory(serializable.Serializable):
             self.totalItems -= quantity
             # remove the bbItemListing if it is now empty
             if self.items[item].count == 0:
-                # update the keys and numKeys trackers
-                for i in range(len(self.keys)):
-                    if self.keys[i] is item:
-                        self.keys.pop(i)
-                        break
-                # self.keys.remove(item)
-                self.numKeys -= 1
                 del self.items[item]
+                self._removeKey(item)
+
+            if self.changeListener is not None:
+                self.changeListener(self, item, -quantity)
         else:
             raise ValueError("Attempted to remove " + str(quantity) + " " + str(item) + "(s) when " \
                                 + (str(self.items[item].count) if item in self.items else "0") + " are in inventory")
@@ -129,10 +250,16 @@ class Inventory(serializable.Serializable):
             raise IndexError("pageNum out of range. min=1 max=" + str(self.numPages(itemsPerPage)))
 
         page = []
-        # Splice self.keys around the first and last indices in the requested page
-        for item in self.keys[(pageNum - 1) * itemsPerPage: min(pageNum * itemsPerPage, self.numKeys)]:
-            # Add the bbItemListings for each of the page's keys to the results list
-            page.append(self.items[item])
+        pageSize = min(pageNum * itemsPerPage, self.numKeys) - (pageNum - 1) * itemsPerPage
+        # Find the page's first key by position, rather than compacting self.keys after recent removals,
+        # then skip over any removed items between the page's keys
+        position = self._orderPosition((pageNum - 1) * itemsPerPage)
+        while len(page) < pageSize:
+            item = self._order[position]
+            if item is not None:
+                # Add the bbItemListings for each of the page's keys to the results list
+                page.append(self.items[item])
+            position += 1
 
         return page
 
@@ -144,7 +271,7 @@ class Inventory(serializable.Serializable):
         :return: True if at least one of item is in this inventory, False otherwise
         :rtype: bool
         """
-        return item in self.keys
+        return self._storedItem(item) in self.items
 
 
     def numStored(self, item) -> int:
@@ -154,7 +281,8 @@ class Inventory(serializable.Serializable):
         :return: Integer count of number of items in this inventory. 0 if it is not stored in this inventory.
         :rtype: int
         """
-        return self.items[item].count if self.stores(item) else 0
+        item = self._storedItem(item)
+        return self.items[item].count if item in self.items else 0
 
 
     def isEmpty(self) -> bool:
@@ -169,10 +297,16 @@ class Inventory(serializable.Serializable):
     def clear(self):
         """Remove all items from the inventory.
         """
+        removedListings = self.items.values()
         self.items = {}
-        self.keys = []
+        self._order = []
+        self._positions = {}
+        self._storedCounts = [0]
+        self._numRemoved = 0
         self.totalItems = 0
-        self.numKeys = 0
+        if self.changeListener is not None:
+            for listing in removedListings:
+                self.changeListener(self, listing.item, -listing.count)
 
 
     def __getitem__(self, key : int) -> inventoryListing.InventoryListing:
@@ -182,19 +316,14 @@ class Inventory(serializable.Serializable):
         :param int key: The index of the key to dereference
         :return: The InventoryListing for the item at the requested index
         :rtype: InventoryListing
-        :raise KeyError: When the given index is in range of the inventory, but the key at the requested position
-                            in the keys array does not exist in the items dictionary
         :raise IndexError: When given an index that isn't an int, or the given index is out of range
         :raise ValueError: When the inventory is empty
         """
-        if bool(self.keys):
-            if key in range(len(self.keys)):
-                if self.keys[key] in self.items:
-                    return self.items[self.keys[key]]
-                raise KeyError("Failed get of key number " + str(key) + " - " + str(self.keys[key]) \
-                                + ". Key does not exist in inventory.")
+        if bool(self.items):
+            if key in range(self.numKeys):
+                return self.items[self._order[self._orderPosition(key)]]
             raise IndexError("Key of incorrect type or out of range: " + str(key) + ". Valid range: 0 - " \
-                                + str(len(self.keys) - 1))
+                                + str(self.numKeys - 1))
         raise ValueError("Attempted to fetch key " + str(key) + ", but keys list is empty")
 
 
@@ -214,7 +343,7 @@ class Inventory(serializable.Serializable):
 
         :param object item: The object to test for membership
         """
-        return item in self.keys
+        return self._storedItem(item) in self.items
 
 
     def toDict(self, **kwargs) -> dict:
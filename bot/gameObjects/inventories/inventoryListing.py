@@ -12,6 +12,7 @@ class InventoryListing(serializable.Serializable):
     :var count: The quantity of item stored
     :vartype count: int
     """
+    __slots__ = ("item", "count")
 
     def __init__(self, item, count : int = 0):
         """
@@ -1,14 +1,20 @@
 # Typing imports
 from __future__ import annotations
-from typing import List
+from typing import List, Union
 
 from ...baseClasses import aliasable
 from abc import abstractmethod
 from ... import lib
+from weakref import WeakValueDictionary
+import hashlib
+import json
 
 
 subClassNames = {}
 nameSubClasses = {}
+# The canonical instance of each custom item with content identity, by content fingerprint.
+# Entries are removed automatically when their item is no longer referenced.
+internedItems : WeakValueDictionary = WeakValueDictionary()
 
 
 class GameItem(aliasable.Aliasable):
@@ -42,7 +48,16 @@ class GameItem(aliasable.Aliasable):
     :vartype hasTechLevel: bool
     :var builtIn: Whether this item is built into BountyBot (loaded in from bbData) or was custom spawned.
     :vartype builtIn: bool
+    :var contentIdentity: Class attribute. Whether custom spawned items of this type are identified by their content,
+                            so that equal items can share one object and stack in inventories. Only item types that are
+                            not modified after creation should opt in.
+    :vartype contentIdentity: bool
     """
+    # Many items may be loaded at once, so attributes are slotted rather than held in a __dict__.
+    # __weakref__ allows items to be interned. _fingerprint caches the item's content fingerprint once calculated.
+    __slots__ = ("wiki", "manufacturer", "icon", "emoji", "value", "shopSpawnRate", "techLevel", "builtIn", "_fingerprint",
+                    "__weakref__")
+    contentIdentity = False
 
     def __init__(self, name : str, aliases : List[str], value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
@@ -63,24 +78,49 @@ class GameItem(aliasable.Aliasable):
         """
         super(GameItem, self).__init__(name, aliases)
         self.wiki = wiki
-        self.hasWiki = wiki != ""
-
         self.manufacturer = manufacturer
-        self.hasManufacturer = manufacturer != ""
-
         self.icon = icon
-        self.hasIcon = icon != ""
-
         self.emoji = emoji
-        self.hasEmoji = emoji is not None and emoji != lib.emojis.BasedEmoji.EMPTY
-
         self.value = value
         self.shopSpawnRate = 0
-
         self.techLevel = techLevel
-        self.hasTechLevel = techLevel != -1
-
         self.builtIn = builtIn
+        self._fingerprint = None
+
+
+    @property
+    def hasWiki(self) -> bool:
+        """Whether or not this item has a wiki page
+        """
+        return self.wiki != ""
+
+
+    @property
+    def hasManufacturer(self) -> bool:
+        """Whether or not this item has a manufacturer
+        """
+        return self.manufacturer != ""
+
+
+    @property
+    def hasIcon(self) -> bool:
+        """Whether or not this item has an icon
+        """
+        return self.icon != ""
+
+
+    @property
+    def hasEmoji(self) -> bool:
+        """Whether or not this item has an emoji
+        """
+        return self.emoji is not None and self.emoji != lib.emojis.BasedEmoji.EMPTY
+
+
+    @property
+    def hasTechLevel(self) -> bool:
+        """Whether or not this item has a tech level
+        """
+        return self.techLevel != -1
 
 
     @abstractmethod
@@ -136,6 +176,24 @@ class GameItem(aliasable.Aliasable):
         return data
 
 
+    def contentFingerprint(self) -> Union[str, None]:
+        """Get a canonical fingerprint of this item's content, shared by all equal custom items.
+        BuiltIn items are already unique, and so have no fingerprint.
+        The fingerprint is calculated once and then cached, as items with content identity are not modified after
+        creation. Items that are to be modified should be uninterned first, which clears the cache.
+
+        :return: A hash of this item's serialized form if it is custom spawned and its type has content identity,
+                    None otherwise
+        :rtype: str or None
+        """
+        if self.builtIn or not self.contentIdentity:
+            return None
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256(json.dumps(self.toDict(saveType=True), sort_keys=True,
+                                                            separators=(",", ":")).encode()).hexdigest()
+        return self._fingerprint
+
+
     def __hash__(self) -> int:
         """Calculate a hash of this item based on its location in memory.
 
@@ -145,6 +203,35 @@ class GameItem(aliasable.Aliasable):
         return hash(repr(self))
 
 
+def internItem(item : GameItem) -> GameItem:
+    """Get the canonical instance of an item.
+    If an equal custom item with content identity has already been interned, that item is returned. Otherwise, item
+    becomes the canonical instance of its content and is returned. Items without a content fingerprint are returned
+    unchanged. Interned items are shared, and must not be modified.
+
+    :param GameItem item: The item to intern
+    :return: The canonical instance of item
+    :rtype: GameItem
+    """
+    fingerprint = item.contentFingerprint()
+    if fingerprint is None:
+        return item
+    return internedItems.setdefault(fingerprint, item)
+
+
+def uninternItem(item : GameItem):
+    """Stop item from being the canonical instance of its content, e.g before modifying it.
+    Items that are not interned are ignored.
+
+    :param GameItem item: The item to unintern
+    """
+    fingerprint = item.contentFingerprint()
+    if fingerprint is not None and internedItems.get(fingerprint) is item:
+        del internedItems[fingerprint]
+    # Recalculate the fingerprint after any modification
+    item._fingerprint = None
+
+
 def spawnableItem(cls):
     if not issubclass(cls, GameItem):
         raise TypeError("Invalid use of spawnableItem decorator: " + cls.__name__ + " is not a gameItem subtype")
@@ -161,7 +248,7 @@ def spawnItem(data : dict) -> GameItem:
     elif data["type"] not in subClassNames:
         raise KeyError("Unrecognised item type: " + str(data["type"]))
 
-    return subClassNames[data["type"]].fromDict(data)
+    return internItem(subClassNames[data["type"]].fromDict(data))
 
 
 def isSpawnableItemClass(cls):
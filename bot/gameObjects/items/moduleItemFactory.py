@@ -1,6 +1,7 @@
 from ...cfg import bbData
 from .modules import _all as moduleItemClasses
 from .modules import ModuleItem
+from .gameItem import internItem
 
 typeConstructors = {cls.__name__: cls.fromDict for cls in moduleItemClasses}
 
@@ -9,6 +10,7 @@ def fromDict(moduleDict):
     """Factory function recreating any moduleItem or moduleItem subtype from a dictionary-serialized representation.
     If implemented correctly, this should act as the opposite to the original object's toDict method.
     If the requested module is builtIn, return the builtIn module object of the same name.
+    Otherwise, return the interned module equal to the one described, so that equal modules share one object.
 
     :param dict moduleDict: A dictionary containg all information necessary to create the desired moduleItem object
     :return: The moduleItem object described in moduleDict
@@ -18,6 +20,6 @@ def fromDict(moduleDict):
         return bbData.builtInModuleObjs[moduleDict["name"]]
     else:
         if "type" in moduleDict and moduleDict["type"] in typeConstructors:
-            return typeConstructors[moduleDict["type"]](moduleDict)
+            return internItem(typeConstructors[moduleDict["type"]](moduleDict))
         else:
-            return ModuleItem.fromDict(moduleDict)
+            return internItem(ModuleItem.fromDict(moduleDict))
@@ -10,6 +10,8 @@ from ..gameItem import spawnableItem
 class ArmourModule(moduleItem.ModuleItem):
     """A module providing a ship with an extra layer of defense.
     """
+    __slots__ = ()
+
     def __init__(self, name : str, aliases : List[str], armour : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
             emoji : lib.emojis.BasedEmoji = lib.emojis.BasedEmoji.EMPTY, techLevel : int = -1,
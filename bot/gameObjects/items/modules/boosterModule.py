@@ -14,6 +14,7 @@ class BoosterModule(moduleItem.ModuleItem):
     :var duration: Number of seconds the boost lasts
     :vartype duration: float
     """
+    __slots__ = ("effect", "duration")
 
     def __init__(self, name : str, aliases : List[str], effect : int = 0, duration : int = 0,
             value : int = 0, wiki : str = "", manufacturer : str = "", icon : str = "",
@@ -12,6 +12,7 @@ class CabinModule(moduleItem.ModuleItem):
     :var cabinSize: The number of passengers that can fit in this cabin
     :vartype cabinSize: int
     """
+    __slots__ = ("cabinSize",)
 
     def __init__(self, name : str, aliases : List[str], cabinSize : int = 0, value : int = 0,
             wiki : int = "", manufacturer : str = "", icon : str = "",
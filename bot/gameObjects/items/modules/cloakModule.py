@@ -12,6 +12,7 @@ class CloakModule(moduleItem.ModuleItem):
     :var duration: The number of seconds this effect lasts
     :vartype duration: float
     """
+    __slots__ = ("duration",)
 
     def __init__(self, name : str, aliases : List[str], duration : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
@@ -9,6 +9,7 @@ from ..gameItem import spawnableItem
 class CompressorModule(moduleItem.ModuleItem):
     """"A module providing a ship with more cargo space
     """
+    __slots__ = ()
 
     def __init__(self, name : str, aliases : List[str], cargoMultiplier : int = 1.0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
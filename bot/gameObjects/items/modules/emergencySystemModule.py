@@ -12,6 +12,7 @@ class EmergencySystemModule(moduleItem.ModuleItem):
     :var duration: The number of seconds the effect is active for
     :vartype duration: float
     """
+    __slots__ = ("duration",)
 
     def __init__(self, name : str, aliases : List[str], duration : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
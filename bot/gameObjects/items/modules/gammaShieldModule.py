@@ -12,6 +12,7 @@ class GammaShieldModule(moduleItem.ModuleItem):
     :var effect: The reduction in gamma radiation received as a multiplier
     :vartype effect: float
     """
+    __slots__ = ("effect",)
 
     def __init__(self, name : str, aliases : List[str], effect : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
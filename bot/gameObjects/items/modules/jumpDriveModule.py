@@ -9,6 +9,7 @@ from ..gameItem import spawnableItem
 class JumpDriveModule(moduleItem.ModuleItem):
     """"A module providing a ship with the ability to jump anywhere within the galaxy, without the need to use jumpgates
     """
+    __slots__ = ()
 
     def __init__(self, name : str, aliases : List[str], value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
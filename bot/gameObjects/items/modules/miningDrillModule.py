@@ -14,6 +14,7 @@ class MiningDrillModule(moduleItem.ModuleItem):
     :var handling: The drill's ease of use
     :vartype handling: float
     """
+    __slots__ = ("oreYield",)
 
     def __init__(self, name : str, aliases : List[str], oreYield : int = 0, handling : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
@@ -30,6 +30,10 @@ class ModuleItem(GameItem):
     :var handlingMultiplier: A percentage multiplier applied to the ship's base handling
     :vartype handlingMultiplier: float
     """
+    __slots__ = ("armour", "armourMultiplier", "shield", "shieldMultiplier", "dps", "dpsMultiplier", "cargo",
+                    "cargoMultiplier", "handling", "handlingMultiplier")
+    # Equal custom spawned items share one object and one inventory listing
+    contentIdentity = True
 
     def __init__(self, name: str, aliases : List[str], armour : int = 0,
             armourMultiplier : float = 1.0, shield : int = 0, shieldMultiplier : float = 1.0,
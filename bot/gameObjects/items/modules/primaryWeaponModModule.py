@@ -9,6 +9,7 @@ from ..gameItem import spawnableItem
 class PrimaryWeaponModModule(moduleItem.ModuleItem):
     """A module providing a DPS multiplier to all equipped weapons
     """
+    __slots__ = ()
 
     def __init__(self, name : str, aliases : List[str], dpsMultiplier : float = 1, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
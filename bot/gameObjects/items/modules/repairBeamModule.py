@@ -14,6 +14,7 @@ class RepairBeamModule(moduleItem.ModuleItem):
     :var count: The number of nearby ships that can be healed simultaneously
     :vartype count: int
     """
+    __slots__ = ("effect", "count")
 
     def __init__(self, name : str, aliases : List[str], effect : int = 0, count : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
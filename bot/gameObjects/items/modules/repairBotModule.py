@@ -12,6 +12,7 @@ class RepairBotModule(moduleItem.ModuleItem):
     :var HPps: The amount of health points regained per second
     :vartype HPps: int
     """
+    __slots__ = ("HPps",)
 
     def __init__(self, name : str, aliases : List[str], HPps : float = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
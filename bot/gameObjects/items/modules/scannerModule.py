@@ -16,6 +16,7 @@ class ScannerModule(moduleItem.ModuleItem):
     :var showCargo: Whether or not this scanner will display the contents of scanned ships' cargo holds
     :vartype showCargo: bool
     """
+    __slots__ = ("timeToLock", "showClassAAsteroids", "showCargo")
 
     def __init__(self, name : str, aliases : List[str], timeToLock : int = 0,
             showClassAAsteroids : bool = False, showCargo : bool = False, value : int = 0,
@@ -12,6 +12,7 @@ class ShieldInjectorModule(moduleItem.ModuleItem):
     :var plasmaConsumption: The amount of plasma required to refill shields
     :vartype plasmaConsumption: int
     """
+    __slots__ = ("plasmaConsumption",)
 
     def __init__(self, name : str, aliases : List[str], plasmaConsumption : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
@@ -9,6 +9,7 @@ from ..gameItem import spawnableItem
 class ShieldModule(moduleItem.ModuleItem):
     """A module providing a ship with a self-repairing layer of protection, over the ship's hull and armour (if equipped)
     """
+    __slots__ = ()
 
     def __init__(self, name : str, aliases : List[str], shield : int = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
@@ -9,6 +9,7 @@ from ..gameItem import spawnableItem
 class SignatureModule(moduleItem.ModuleItem):
     """A module allowing a the owner to disguise themselves as a member of th faction that manufactured this signature.
     """
+    __slots__ = ()
 
     def __init__(self, name : str, aliases : List[str], manufacturer : str, value : int = 0,
             wiki : str = "", icon : str = "",
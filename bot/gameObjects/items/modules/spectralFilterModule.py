@@ -14,6 +14,7 @@ class SpectralFilterModule(moduleItem.ModuleItem):
     :var showInfo: Whether information about plasma clouds is shown on the ship's heads up display
     :vartype showInfo: bool
     """
+    __slots__ = ("showOnRadar", "showInfo")
 
     def __init__(self, name : str, aliases : List[str], showInfo : bool = False,
             showOnRadar : bool = False, value : int = 0, wiki : str = "",
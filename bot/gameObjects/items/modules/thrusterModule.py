@@ -9,6 +9,7 @@ from ..gameItem import spawnableItem
 class ThrusterModule(moduleItem.ModuleItem):
     """A module providing a ship with a boost to its handling.
     """
+    __slots__ = ()
 
     def __init__(self, name : str, aliases : List[str], handlingMultiplier : float = 1, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
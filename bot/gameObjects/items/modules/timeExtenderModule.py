@@ -14,6 +14,7 @@ class TimeExtenderModule(moduleItem.ModuleItem):
     :var duration: The perceived duration in seconds of the effect from the perspective of the pilot
     :vartype duration: float
     """
+    __slots__ = ("effect", "duration")
 
     def __init__(self, name : str, aliases : List[str], effect : float = 1, duration : float = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
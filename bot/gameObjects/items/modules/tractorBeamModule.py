@@ -12,6 +12,7 @@ class TractorBeamModule(moduleItem.ModuleItem):
     :var timeToLock: The amount of time in seconds needed for the beam to lock onto an item and pull it into the hold
     :vartype timeToLock: float
     """
+    __slots__ = ("timeToLock",)
 
     def __init__(self, name : str, aliases : List[str], timeToLock : float = 0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
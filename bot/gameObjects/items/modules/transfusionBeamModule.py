@@ -14,6 +14,7 @@ class TransfusionBeamModule(moduleItem.ModuleItem):
     :var count: The number of ships from which health may be stolen simultaneously
     :vartype count: int
     """
+    __slots__ = ("HPps", "count")
 
     def __init__(self, name : str, aliases : List[str], HPps : float = 0, count : int = 0,
             value : int = 0, wiki : str = "", manufacturer : str = "", icon : str = "",
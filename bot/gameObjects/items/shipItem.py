@@ -1,6 +1,6 @@
 # Typing imports
 from __future__ import annotations
-from typing import List, Union, TYPE_CHECKING
+from typing import Dict, List, Union, TYPE_CHECKING
 if TYPE_CHECKING:
     from .modules import moduleItem
 
@@ -12,6 +12,63 @@ from ...cfg import cfg, bbData
 from ... import lib
 
 
+# The attributes of a Ship that are held by its ShipTemplate
+templateStats = ("name", "aliases", "wiki", "manufacturer", "icon", "emoji", "value", "shopSpawnRate", "techLevel", "builtIn",
+                    "armour", "cargo", "maxSecondaries", "handling", "maxPrimaries", "maxTurrets", "maxModules")
+
+# The template shared by all ships of each builtIn model, by ship name. Populated as ships of each model are created.
+builtInTemplates : Dict[str, ShipTemplate] = {}
+
+
+class ShipTemplate:
+    """The static stats of a ship, such as its armour, value and slot counts, as opposed to per-ship state such as its
+    equipped items, nickname and skin.
+    All ships of the same builtIn model share one template, which must not be modified. Custom spawned ships, and
+    builtIn ships whose stats have been changed, own a template of their own.
+
+    Holds one attribute for each name in templateStats. The attributes are documented in Ship.
+    """
+    __slots__ = templateStats
+
+    def copy(self) -> ShipTemplate:
+        """Create a new template with the same stats as this one.
+
+        :return: A new ShipTemplate with the same stats as this one
+        :rtype: ShipTemplate
+        """
+        newTemplate = ShipTemplate()
+        for stat in templateStats:
+            setattr(newTemplate, stat, getattr(self, stat))
+        newTemplate.aliases = list(self.aliases)
+        return newTemplate
+
+
+def _templateStat(stat : str, copyStat : bool = False) -> property:
+    """Create a Ship property reading one of the ship's stats from its template.
+    Setting the property on a ship that shares its template first gives the ship its own copy of the template.
+
+    :param str stat: The name of the stat, from templateStats
+    :param bool copyStat: Whether the stat is a mutable list, to be copied when read and assigned, so that modifying the
+                            list read from one ship cannot modify a template shared with other ships (Default False)
+    :return: A property getting and setting stat in the ship's template
+    :rtype: property
+    """
+    if copyStat:
+        def getStat(ship : Ship):
+            return list(getattr(ship.template, stat))
+    else:
+        def getStat(ship : Ship):
+            return getattr(ship.template, stat)
+
+    def setStat(ship : Ship, value):
+        if not ship.ownsTemplate:
+            ship.template = ship.template.copy()
+            ship.ownsTemplate = True
+        setattr(ship.template, stat, list(value) if copyStat else value)
+
+    return property(getStat, setStat, doc="This ship's " + stat + ", held by its template")
+
+
 @spawnableItem
 class Ship(GameItem):
     """An equippable and customisable ship for use by players and NPCs.
@@ -53,7 +110,36 @@ class Ship(GameItem):
     :vartype upgradesApplied: list[shipUpgrade]
     :var skin: The name of the skin applied to this ship
     :vartype skin: str
+    :var changeListener: Called with this ship and the change in its value whenever items are equipped or unequipped,
+                            or an upgrade is applied, e.g to update an owning user's cached value. None for no listener.
+    :vartype changeListener: Callable[[Ship, int or float], None] or None
+    :var template: Holds this ship's static stats, as listed in templateStats. Shared between builtIn ships of the same
+                    model, and copied before the first change to any of this ship's stats.
+    :vartype template: ShipTemplate
+    :var ownsTemplate: Whether template belongs to this ship only, and so may be modified
+    :vartype ownsTemplate: bool
     """
+    __slots__ = ("template", "ownsTemplate", "weapons", "modules", "turrets", "nickname", "upgradesApplied", "skin",
+                    "changeListener")
+
+    name = _templateStat("name")
+    # Reading aliases gives a copy of the template's list. Use addAlias and removeAlias, or assign a new list, to change them.
+    aliases = _templateStat("aliases", copyStat=True)
+    wiki = _templateStat("wiki")
+    manufacturer = _templateStat("manufacturer")
+    icon = _templateStat("icon")
+    emoji = _templateStat("emoji")
+    value = _templateStat("value")
+    shopSpawnRate = _templateStat("shopSpawnRate")
+    techLevel = _templateStat("techLevel")
+    builtIn = _templateStat("builtIn")
+    armour = _templateStat("armour")
+    cargo = _templateStat("cargo")
+    maxSecondaries = _templateStat("maxSecondaries")
+    handling = _templateStat("handling")
+    maxPrimaries = _templateStat("maxPrimaries")
+    maxTurrets = _templateStat("maxTurrets")
+    maxModules = _templateStat("maxModules")
 
     def __init__(self, name : str, maxPrimaries : int, maxTurrets : int,
                     maxModules : int, manufacturer : str = "", armour : int = 0,
@@ -62,7 +148,8 @@ class Ship(GameItem):
                     modules : List[moduleItem.ModuleItem] = [], turrets : List[turretWeapon.TurretWeapon] = [],
                     wiki : str = "", upgradesApplied : List[shipUpgrade.ShipUpgrade] = [], nickname : str = "",
                     icon : str = "", emoji : lib.emojis.BasedEmoji = lib.emojis.BasedEmoji.EMPTY, techLevel : int = -1,
-                    shopSpawnRate : float = 0, builtIn : bool = False, skin : str = ""):
+                    shopSpawnRate : float = 0, builtIn : bool = False, skin : str = "",
+                    template : ShipTemplate = None):
         """
         :param str name: A name to uniquely identify this model of ship.
         :param str nickname: A custom name for this ship, assigned by the owning player
@@ -97,47 +184,112 @@ class Ship(GameItem):
         :param float shopSpawnRate: A pre-calculated float indicating the highest spawn rate of this ship
                                     (i.e its spawn probability for a shop of the same techLevel) (Default 0)
         :param str skin: The name of the skin applied to the ship
+        :param ShipTemplate template: A template to share the static stats of, instead of creating a new template from the
+                                        given stats. The stats given as arguments are ignored if this is given.
+                                        (Default None)
         """
-        super(Ship, self).__init__(name, aliases, value=value, wiki=wiki, manufacturer=manufacturer, icon=icon, emoji=emoji,
-                                        techLevel=techLevel, builtIn=builtIn)
+        if template is not None:
+            # The template's stats were validated when it was created
+            self.template = template
+            self.ownsTemplate = False
+        else:
+            self.template = ShipTemplate()
+            self.ownsTemplate = True
+            super(Ship, self).__init__(name, aliases, value=value, wiki=wiki, manufacturer=manufacturer, icon=icon,
+                                            emoji=emoji, techLevel=techLevel, builtIn=builtIn)
+
+            # if self.name in bbData.builtInShipData:
+            #     self.shopSpawnRate = bbData.shipKeySpawnRates[self.name]
+            # else:
+            #     self.shopSpawnRate = 0
+
+            self.armour = armour
+            self.cargo = cargo
+            self.maxSecondaries = maxSecondaries
+            self.handling = handling
+
+            self.maxPrimaries = maxPrimaries
+            self.maxTurrets = maxTurrets
+            self.maxModules = maxModules
+
+            self.shopSpawnRate = shopSpawnRate
 
         # TODO: Log to bbLogger in these cases
-        if len(weapons) > maxPrimaries:
+        if len(weapons) > self.maxPrimaries:
             ValueError("passed more weapons than can be stored on this ship - maxPrimaries")
-        if len(modules) > maxModules:
+        if len(modules) > self.maxModules:
             ValueError("passed more modules than can be stored on this ship - maxModules")
-        if len(turrets) > maxTurrets:
+        if len(turrets) > self.maxTurrets:
             ValueError("passed more turrets than can be stored on this ship - maxTurrets")
 
-        # if self.name in bbData.builtInShipData:
-        #     self.shopSpawnRate = bbData.shipKeySpawnRates[self.name]
-        # else:
-        #     self.shopSpawnRate = 0
-
-        self.armour = armour
-        self.cargo = cargo
-        self.maxSecondaries = maxSecondaries
-        self.handling = handling
-
-        self.maxPrimaries = maxPrimaries
-        self.maxTurrets = maxTurrets
-        self.maxModules = maxModules
-
         self.weapons = weapons
         self.modules = modules
         self.turrets = turrets
 
-        self.nickname = ""
-        self.hasNickname = False
-        if nickname != "":
-            self.changeNickname(nickname)
+        self.nickname = nickname
 
         self.upgradesApplied = upgradesApplied
 
-        self.shopSpawnRate = shopSpawnRate
-
         self.skin = skin
-        self.isSkinned = skin != ""
+
+        self.changeListener = None
+
+
+    @property
+    def hasNickname(self) -> bool:
+        """Whether or not this ship has a nickname
+        """
+        return self.nickname != ""
+
+
+    @property
+    def isSkinned(self) -> bool:
+        """Whether or not this ship has a skin applied
+        """
+        return self.skin != ""
+
+
+    def isCalled(self, name : str) -> bool:
+        """Decide whether the provided name is one of this ship's aliases.
+        Reads the template's aliases directly, rather than copying them.
+
+        :param str name: The name to look up in this ship's aliases
+        :return: True if name is either this ship's name, or is one of this ship's aliases.
+        :rtype: bool
+        """
+        return name.lower() == self.name.lower() or name.lower() in self.template.aliases
+
+
+    def removeAlias(self, name : str):
+        """Remove the given name from this ship's aliases. This does not affect the ship's main name.
+        A ship sharing its template is first given its own copy of the template.
+
+        :param str name: The alias to remove
+        """
+        if name.lower() in self.template.aliases:
+            aliases = self.aliases
+            aliases.remove(name.lower())
+            self.aliases = aliases
+
+
+    def addAlias(self, name : str):
+        """Add the given name to this ship's aliases.
+        A ship sharing its template is first given its own copy of the template.
+
+        :param str name: The alias to add
+        """
+        if name.lower() not in self.template.aliases:
+            self.aliases = self.template.aliases + [name.lower()]
+
+
+    def reportValueChange(self, valueChange : Union[int, float]):
+        """Report a change in this ship's value to the ship's changeListener, if it has one.
+
+        :param valueChange: The amount by which the ship's value changed, negative if the value decreased
+        :type valueChange: int or float
+        """
+        if self.changeListener is not None and valueChange != 0:
+            self.changeListener(self, valueChange)
 
 
     def getNumWeaponsEquipped(self) -> int:
@@ -230,6 +382,7 @@ class Ship(GameItem):
         if not self.canEquipMoreWeapons():
             raise OverflowError("Attempted to equip a weapon but all weapon slots are full")
         self.weapons.append(weapon)
+        self.reportValueChange(weapon.getValue())
 
 
     def unequipWeaponObj(self, weapon : primaryWeapon):
@@ -238,6 +391,7 @@ class Ship(GameItem):
         :param primaryWeapon weapon: The weapon object to unequip
         """
         self.weapons.remove(weapon)
+        self.reportValueChange(-weapon.getValue())
 
 
     def unequipWeaponIndex(self, index : int):
@@ -245,7 +399,7 @@ class Ship(GameItem):
 
         :param int index: The index of the weapon to unequip from the ship
         """
-        self.weapons.pop(index)
+        self.reportValueChange(-self.weapons.pop(index).getValue())
 
 
     def getWeaponAtIndex(self, index : int) -> primaryWeapon:
@@ -289,6 +443,7 @@ class Ship(GameItem):
             raise ValueError("Attempted to equip a module of a type that is already at its maximum capacity: " + str(module))
 
         self.modules.append(module)
+        self.reportValueChange(module.getValue())
 
 
     def unequipModuleObj(self, module : moduleItem.ModuleItem):
@@ -297,6 +452,7 @@ class Ship(GameItem):
         :param moduleItem module: The module to unequip
         """
         self.modules.remove(module)
+        self.reportValueChange(-module.getValue())
 
 
     def unequipModuleIndex(self, index : int):
@@ -304,7 +460,7 @@ class Ship(GameItem):
 
         :param int index: The index of the module to unequip
         """
-        self.modules.pop(index)
+        self.reportValueChange(-self.modules.pop(index).getValue())
 
 
     def getModuleAtIndex(self, index : int) -> moduleItem.ModuleItem:
@@ -326,6 +482,7 @@ class Ship(GameItem):
         if not self.canEquipMoreTurrets():
             raise OverflowError("Attempted to equip a turret but all turret slots are full")
         self.turrets.append(turret)
+        self.reportValueChange(turret.getValue())
 
 
     def unequipTurretObj(self, turret : turretWeapon):
@@ -334,6 +491,7 @@ class Ship(GameItem):
         :param turretWeapon turret: The turret object to unequip
         """
         self.turrets.remove(turret)
+        self.reportValueChange(-turret.getValue())
 
 
     def unequipTurretIndex(self, index : int):
@@ -341,7 +499,7 @@ class Ship(GameItem):
 
         :param int index: The index of the turret to unequip from the ship
         """
-        self.turrets.pop(index)
+        self.reportValueChange(-self.turrets.pop(index).getValue())
 
 
     def getTurretAtIndex(self, index : int) -> turretWeapon:
@@ -594,6 +752,7 @@ class Ship(GameItem):
         :param shipUpgrade upgrade: the upgrade to apply
         """
         self.upgradesApplied.append(upgrade)
+        self.reportValueChange(upgrade.valueForShip(self))
 
 
     def changeNickname(self, nickname : str):
@@ -603,16 +762,12 @@ class Ship(GameItem):
         :param str nickname: The new nickname to set
         """
         self.nickname = nickname
-        if nickname != "":
-            self.hasNickname = True
 
 
     def removeNickname(self):
         """Remove the ship's custom nickname, setting BB to display the ship type instead where needed.
         """
-        if self.hasNickname:
-            self.nickname = ""
-            self.hasNickname = False
+        self.nickname = ""
 
 
     def getNameOrNick(self) -> str:
@@ -646,12 +801,16 @@ class Ship(GameItem):
         if not isinstance(other, Ship):
             raise TypeError("Can only transfer items to another shipItem. Given " + str(type(other)))
 
+        # other reports the value it gains as items are equipped, so only the value lost by this ship is counted here
+        transferredValue = 0
         while self.hasWeaponsEquipped() and other.canEquipMoreWeapons():
+            transferredValue += self.weapons[0].getValue()
             other.equipWeapon(self.weapons.pop(0))
 
         leftoverModules = []
         while self.hasModulesEquipped() and other.canEquipMoreModules():
             if other.canEquipModuleType(type(self.modules[0])):
+                transferredValue += self.modules[0].getValue()
                 other.equipModule(self.modules.pop(0))
             else:
                 leftoverModules.append(self.modules.pop(0))
@@ -660,8 +819,11 @@ class Ship(GameItem):
             self.modules.append(leftoverModule)
 
         while self.hasTurretsEquipped() and other.canEquipMoreTurrets():
+            transferredValue += self.turrets[0].getValue()
             other.equipTurret(self.turrets.pop(0))
 
+        self.reportValueChange(-transferredValue)
+
 
     def getActivesByName(self, item : str) -> Union[primaryWeapon.PrimaryWeapon, moduleItem.ModuleItem,
                                                     turretWeapon.TurretWeapon]:
@@ -688,19 +850,25 @@ class Ship(GameItem):
     def clearWeapons(self):
         """Delete all weapons equipped on the ship, without saving them.
         """
+        removedValue = sum(item.getValue() for item in self.weapons)
         self.weapons = []
+        self.reportValueChange(-removedValue)
 
 
     def clearModules(self):
         """Delete all modules equipped on the ship, without saving them.
         """
+        removedValue = sum(item.getValue() for item in self.modules)
         self.modules = []
+        self.reportValueChange(-removedValue)
 
 
     def clearTurrets(self):
         """Delete all turrets equipped on the ship, without saving them.
         """
+        removedValue = sum(item.getValue() for item in self.turrets)
         self.turrets = []
+        self.reportValueChange(-removedValue)
 
 
     def applySkin(self, skin : shipSkin.ShipSkin):
@@ -718,7 +886,6 @@ class Ship(GameItem):
             return TypeError("The given skin is not compatible with this ship")
         self.icon = skin.shipRenders[self.name][0]
         self.skin = skin.name
-        self.isSkinned = True
 
 
     def statsStringShort(self) -> str:
@@ -864,26 +1031,19 @@ class Ship(GameItem):
 
         if shipDict["builtIn"]:
             builtInDict = bbData.builtInShipData[shipDict["name"]]
-
-            builtInWeapons = []
-            if "weapons" in shipDict:
-                for weapon in shipDict["weapons"]:
-                    builtInWeapons.append(primaryWeapon.PrimaryWeapon.fromDict(weapon))
-
-            builtInModules = []
-            if "modules" in shipDict:
-                for module in shipDict["modules"]:
-                    builtInModules.append(moduleItemFactory.fromDict(module))
-
-            builtInTurrets = []
-            if "turrets" in shipDict:
-                for turret in shipDict["turrets"]:
-                    builtInTurrets.append(turretWeapon.TurretWeapon.fromDict(turret))
-
-            builtInShipUpgrades = []
-            if "shipUpgrades" in shipDict:
-                for currentUpgrade in shipDict["shipUpgrades"]:
-                    builtInShipUpgrades.append(shipUpgrade.ShipUpgrade.fromDict(currentUpgrade))
+            # Stats saved with a ship that differ from its model, such as the icon of a skinned ship, need their own template
+            ownsTemplate = any(stat in shipDict and (stat not in builtInDict or shipDict[stat] != builtInDict[stat])
+                                for stat in templateStats if stat != "builtIn")
+
+            if not ownsTemplate and shipDict["name"] in builtInTemplates:
+                template = builtInTemplates[shipDict["name"]]
+                return Ship(template.name, template.maxPrimaries, template.maxTurrets, template.maxModules,
+                            weapons=weapons, modules=modules, turrets=turrets, upgradesApplied=shipUpgrades,
+                            nickname=shipDict["nickname"] if "nickname" in shipDict else (builtInDict["nickname"]
+                                            if "nickname" in builtInDict else ""),
+                            skin=shipDict["skin"] if "skin" in shipDict else builtInDict["skin"] \
+                                            if "skin" in builtInDict else "",
+                            template=template)
 
             newShip = Ship(builtInDict["name"], builtInDict["maxPrimaries"], builtInDict["maxTurrets"],
                         builtInDict["maxModules"],
@@ -900,13 +1060,11 @@ class Ship(GameItem):
                                         if "handling" in builtInDict else 0,
                         value=shipDict["value"] if "value" in shipDict else builtInDict["value"]
                                         if "value" in builtInDict else 0,
-                        aliases=shipDict["aliases"] if "aliases" in shipDict else builtInDict["aliases"]
+                        aliases=list(shipDict["aliases"]) if "aliases" in shipDict else list(builtInDict["aliases"])
                                         if "aliases" in builtInDict else [],
-                        weapons=weapons if "weapons" in shipDict else builtInWeapons,
-                        modules=modules if "modules" in shipDict else builtInModules,
-                        turrets=turrets if "turrets" in shipDict else builtInTurrets,
+                        weapons=weapons, modules=modules, turrets=turrets,
                         wiki=shipDict["wiki"] if "wiki" in shipDict else builtInDict["wiki"] if "wiki" in builtInDict else "",
-                        upgradesApplied=shipUpgrades if "shipUpgrades" in shipDict else builtInShipUpgrades,
+                        upgradesApplied=shipUpgrades,
                         nickname=shipDict["nickname"] if "nickname" in shipDict else (builtInDict["nickname"]
                                         if "nickname" in builtInDict else ""),
                         icon=shipDict["icon"] if "icon" in shipDict else builtInDict["icon"]
@@ -921,6 +1079,10 @@ class Ship(GameItem):
                                         if "shopSpawnRate" in builtInDict else 0,
                         builtIn=True,
                         skin=shipDict["skin"] if "skin" in shipDict else builtInDict["skin"] if "skin" in builtInDict else "")
+            if not ownsTemplate:
+                # Share this ship's stats with all later ships of the same model
+                builtInTemplates[shipDict["name"]] = newShip.template
+                newShip.ownsTemplate = False
             return newShip
 
         else:
@@ -10,6 +10,8 @@ from ....reactionMenus.confirmationReactionMenu import InlineConfirmationMenu
 
 @gameItem.spawnableItem
 class CrateTool(toolItem.ToolItem):
+    __slots__ = ("itemPool",)
+
     def __init__(self, itemPool, name : str = "", value : int = 0, wiki : str = "",
             manufacturer : str = "", icon : str = "", emoji : lib.emojis.BasedEmoji = lib.emojis.BasedEmoji.EMPTY,
             techLevel : int = -1, builtIn : bool = False):
@@ -17,6 +17,8 @@ class ShipSkinTool(toolItem.ToolItem):
     The manufacturer is set to the skin designer.
     This tool is single use. If a calling user is given, the tool is removed from that user's inventory after use.
     """
+    __slots__ = ("skin",)
+
     def __init__(self, skin : shipSkin, value : int = 0, wiki : str = "", icon : str = cfg.defaultShipSkinToolIcon,
             emoji : lib.emojis.BasedEmoji = None, techLevel : int = -1, builtIn : bool = False):
         """
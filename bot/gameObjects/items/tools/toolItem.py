@@ -9,6 +9,9 @@ class ToolItem(gameItem.GameItem):
     """An item that has a function of some kind.
     Intended to be very generic at this level of implementation.
     """
+    __slots__ = ()
+    # Equal custom spawned items share one object and one inventory listing
+    contentIdentity = True
 
     def __init__(self, name : str, aliases : List[str], value : int = 0, wiki : str = "",
             manufacturer : str = "", icon : str = "", emoji : lib.emojis.BasedEmoji = lib.emojis.BasedEmoji.EMPTY,
@@ -1,5 +1,5 @@
 from . import toolItem, shipSkinTool, crateTool
-from .. import shipItem, moduleItemFactory
+from .. import shipItem, moduleItemFactory, gameItem
 from ..weapons import primaryWeapon, turretWeapon
 from .... import lib
 
@@ -7,6 +7,7 @@ from .... import lib
 def fromDict(toolDict : dict) -> toolItem.ToolItem:
     """Construct a toolItem from its dictionary-serialized representation.
     This method decodes which tool constructor is appropriate based on the 'type' attribute of the given dictionary.
+    The constructed tool is interned, so equal custom tools share one object.
 
     :param dict toolDict: A dictionary containing all information needed to construct the required toolItem. Critically,
                             a name, type, and builtIn specifier.
@@ -45,4 +46,4 @@ def fromDict(toolDict : dict) -> toolItem.ToolItem:
 
     if "type" not in toolDict:
         raise NameError("Required dictionary attribute missing: 'type'")
-    return toolTypeConstructors[toolDict["type"]](toolDict)
+    return gameItem.internItem(toolTypeConstructors[toolDict["type"]](toolDict))
@@ -1,4 +1,4 @@
-from ..gameItem import spawnableItem
+from ..gameItem import spawnableItem, internItem
 from ....cfg import bbData
 from .... import lib
 from .weapon import Weapon
@@ -8,11 +8,13 @@ from .weapon import Weapon
 class PrimaryWeapon(Weapon):
     """A primary weapon that can be equipped onto a bbShip for use in duels.
     """
+    __slots__ = ()
 
     @classmethod
     def fromDict(cls, weaponDict, **kwargs):
         """Factory function constructing a new primaryWeapon object from a dictionary serialised
         representation - the opposite of primaryWeapon.toDict.
+        Custom weapons are interned, so equal weapons share one object.
 
         :param dict weaponDict: A dictionary containing all information needed to construct the desired primaryWeapon
         :return: A new primaryWeapon object as described in weaponDict
@@ -21,10 +23,11 @@ class PrimaryWeapon(Weapon):
         if weaponDict["builtIn"]:
             return bbData.builtInWeaponObjs[weaponDict["name"]]
         else:
-            return PrimaryWeapon(weaponDict["name"], weaponDict["aliases"], dps=weaponDict["dps"], value=weaponDict["value"],
-                                    wiki=weaponDict["wiki"] if "wiki" in weaponDict else "",
-                                    manufacturer=weaponDict["manufacturer"] if "manufacturer" in weaponDict else "",
-                                    icon=weaponDict["icon"] if "icon" in weaponDict else bbData.rocketIcon,
-                                    emoji=lib.emojis.BasedEmoji.fromStr(weaponDict["emoji"]) if "emoji" in weaponDict else \
-                                            lib.emojis.BasedEmoji.EMPTY,
-                                    techLevel=weaponDict["techLevel"] if "techLevel" in weaponDict else -1, builtIn=False)
+            weapon = PrimaryWeapon(weaponDict["name"], weaponDict["aliases"], dps=weaponDict["dps"], value=weaponDict["value"],
+                                      wiki=weaponDict["wiki"] if "wiki" in weaponDict else "",
+                                      manufacturer=weaponDict["manufacturer"] if "manufacturer" in weaponDict else "",
+                                      icon=weaponDict["icon"] if "icon" in weaponDict else bbData.rocketIcon,
+                                      emoji=lib.emojis.BasedEmoji.fromStr(weaponDict["emoji"]) if "emoji" in weaponDict else \
+                                              lib.emojis.BasedEmoji.EMPTY,
+                                      techLevel=weaponDict["techLevel"] if "techLevel" in weaponDict else -1, builtIn=False)
+            return internItem(weapon)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from ..gameItem import spawnableItem
+from ..gameItem import spawnableItem, internItem
 from ....cfg import bbData
 from .... import lib
 from .weapon import Weapon
@@ -9,11 +9,13 @@ from .weapon import Weapon
 class TurretWeapon(Weapon):
     """A turret that can be equipped onto a bbShip for use in duels.
     """
+    __slots__ = ()
 
     @classmethod
     def fromDict(cls, turretDict : dict, **kwargs) -> TurretWeapon:
         """Factory function constructing a new turretWeapon object from a dictionary serialised representation -
         the opposite of turretWeapon.toDict.
+        Custom turrets are interned, so equal turrets share one object.
 
         :param dict turretDict: A dictionary containing all information needed to construct the desired turretWeapon
         :return: A new turretWeapon object as described in turretDict
@@ -22,10 +24,11 @@ class TurretWeapon(Weapon):
         if turretDict["builtIn"]:
             return bbData.builtInTurretObjs[turretDict["name"]]
         else:
-            return TurretWeapon(turretDict["name"], turretDict["aliases"], dps=turretDict["dps"], value=turretDict["value"],
-                                wiki=turretDict["wiki"] if "wiki" in turretDict else "",
-                                manufacturer=turretDict["manufacturer"] if "manufacturer" in turretDict else "",
-                                icon=turretDict["icon"] if "icon" in turretDict else bbData.rocketIcon,
-                                emoji=lib.emojis.BasedEmoji.fromStr(turretDict["emoji"]) \
-                                        if "emoji" in turretDict else lib.emojis.BasedEmoji.EMPTY,
-                                techLevel=turretDict["techLevel"] if "techLevel" in turretDict else -1, builtIn=False)
+            turret = TurretWeapon(turretDict["name"], turretDict["aliases"], dps=turretDict["dps"], value=turretDict["value"],
+                                  wiki=turretDict["wiki"] if "wiki" in turretDict else "",
+                                  manufacturer=turretDict["manufacturer"] if "manufacturer" in turretDict else "",
+                                  icon=turretDict["icon"] if "icon" in turretDict else bbData.rocketIcon,
+                                  emoji=lib.emojis.BasedEmoji.fromStr(turretDict["emoji"]) \
+                                          if "emoji" in turretDict else lib.emojis.BasedEmoji.EMPTY,
+                                  techLevel=turretDict["techLevel"] if "techLevel" in turretDict else -1, builtIn=False)
+            return internItem(turret)
@@ -10,6 +10,9 @@ class Weapon(GameItem):
     :var dps: The weapon's damage per second to a target ship.
     :vartype dps: float
     """
+    __slots__ = ("dps",)
+    # Equal custom spawned items share one object and one inventory listing
+    contentIdentity = True
 
     def __init__(self, name : str, aliases : List[str], dps : float = 0.0, value : int = 0,
             wiki : str = "", manufacturer : str = "", icon : str = "",
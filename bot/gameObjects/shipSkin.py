@@ -102,6 +102,8 @@ class ShipSkin(serializable.Serializable):
 
         _saveShip(ship)
         self._save()
+        # Rebuild the ship's info embed from its updated data when it is next requested
+        bbData.infoEmbeds.invalidate("ships", ship)
 
 
     async def removeShip(self, ship, rendersChannel):
@@ -127,6 +129,8 @@ class ShipSkin(serializable.Serializable):
 
         _saveShip(ship)
         self._save()
+        # Rebuild the ship's info embed from its updated data when it is next requested
+        bbData.infoEmbeds.invalidate("ships", ship)
 
 
     @classmethod
@@ -61,6 +61,10 @@ class ShipUpgrade(serializable.Serializable):
     :var builtIn: Whether this upgrade is built into BountyBot (loaded in from bbData) or was custom spawned.
     :vartype builtIn: bool
     """
+    __slots__ = ("name", "shipToUpgradeValueMult", "vendor", "armour", "armourMultiplier", "cargo", "cargoMultiplier",
+                    "maxSecondaries", "maxSecondariesMultiplier", "handling", "handlingMultiplier", "maxPrimaries",
+                    "maxPrimariesMultiplier", "maxTurrets", "maxTurretsMultiplier", "maxModules", "maxModulesMultiplier",
+                    "wiki", "techLevel", "builtIn")
 
     def __init__(self, name : str, shipToUpgradeValueMult : float, armour : int = 0.0, armourMultiplier : float = 1.0,
                     cargo : int = 0, cargoMultiplier : float = 1.0, maxSecondaries : int = 0,
@@ -96,7 +100,6 @@ class ShipUpgrade(serializable.Serializable):
         self.name = name
         self.shipToUpgradeValueMult = shipToUpgradeValueMult
         self.vendor = vendor
-        self.hasVendor = vendor != ""
 
         self.armour = armour
         self.armourMultiplier = armourMultiplier
@@ -120,14 +123,31 @@ class ShipUpgrade(serializable.Serializable):
         self.maxModulesMultiplier = maxModulesMultiplier
 
         self.wiki = wiki
-        self.hasWiki = wiki != ""
-
         self.techLevel = techLevel
-        self.hasTechLevel = techLevel != -1
-
         self.builtIn = builtIn
 
 
+    @property
+    def hasVendor(self) -> bool:
+        """Whether or not this upgrade's vendor attribute is populated
+        """
+        return self.vendor != ""
+
+
+    @property
+    def hasWiki(self) -> bool:
+        """Whether or not this upgrade's wiki attribute is populated
+        """
+        return self.wiki != ""
+
+
+    @property
+    def hasTechLevel(self) -> bool:
+        """Whether or not this ship upgrade has a tech level
+        """
+        return self.techLevel != -1
+
+
     def __eq__(self, other : ShipUpgrade) -> bool:
         """Decide whether two ship upgrades are the same, based purely on their name and object type.
 
@@ -1,2 +1,3 @@
 # Make all lib modules available on package import
-from . import discordUtil, emojis, exceptions, jsonHandler, pathfinding, stringTyping, timeUtil # noqa: F401
+from . import aliasIndex, discordUtil, embedCache, emojis, exceptions, httpRetry, jsonHandler # noqa: F401
+from . import pathfinding, stringTyping, timeUtil # noqa: F401
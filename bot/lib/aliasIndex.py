@@ -0,0 +1,157 @@
+# Typing imports
+from __future__ import annotations
+from typing import Dict, Iterable, List, Set
+
+from collections import Counter
+
+from ..cfg import cfg
+
+
+def trigrams(name : str) -> Set[str]:
+    """Get the set of three character sequences in a name, for fuzzy matching.
+    The name is padded with spaces, so that its first and last characters form trigrams of their own.
+
+    :param str name: The name to split into trigrams. Should already be lower case.
+    :return: The trigrams of name
+    :rtype: set[str]
+    """
+    padded = "  " + name + " "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AliasIndex:
+    """An index of objects by their lower case names and aliases, split into categories such as 'ships' or 'systems'.
+    Names are found in constant time, and names that are not recognised can be matched to similar names
+    using a trigram index, for "did you mean" suggestions.
+    Where an alias of one object is the name of another object in the same category, the name takes precedence.
+
+    :var names: The object with each lower case main name, by category
+    :vartype names: dict[str, dict[str, object]]
+    :var aliases: The object with each lower case alias, by category
+    :vartype aliases: dict[str, dict[str, object]]
+    :var trigramIndex: The set of indexed lower case names and aliases containing each trigram, by category
+    :vartype trigramIndex: dict[str, dict[str, set[str]]]
+    :var numTrigrams: The number of trigrams in each indexed lower case name and alias, by category
+    :vartype numTrigrams: dict[str, dict[str, int]]
+    """
+
+    def __init__(self):
+        self.names : Dict[str, Dict[str, object]] = {}
+        self.aliases : Dict[str, Dict[str, object]] = {}
+        self.trigramIndex : Dict[str, Dict[str, Set[str]]] = {}
+        self.numTrigrams : Dict[str, Dict[str, int]] = {}
+
+
+    def _indexTrigrams(self, category : str, key : str):
+        """Add a lower case name or alias to the trigram index of a category, if it is not already indexed.
+
+        :param str category: The category to index key in
+        :param str key: The lower case name or alias to index
+        """
+        categoryCounts = self.numTrigrams.setdefault(category, {})
+        if key in categoryCounts:
+            return
+        keyTrigrams = trigrams(key)
+        categoryCounts[key] = len(keyTrigrams)
+        categoryIndex = self.trigramIndex.setdefault(category, {})
+        for trigram in keyTrigrams:
+            categoryIndex.setdefault(trigram, set()).add(key)
+
+
+    def add(self, category : str, obj : object, name : str, aliases : Iterable[str] = ()):
+        """Index an object by its name and aliases.
+
+        :param str category: The category to index obj in, e.g 'ships'
+        :param object obj: The object to index. Must have a name attribute, used in suggestions.
+        :param str name: The object's main name
+        :param aliases: Alternative names to find the object by (Default ())
+        :type aliases: Iterable[str]
+        """
+        key = name.lower()
+        self.names.setdefault(category, {})[key] = obj
+        self._indexTrigrams(category, key)
+        categoryAliases = self.aliases.setdefault(category, {})
+        for alias in aliases:
+            alias = alias.lower()
+            if alias != key:
+                categoryAliases[alias] = obj
+                self._indexTrigrams(category, alias)
+
+
+    def addAliasable(self, category : str, obj : object):
+        """Index an Aliasable object by its name and aliases.
+
+        :param str category: The category to index obj in, e.g 'ships'
+        :param Aliasable obj: The object to index
+        """
+        self.add(category, obj, obj.name, aliases=obj.aliases)
+
+
+    def get(self, category : str, name : str) -> object:
+        """Find an object by its name or one of its aliases, ignoring case.
+
+        :param str category: The category to search
+        :param str name: The name or alias to look up
+        :return: The object called name, or None if no object in category is called name
+        :rtype: object or None
+        """
+        key = name.lower()
+        if category in self.names and key in self.names[category]:
+            return self.names[category][key]
+        if category in self.aliases:
+            return self.aliases[category].get(key, None)
+        return None
+
+
+    def suggest(self, category : str, name : str, maxSuggestions : int = None, minSimilarity : float = None) -> List[str]:
+        """Find the main names of the objects with names or aliases most similar to the given name, e.g to suggest in place
+        of a name that was not recognised.
+        Similarity is the number of trigrams shared by the two names, divided by the number of distinct trigrams in either.
+
+        :param str category: The category to search
+        :param str name: The name to find similar names to
+        :param int maxSuggestions: The maximum number of names to return (Default cfg.maxNameSuggestions)
+        :param float minSimilarity: The minimum similarity of a suggested name, between 0 and 1
+                                    (Default cfg.nameSuggestionMinSimilarity)
+        :return: Up to maxSuggestions main names of objects in category, most similar first
+        :rtype: list[str]
+        """
+        if maxSuggestions is None:
+            maxSuggestions = cfg.maxNameSuggestions
+        if minSimilarity is None:
+            minSimilarity = cfg.nameSuggestionMinSimilarity
+        if category not in self.trigramIndex:
+            return []
+        nameTrigrams = trigrams(name.lower())
+        categoryIndex = self.trigramIndex[category]
+        sharedCounts = Counter()
+        for trigram in nameTrigrams:
+            if trigram in categoryIndex:
+                sharedCounts.update(categoryIndex[trigram])
+
+        categoryCounts = self.numTrigrams[category]
+        similarities = sorted(((shared / (len(nameTrigrams) + categoryCounts[key] - shared), key)
+                                for key, shared in sharedCounts.items()), key=lambda match: (-match[0], match[1]))
+        suggestions = []
+        for similarity, key in similarities:
+            if similarity < minSimilarity or len(suggestions) == maxSuggestions:
+                break
+            # Several aliases of one object may match
+            mainName = self.get(category, key).name
+            if mainName not in suggestions:
+                suggestions.append(mainName)
+        return suggestions
+
+
+    def suggestionStr(self, category : str, name : str) -> str:
+        """Build a "did you mean" message suggesting names similar to an unrecognised name, to add to an error message.
+
+        :param str category: The category to search
+        :param str name: The unrecognised name
+        :return: A new line followed by the suggested names, or the empty string if no names are similar to name
+        :rtype: str
+        """
+        suggestions = self.suggest(category, name)
+        if not suggestions:
+            return ""
+        return "\nDid you mean " + ", ".join("**" + suggestion + "**" for suggestion in suggestions) + "?"
@@ -5,7 +5,7 @@ if TYPE_CHECKING:
     from ..users import basedUser, basedGuild
     from ..gameObjects.bounties import criminal
 
-from . import stringTyping, emojis, exceptions
+from . import stringTyping, emojis, exceptions, httpRetry
 from .. import botState
 from discord import Embed, Colour, HTTPException, Forbidden, RawReactionActionEvent, User
 from discord import DMChannel, GroupChannel, TextChannel
@@ -23,18 +23,20 @@ def findBUserDCGuild(user : basedUser.BasedUser) -> Union[Guild, None]:
     """
     if user.hasLastSeenGuildId:
         lastSeenGuild = botState.client.get_guild(user.lastSeenGuildId)
-        if lastSeenGuild is None or lastSeenGuild.get_member(user.id) is None:
+        if lastSeenGuild is None or not botState.guildMembership.isMember(lastSeenGuild.id, user.id):
             user.hasLastSeenGuildId = False
         else:
             return lastSeenGuild
 
     if not user.hasLastSeenGuildId:
-        for guild in botState.guildsDB.guilds.values():
-            lastSeenGuild = botState.client.get_guild(guild.id)
-            if lastSeenGuild is not None and lastSeenGuild.get_member(user.id) is not None:
-                user.lastSeenGuildId = guild.id
-                user.hasLastSeenGuildId = True
-                return lastSeenGuild
+        # Only check the guilds that the user is a member of
+        for guildID in botState.guildMembership.guildsOf(user.id):
+            if botState.guildsDB.idExists(guildID):
+                lastSeenGuild = botState.client.get_guild(guildID)
+                if lastSeenGuild is not None:
+                    user.lastSeenGuildId = guildID
+                    user.hasLastSeenGuildId = True
+                    return lastSeenGuild
     return None
 
 
@@ -272,63 +274,91 @@ async def endLongProcess(message: Message):
         pass
 
 
+def emojiFromRaw(payload: RawReactionActionEvent) -> Union[emojis.BasedEmoji, None]:
+    """Convert the emoji of a RawReactionActionEvent payload to a BasedEmoji, without making any API calls.
+
+    :param RawReactionActionEvent payload: Payload describing the reaction action
+    :return: The emoji that changed, or None if it is a custom emoji that the client cannot access
+    :rtype: BasedEmoji or None
+    """
+    try:
+        return emojis.BasedEmoji.fromPartial(payload.emoji, rejectInvalid=True)
+    except exceptions.UnrecognisedCustomEmoji:
+        return None
+
+
+async def reactingUserFromRaw(payload: RawReactionActionEvent) -> Union[User, Member, None]:
+    """Retrieve the user who completed the action described by a RawReactionActionEvent payload.
+    The user is found in the client's cache where possible. At most one API call is made,
+    to fetch the reacting member if they are not cached.
+
+    :param RawReactionActionEvent payload: Payload describing the reaction action
+    :return: The user who completed the action, or None if they could not be found
+    :rtype: Union[User, Member, None]
+    """
+    # If a reacting member was given, no lookup is needed
+    if payload.member is not None:
+        return payload.member
+
+    # Get the channel containing the reacted message
+    if payload.guild_id is None:
+        channel = botState.client.get_channel(payload.channel_id)
+    else:
+        guild = botState.client.get_guild(payload.guild_id)
+        if guild is None:
+            return None
+        channel = guild.get_channel(payload.channel_id)
+
+    # Individual handling for each channel type for efficiency
+    if isinstance(channel, DMChannel):
+        if channel.recipient.id == payload.user_id:
+            return channel.recipient
+        return channel.me
+    elif isinstance(channel, GroupChannel):
+        # Group channels should be small and far between, so iteration is fine here.
+        for currentUser in channel.recipients:
+            if currentUser.id == payload.user_id:
+                return currentUser
+        return channel.me
+    # Guild text channels
+    elif isinstance(channel, TextChannel):
+        member = channel.guild.get_member(payload.user_id)
+        if member is None:
+            # Fetch the uncached member (api call)
+            try:
+                member = await httpRetry.retryHTTP(lambda: channel.guild.fetch_member(payload.user_id))
+            except (HTTPException, exceptions.CircuitBreakerOpen):
+                return None
+        return member
+    return None
+
+
 async def reactionFromRaw(payload: RawReactionActionEvent) -> Tuple[Message, Union[User, Member], emojis.BasedEmoji]:
     """Retrieve complete Reaction and user info from a RawReactionActionEvent payload.
+    If the reacted message is a reaction menu, the menu's message is used. Otherwise, the message is fetched.
+    To handle reactions to reaction menus only, prefer emojiFromRaw and reactingUserFromRaw, which avoid fetching
+    the message.
 
     :param RawReactionActionEvent payload: Payload describing the reaction action
     :return: The message whose reactions changed, the user who completed the action, and the emoji that changed.
     :rtype: Tuple[Message, Union[User, Member], BasedEmoji]
     """
-    emoji = None
-    user = None
-    message = None
-
-    if payload.member is None:
-        # Get the channel containing the reacted message
-        if payload.guild_id is None:
-            channel = botState.client.get_channel(payload.channel_id)
-        else:
-            guild = botState.client.get_guild(payload.guild_id)
-            if guild is None:
-                return None, None, None
-            channel = guild.get_channel(payload.channel_id)
-
-        # Individual handling for each channel type for efficiency
-        if isinstance(channel, DMChannel):
-            if channel.recipient.id == payload.user_id:
-                user = channel.recipient
-            else:
-                user = channel.me
-        elif isinstance(channel, GroupChannel):
-            # Group channels should be small and far between, so iteration is fine here.
-            for currentUser in channel.recipients:
-                if currentUser.id == payload.user_id:
-                    user = currentUser
-                if user is None:
-                    user = channel.me
-        # Guild text channels
-        elif isinstance(channel, TextChannel):
-            user = channel.guild.get_member(payload.user_id)
-        else:
-            return None, None, None
+    emoji = emojiFromRaw(payload)
+    if emoji is None:
+        return None, None, None
+    user = await reactingUserFromRaw(payload)
+    if user is None:
+        return None, None, None
 
+    if payload.message_id in botState.reactionMenusDB:
+        message = botState.reactionMenusDB[payload.message_id].msg
+    else:
+        channel = botState.client.get_channel(payload.channel_id)
+        if channel is None:
+            return None, None, None
         # Fetch the reacted message (api call)
         message = await channel.fetch_message(payload.message_id)
 
-    # If a reacting member was given, the guild can be inferred from the member.
-    else:
-        user = payload.member
-        message = await payload.member.guild.get_channel(payload.channel_id).fetch_message(payload.message_id)
-
-    if message is None:
-        return None, None, None
-
-    # Convert reacted emoji to BasedEmoji
-    try:
-        emoji = emojis.BasedEmoji.fromPartial(payload.emoji, rejectInvalid=True)
-    except exceptions.UnrecognisedCustomEmoji:
-        return None, None, None
-
     return message, user, emoji
 
 
@@ -0,0 +1,62 @@
+# Typing imports
+from __future__ import annotations
+from typing import Callable, Dict, Tuple
+
+from discord import Embed
+
+
+class EmbedCache:
+    """A cache of embeds describing game objects, such as those sent by the info commands.
+    Each embed is built the first time it is requested, and reused until it is invalidated, e.g because the object it
+    describes has changed. Cached embeds are sent in many messages, and must not be modified.
+
+    Embeds are keyed by the category of the object they describe (e.g 'ships'), the object's name, and the command prefix
+    shown in the embed. Embeds that do not show a command prefix are cached once, under a prefix of None.
+
+    :var embeds: The cached embeds, by category, object name and command prefix
+    :vartype embeds: dict[tuple[str, str, str or None], discord.Embed]
+    """
+
+    def __init__(self):
+        self.embeds : Dict[Tuple[str, str, str], Embed] = {}
+
+
+    def get(self, category : str, name : str, buildFunc : Callable[[], Embed], prefix : str = None) -> Embed:
+        """Get the cached embed describing an object, building and caching it if it has not yet been built.
+
+        :param str category: The category of the object, e.g 'ships'
+        :param str name: The object's name
+        :param buildFunc: Builds a new embed describing the object. Only called if the embed is not already cached.
+        :type buildFunc: Callable[[], discord.Embed]
+        :param str prefix: The command prefix shown in the embed, or None if the embed does not show one (Default None)
+        :return: The embed describing the object
+        :rtype: discord.Embed
+        """
+        key = (category, name, prefix)
+        if key not in self.embeds:
+            self.embeds[key] = buildFunc()
+        return self.embeds[key]
+
+
+    def invalidate(self, category : str = None, name : str = None):
+        """Remove cached embeds, so that they are rebuilt when next requested.
+        Give a category to remove only the embeds of that category, and a name to remove only the embeds of that object.
+
+        :param str category: The category of embeds to remove, or None to remove embeds of all categories (Default None)
+        :param str name: The name of the object to remove embeds of, or None to remove embeds of all objects in category.
+                            Ignored if category is None. (Default None)
+        """
+        if category is None:
+            self.embeds.clear()
+        else:
+            for key in [key for key in self.embeds if key[0] == category and (name is None or key[1] == name)]:
+                del self.embeds[key]
+
+
+    def __len__(self) -> int:
+        """Get the number of cached embeds.
+
+        :return: The number of cached embeds
+        :rtype: int
+        """
+        return len(self.embeds)
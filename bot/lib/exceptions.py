@@ -35,3 +35,18 @@ class InvalidGameObjectFolder(Exception):
         super().__init__("Invalid game object configuration folder (" + reason + "): " + filePath)
         self.filePath = filePath
         self.reason = reason
+
+
+class CircuitBreakerOpen(Exception):
+    """Raised by lib.httpRetry.retryHTTP when a call is rejected because its channel's circuit breaker is open.
+
+    :var channelID: The ID of the channel whose circuit breaker is open
+    :vartype channelID: int
+    """
+
+    def __init__(self, channelID: int):
+        """
+        :param int channelID: The ID of the channel whose circuit breaker is open
+        """
+        super().__init__("Circuit breaker open for channel #" + str(channelID))
+        self.channelID = channelID
@@ -0,0 +1,197 @@
+"""Shared retry policy for discord HTTP calls.
+Retries use exponential backoff with full jitter, so that calls failing together do not retry together.
+Retries across the whole bot are limited by a budget per time window, and each channel has a circuit breaker which
+stops calls to that channel for a while after repeated failures.
+"""
+# Typing imports
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Dict
+
+from collections import deque
+import asyncio
+import random
+import time
+
+from discord import HTTPException, Forbidden, NotFound
+
+from .. import botState
+from ..cfg import cfg
+from . import exceptions
+
+
+class RetryBudget:
+    """Limits the total number of retries allowed within a sliding time window.
+
+    :var maxRetries: The maximum number of retries allowed within windowSeconds
+    :vartype maxRetries: int
+    :var windowSeconds: The length of the sliding window, in seconds
+    :vartype windowSeconds: float
+    :var retryTimes: The time.monotonic times of all retries within the current window, oldest first
+    :vartype retryTimes: collections.deque[float]
+    """
+
+    def __init__(self, maxRetries : int, windowSeconds : float):
+        """
+        :param int maxRetries: The maximum number of retries allowed within windowSeconds
+        :param float windowSeconds: The length of the sliding window, in seconds
+        """
+        self.maxRetries = maxRetries
+        self.windowSeconds = windowSeconds
+        self.retryTimes = deque()
+
+
+    def tryAcquire(self, now : float) -> bool:
+        """Spend one retry from the budget, if any remain in the current window.
+
+        :param float now: The current time.monotonic time
+        :return: True if the retry is allowed, False if the budget is exhausted
+        :rtype: bool
+        """
+        while self.retryTimes and self.retryTimes[0] <= now - self.windowSeconds:
+            self.retryTimes.popleft()
+        if len(self.retryTimes) >= self.maxRetries:
+            return False
+        self.retryTimes.append(now)
+        return True
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures of calls to a single channel.
+    After failureThreshold consecutive failures the breaker opens, and calls are rejected without being attempted.
+    Once resetSeconds have passed, a trial call is allowed through. The breaker closes if it succeeds, and re-opens if
+    it fails.
+
+    :var failureThreshold: The number of consecutive failures which opens the breaker
+    :vartype failureThreshold: int
+    :var resetSeconds: The number of seconds to reject calls for, once the breaker is open
+    :vartype resetSeconds: float
+    :var consecutiveFailures: The number of calls that have failed since the last success
+    :vartype consecutiveFailures: int
+    :var openedAt: The time.monotonic time that the breaker last opened, or None if the breaker is closed
+    :vartype openedAt: float or None
+    """
+
+    def __init__(self, failureThreshold : int, resetSeconds : float):
+        """
+        :param int failureThreshold: The number of consecutive failures which opens the breaker
+        :param float resetSeconds: The number of seconds to reject calls for, once the breaker is open
+        """
+        self.failureThreshold = failureThreshold
+        self.resetSeconds = resetSeconds
+        self.consecutiveFailures = 0
+        self.openedAt = None
+
+
+    def allowsCall(self, now : float) -> bool:
+        """Decide whether a call may currently be attempted.
+
+        :param float now: The current time.monotonic time
+        :return: False if the breaker is open and resetSeconds have not yet passed, True otherwise
+        :rtype: bool
+        """
+        return self.openedAt is None or now - self.openedAt >= self.resetSeconds
+
+
+    def recordFailure(self, now : float) -> bool:
+        """Record a failed call, opening the breaker if failureThreshold has been reached.
+
+        :param float now: The current time.monotonic time
+        :return: True if this failure opened the breaker, False otherwise
+        :rtype: bool
+        """
+        self.consecutiveFailures += 1
+        if self.consecutiveFailures >= self.failureThreshold:
+            self.openedAt = now
+            return True
+        return False
+
+
+# Retries shared by all HTTP calls. Created on first use, as cfg is not yet loaded when this module is imported.
+retryBudget : RetryBudget = None
+# Circuit breakers for channels with recent failures, by channel ID. Breakers are discarded on success.
+circuitBreakers : Dict[int, CircuitBreaker] = {}
+# Counters describing retry behaviour since startup
+counters = {"retries": 0, "budgetExhausted": 0, "breakerTrips": 0, "breakerRejections": 0}
+
+
+def isRetryable(e : HTTPException) -> bool:
+    """Decide whether a failed HTTP call is worth retrying.
+    Server errors and rate limits may succeed later, but other client errors (e.g Forbidden and NotFound) will not.
+
+    :param discord.HTTPException e: The exception raised by the failed call
+    :return: True if the call should be retried, False otherwise
+    :rtype: bool
+    """
+    if isinstance(e, (Forbidden, NotFound)):
+        return False
+    return e.status is None or e.status >= 500 or e.status == 429
+
+
+def backoffSeconds(attempt : int) -> float:
+    """Get a random delay to wait before retrying, using exponential backoff with full jitter.
+
+    :param int attempt: The number of retries already made for this call
+    :return: A delay between 0 and min(cfg.httpErrRetryMaxDelaySeconds, cfg.httpErrRetryBaseDelaySeconds * 2 ** attempt)
+    :rtype: float
+    """
+    return random.uniform(0, min(cfg.httpErrRetryMaxDelaySeconds, cfg.httpErrRetryBaseDelaySeconds * 2 ** attempt))
+
+
+async def retryHTTP(call : Callable[[], Awaitable[Any]], channelID : int = None, maxRetries : int = None) -> Any:
+    """Await a discord HTTP call, retrying it if it fails with a retryable HTTPException.
+    call is called once per attempt, so must create a new awaitable each time, e.g `lambda: message.edit(...)`.
+
+    :param call: A function returning the awaitable HTTP call to attempt
+    :param int channelID: The ID of the channel that the call is made to, used to select a circuit breaker.
+                            Give None to call without a circuit breaker. (Default None)
+    :param int maxRetries: The maximum number of times to retry the call. Give None to use cfg.httpErrRetries.
+                            (Default None)
+    :return: The result of the call
+    :raise lib.exceptions.CircuitBreakerOpen: If the channel's circuit breaker is open
+    :raise discord.HTTPException: If the call fails with a non-retryable error, or runs out of retries
+    """
+    global retryBudget
+    if retryBudget is None:
+        retryBudget = RetryBudget(cfg.httpErrRetryBudget, cfg.httpErrRetryBudgetWindowSeconds)
+    if maxRetries is None:
+        maxRetries = cfg.httpErrRetries
+
+    breaker = circuitBreakers.get(channelID)
+    if breaker is not None and not breaker.allowsCall(time.monotonic()):
+        counters["breakerRejections"] += 1
+        raise exceptions.CircuitBreakerOpen(channelID)
+
+    attempt = 0
+    while True:
+        try:
+            result = await call()
+        except HTTPException as e:
+            if not isRetryable(e):
+                raise
+
+            now = time.monotonic()
+            if channelID is not None:
+                if channelID not in circuitBreakers:
+                    circuitBreakers[channelID] = CircuitBreaker(cfg.httpCircuitBreakerThreshold,
+                                                                cfg.httpCircuitBreakerResetSeconds)
+                if circuitBreakers[channelID].recordFailure(now):
+                    counters["breakerTrips"] += 1
+                    botState.logger.log("httpRetry", "retryHTTP", "Circuit breaker opened for channel #" \
+                                        + str(channelID) + " after " + str(circuitBreakers[channelID].consecutiveFailures) \
+                                        + " consecutive failures", eventType="BREAKER_OPEN")
+                    raise
+
+            if attempt >= maxRetries:
+                raise
+            if not retryBudget.tryAcquire(now):
+                counters["budgetExhausted"] += 1
+                raise
+
+            counters["retries"] += 1
+            await asyncio.sleep(backoffSeconds(attempt))
+            attempt += 1
+
+        else:
+            if channelID is not None:
+                circuitBreakers.pop(channelID, None)
+            return result
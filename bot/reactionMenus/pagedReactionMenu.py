@@ -2,7 +2,8 @@ from ..users import basedUser
 from .import reactionMenu
 from discord import Message, Member, Role, Embed
 from .. import lib, botState
-from typing import Dict
+from typing import Dict, Callable, Tuple
+from collections import OrderedDict
 from ..scheduling import timedTask
 from ..cfg import cfg
 
@@ -11,15 +12,32 @@ async def menuJumpToPage(data: dict):
     await botState.reactionMenusDB[data["menuID"]].jumpToPage(data["pageNum"])
 
 
+# A function building the embed and options for the given zero-based page number
+PageProvider = Callable[[int], Tuple[Embed, Dict[lib.emojis.BasedEmoji, reactionMenu.ReactionMenuOption]]]
+
+
 class PagedReactionMenu(reactionMenu.ReactionMenu):
     """A reaction menu that, instead of taking a list of options, takes a list of pages of options.
+    Pages may be given up front as a dictionary, or built on demand by a pageProvider. Pages built by a pageProvider
+    are kept in a small LRU cache, so that only the pages a user actually views are ever built.
+
+    :var pageProvider: A function building the embed and options for the given zero-based page number
+    :vartype pageProvider: PageProvider
+    :var numPages: The number of pages in the menu
+    :vartype numPages: int
+    :var pageCache: Recently built pages, by page number, least recently viewed first
+    :vartype pageCache: collections.OrderedDict[int, tuple[Embed, dict[lib.emojis.BasedEmoji, ReactionMenuOption]]]
+    :var pageCacheSize: The maximum number of built pages to keep in pageCache
+    :vartype pageCacheSize: int
     """
     saveable = False
 
     def __init__(self, msg: Message, pages: Dict[Embed, Dict[lib.emojis.BasedEmoji, reactionMenu.ReactionMenuOption]] = None,
                  timeout: timedTask.TimedTask = None, targetMember: Member = None, targetRole: Role = None,
-                 owningBasedUser: basedUser.BasedUser = None):
-        """
+                 owningBasedUser: basedUser.BasedUser = None, pageProvider: PageProvider = None, numPages: int = 0,
+                 pageCacheSize: int = None):
+        """Give either pages, or pageProvider and numPages.
+
         :param discord.Message msg: the message where this menu is embedded
         :param pages: A dictionary associating embeds with pages, where each page is a dictionary
                         storing all options on that page and their behaviour (Default {})
@@ -30,9 +48,26 @@ class PagedReactionMenu(reactionMenu.ReactionMenu):
         :param discord.Role targetRole: In order to interact with this menu, users must possess this role.
                                             All other reactions are ignored (Default None)
         :param BasedUser owningBasedUser: The user who initiated this menu. No built in behaviour. (Default None)
+        :param PageProvider pageProvider: A function building the embed and options for the given zero-based page number.
+                                            Ignored if pages is given. (Default None)
+        :param int numPages: The number of pages that pageProvider can build. Ignored if pages is given. (Default 0)
+        :param int pageCacheSize: The maximum number of built pages to keep in memory.
+                                    Give None to use cfg.pagedMenuPageCacheSize. (Default None)
+        :raise ValueError: When neither pages nor pageProvider is given
         """
-
-        self.pages = pages if pages is not None else {}
+        if pages is not None:
+            pageEmbeds = list(pages.keys())
+            pageOptions = list(pages.values())
+            self.pageProvider = lambda pageNum: (pageEmbeds[pageNum], pageOptions[pageNum])
+            self.numPages = len(pages)
+        elif pageProvider is not None:
+            self.pageProvider = pageProvider
+            self.numPages = numPages
+        else:
+            raise ValueError("Attempted to create a PagedReactionMenu with neither pages nor a pageProvider")
+
+        self.pageCache = OrderedDict()
+        self.pageCacheSize = pageCacheSize if pageCacheSize is not None else cfg.pagedMenuPageCacheSize
         self.msg = msg
         self.currentPageNum = 0
         self.currentPage = None
@@ -61,11 +96,28 @@ class PagedReactionMenu(reactionMenu.ReactionMenu):
 
         self.onePageControls = {cfg.defaultEmojis.cancel: cancelOption}
 
-        if len(self.pages) == 1:
+        if self.numPages == 1:
             self.currentPageControls = self.onePageControls
         self.updateCurrentPage()
 
 
+    def getPage(self, pageNum: int) -> Tuple[Embed, Dict[lib.emojis.BasedEmoji, reactionMenu.ReactionMenuOption]]:
+        """Get the embed and options for the given page number, building the page if it is not in the page cache.
+        If the cache is full, the least recently viewed page is discarded.
+
+        :param int pageNum: the zero-based index of the page to get
+        :return: The page's embed, and the options on the page
+        :rtype: tuple[discord.Embed, dict[lib.emojis.BasedEmoji, ReactionMenuOption]]
+        """
+        if pageNum in self.pageCache:
+            self.pageCache.move_to_end(pageNum)
+        else:
+            self.pageCache[pageNum] = self.pageProvider(pageNum)
+            if len(self.pageCache) > self.pageCacheSize:
+                self.pageCache.popitem(last=False)
+        return self.pageCache[pageNum]
+
+
     def getMenuEmbed(self) -> Embed:
         """Generate the discord.Embed representing the reaction menu, and that
         should be embedded into the menu's message.
@@ -80,11 +132,11 @@ class PagedReactionMenu(reactionMenu.ReactionMenu):
     def updateCurrentPage(self):
         """Update the menu's options and controls for the current page.
         """
-        self.currentPage = list(self.pages.keys())[self.currentPageNum]
-        self.options = list(self.pages.values())[self.currentPageNum]
+        self.currentPage, pageOptions = self.getPage(self.currentPageNum)
+        self.options = dict(pageOptions)
 
-        if len(self.pages) > 1:
-            if self.currentPageNum == len(self.pages) - 1:
+        if self.numPages > 1:
+            if self.currentPageNum == self.numPages - 1:
                 self.currentPageControls = self.lastPageControls
             elif self.currentPageNum == 0:
                 self.currentPageControls = self.firstPageControls
@@ -100,12 +152,12 @@ class PagedReactionMenu(reactionMenu.ReactionMenu):
 
         :raise RuntimeError: When the current page is the last page
         """
-        if self.currentPageNum == len(self.pages) - 1:
+        if self.currentPageNum == self.numPages - 1:
             raise RuntimeError("Attempted to nextPage while on the last page")
         self.currentPageNum += 1
         self.updateCurrentPage()
         await self.updateMessage(noRefreshOptions=True)
-        if self.currentPageNum == len(self.pages) - 1:
+        if self.currentPageNum == self.numPages - 1:
             self.msg = await self.msg.channel.fetch_message(self.msg.id)
             await self.msg.remove_reaction(cfg.defaultEmojis.next.sendable, botState.client.user)
         if self.currentPageNum == 1:
@@ -125,7 +177,7 @@ class PagedReactionMenu(reactionMenu.ReactionMenu):
         if self.currentPageNum == 0:
             self.msg = await self.msg.channel.fetch_message(self.msg.id)
             await self.msg.remove_reaction(cfg.defaultEmojis.previous.sendable, botState.client.user)
-        if self.currentPageNum == len(self.pages) - 2:
+        if self.currentPageNum == self.numPages - 2:
             await self.msg.add_reaction(cfg.defaultEmojis.next.sendable)
 
 
@@ -135,15 +187,15 @@ class PagedReactionMenu(reactionMenu.ReactionMenu):
         :param int pageNum: the zero-based index of the page to display
         :raise IndexError: If the given page number is out of range
         """
-        if pageNum < 0 or pageNum > len(self.pages) - 1:
+        if pageNum < 0 or pageNum > self.numPages - 1:
             raise IndexError("Page number out of range: " + str(pageNum))
         if pageNum != self.currentPageNum:
             self.currentPageNum = pageNum
             self.updateCurrentPage()
             await self.updateMessage(noRefreshOptions=True)
-            if len(self.pages) > 1:
+            if self.numPages > 1:
                 if self.currentPageNum == 0:
                     self.msg = await self.msg.channel.fetch_message(self.msg.id)
                     await self.msg.remove_reaction(cfg.defaultEmojis.previous.sendable, botState.client.user)
-                if self.currentPageNum != len(self.pages) - 1:
+                if self.currentPageNum != self.numPages - 1:
                     await self.msg.add_reaction(cfg.defaultEmojis.next.sendable)
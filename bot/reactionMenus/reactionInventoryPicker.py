@@ -1,9 +1,10 @@
 from __future__ import annotations
-from . import reactionMenu
+from . import reactionMenu, pagedReactionMenu
 from ..cfg import cfg
 from ..gameObjects.items import gameItem
 from ..gameObjects.inventories import inventory
-from discord import Message, Colour, Member, Role
+from discord import Message, Colour, Member, Role, Embed
+from typing import Dict, Tuple
 from .. import lib
 from ..scheduling import timedTask
 
@@ -60,18 +61,15 @@ class ReactionInventoryPickerOption(reactionMenu.ReactionMenuOption):
         return baseDict
 
 
-class ReactionInventoryPicker(reactionMenu.CancellableReactionMenu):
-    """A reaction menu allowing users to select a gameItem from a inventory.
-    TODO: Implement paging
+class ReactionInventoryPicker(pagedReactionMenu.PagedReactionMenu):
+    """A paged reaction menu allowing users to select a gameItem from a inventory.
+    Each page is only built when it is first viewed, so large inventories open without building every page.
     TODO: Display item counts?
-    TODO: Reimplement as a PagedReactionMenu preset
 
     :var inventory: The inventory to display and select from (TODO: Rename)
     :vartype inventory: inventory
     :var itemsPerPage: The maximum number of items that can be displayed per menu page
     :vartype itemsPerPage: int
-    :var page: The current page the menu is displaying from inventory
-    :vartype page: int
     """
 
     def __init__(self, msg : Message, inventory : inventory.Inventory, itemsPerPage : int = maxItemsPerPage,
@@ -103,22 +101,46 @@ class ReactionInventoryPicker(reactionMenu.CancellableReactionMenu):
             raise ValueError("Tried to instantiate a ReactionItemPicker with more than " + str(maxItemsPerPage) \
                                 + " itemsPerPage (requested " + str(itemsPerPage) + ")")
 
-        # TODO: Does inventory actually need to be stored?
         self.inventory = inventory
         self.itemsPerPage = itemsPerPage
 
-        self.page = 1
-        itemOptions = {}
-        itemPage = inventory.getPage(self.page, self.itemsPerPage)
+        if footerTxt == "" and timeout is not None:
+            footerTxt = "This menu will expire in " + lib.timeUtil.td_format_noYM(timeout.expiryDelta) + "."
+        self.titleTxt = titleTxt
+        self.desc = desc
+        self.col = col if col is not None else Colour.blue()
+        self.footerTxt = footerTxt
+        self.img = img
+        self.thumb = thumb
+        self.icon = icon
+        self.authorName = authorName
+
+        super(ReactionInventoryPicker, self).__init__(msg, timeout=timeout, targetMember=targetMember,
+                                                        targetRole=targetRole, pageProvider=self.makeItemPage,
+                                                        numPages=max(1, inventory.numPages(itemsPerPage)))
+
+
+    def makeItemPage(self, pageNum : int) -> Tuple[Embed, Dict[lib.emojis.BasedEmoji, ReactionInventoryPickerOption]]:
+        """Build the embed and item options for a page of the menu's inventory.
+
+        :param int pageNum: The zero-based index of the page to build
+        :return: The page's embed, and an option for each item on the page
+        :rtype: tuple[discord.Embed, dict[lib.emojis.BasedEmoji, ReactionInventoryPickerOption]]
+        """
+        pageOptions = {}
+        itemPage = self.inventory.getPage(pageNum + 1, self.itemsPerPage) if self.inventory.numKeys > 0 else []
         for itemNum in range(len(itemPage)):
             optionEmoji = cfg.defaultEmojis.menuOptions[itemNum]
-            item = itemPage[itemNum].item
-            itemOptions[optionEmoji] = ReactionInventoryPickerOption(item, self, emoji=optionEmoji)
+            pageOptions[optionEmoji] = ReactionInventoryPickerOption(itemPage[itemNum].item, self, emoji=optionEmoji)
+
+        pageEmbed = lib.discordUtil.makeEmbed(titleTxt=self.titleTxt, desc=self.desc, col=self.col, img=self.img,
+                                                thumb=self.thumb, authorName=self.authorName, icon=self.icon,
+                                                footerTxt="Page " + str(pageNum + 1) + " of " + str(self.numPages) \
+                                                            + (" | " + self.footerTxt if self.footerTxt != "" else ""))
+        for optionEmoji in pageOptions:
+            pageEmbed.add_field(name=optionEmoji.sendable + " : " + pageOptions[optionEmoji].name, value="‎", inline=False)
 
-        super(ReactionInventoryPicker, self).__init__(msg, options=itemOptions, titleTxt=titleTxt, desc=desc, col=col,
-                                                        footerTxt=footerTxt, img=img, thumb=thumb, icon=icon,
-                                                        authorName=authorName, timeout=timeout, targetMember=targetMember,
-                                                        targetRole=targetRole)
+        return pageEmbed, pageOptions
 
 
     def selectItem(self, item : gameItem.GameItem) -> gameItem.GameItem:
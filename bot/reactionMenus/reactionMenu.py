@@ -1,19 +1,36 @@
+from __future__ import annotations
 # TODO: Write a targettable ReactionMenuOption subclass, that implements targetMember and targetRole on a per-option basis.
 # Use this to write ReactionRolePickers with multipleChoice=False!
 
 from ..scheduling.timedTask import TimedTask
 import inspect
-from discord import Embed, Colour, NotFound, HTTPException, Forbidden, Member, User, Message, Role, RawReactionActionEvent
+from discord import Embed, Colour, HTTPException, Forbidden, Member, User, Message, Role, RawReactionActionEvent
 from ..cfg import cfg
 from .. import botState, lib
 from abc import abstractmethod
-from typing import Union, Dict, List
+from typing import Union, Dict, List, Type
 import asyncio
 from types import FunctionType
 from ..baseClasses import serializable
 from . import expiryFunctions
 
 
+# Saveable ReactionMenu subclasses, by class name. ReactionMenuDB uses this to restore saved menus of each type.
+saveableMenuTypes : Dict[str, Type[ReactionMenu]] = {}
+
+
+def saveableMenu(menuType : Type[ReactionMenu]) -> Type[ReactionMenu]:
+    """Class decorator registering a ReactionMenu subclass as saveable, so that saved menus of that type can be restored
+    by reactionMenuDB.fromDict. The subclass must implement toDict and fromDict, and its fromDict must accept the menu's
+    fetched message as the msg kwarg.
+
+    :param menuType: The ReactionMenu subclass to register
+    :return: menuType, unchanged
+    """
+    saveableMenuTypes[menuType.__name__] = menuType
+    return menuType
+
+
 class ReactionMenuOption(serializable.Serializable):
     """An abstract class representing an option in a reaction menu.
     Reaction menu options must have a name and emoji. They may optionally have a function to call when added,
@@ -408,25 +425,60 @@ class ReactionMenu(serializable.Serializable):
 
 
     async def updateMessage(self, noRefreshOptions=False):
-        """Update the menu message by removing all reactions, replacing any existing embed with
-        up to date embed content, and readd all of the menu's option reactions.
+        """Update the menu message by replacing any existing embed with up to date embed content, and making the bot's
+        reactions match the menu's options.
+        Rather than clearing all reactions and re-adding every option, the options are compared against the reactions
+        already on the message. The bot's reactions that are no longer options are removed concurrently, and missing
+        options are added in order. Discord shows reactions in the order they were first added, so if the options
+        already reacted to are not in the same order as the menu's options, all reactions are cleared and re-added instead.
+
+        :param bool noRefreshOptions: Give True to update only the embed, leaving reactions unchanged (Default False)
         """
-        await self.msg.edit(embed=self.getMenuEmbed())
+        channelID = self.msg.channel.id
+        await lib.httpRetry.retryHTTP(lambda: self.msg.edit(embed=self.getMenuEmbed()), channelID)
 
         if not noRefreshOptions:
-            self.msg = await self.msg.channel.fetch_message(self.msg.id)
+            self.msg = await lib.httpRetry.retryHTTP(lambda: self.msg.channel.fetch_message(self.msg.id), channelID)
+            reactionSlots = asyncio.Semaphore(cfg.reactionMenuMaxConcurrentReactionOps)
 
-            try:
-                await self.msg.clear_reactions()
-            except Forbidden:
-                for reaction in self.msg.reactions:
+            async def removeOwnReaction(reaction):
+                async with reactionSlots:
                     try:
-                        await reaction.remove(botState.client.user)
-                    except (HTTPException, NotFound):
+                        await lib.httpRetry.retryHTTP(lambda: reaction.remove(botState.client.user), channelID)
+                    except (HTTPException, lib.exceptions.CircuitBreakerOpen):
                         pass
 
-            for option in self.options:
-                await self.msg.add_reaction(option.sendable)
+            wantedEmojis = list(self.options)
+            staleReactions = []
+            # Option emojis that anyone has reacted with, in message order, and those that the bot has reacted with
+            keptEmojis = []
+            ownEmojis = set()
+            for reaction in self.msg.reactions:
+                try:
+                    reactionEmoji = lib.emojis.BasedEmoji.fromReaction(reaction.emoji, rejectInvalid=True)
+                except lib.exceptions.UnrecognisedCustomEmoji:
+                    reactionEmoji = None
+                if reactionEmoji in self.options:
+                    keptEmojis.append(reactionEmoji)
+                    if reaction.me:
+                        ownEmojis.add(reactionEmoji)
+                elif reaction.me:
+                    staleReactions.append(reaction)
+
+            # Options already on the message must come first and in order, since new reactions are added after them
+            if keptEmojis == wantedEmojis[:len(keptEmojis)]:
+                missingEmojis = [optionEmoji for optionEmoji in wantedEmojis if optionEmoji not in ownEmojis]
+                await asyncio.gather(*(removeOwnReaction(reaction) for reaction in staleReactions))
+
+            else:
+                try:
+                    await lib.httpRetry.retryHTTP(self.msg.clear_reactions, channelID)
+                except Forbidden:
+                    await asyncio.gather(*(removeOwnReaction(reaction) for reaction in self.msg.reactions if reaction.me))
+                missingEmojis = wantedEmojis
+
+            for optionEmoji in missingEmojis:
+                await lib.httpRetry.retryHTTP(lambda: self.msg.add_reaction(optionEmoji.sendable), channelID)
 
 
     async def delete(self):
@@ -632,12 +684,15 @@ class SingleUserReactionMenu(ReactionMenu):
             await botState.client.wait_for("raw_reaction_add", check=self.reactionClosesMenu, timeout=self.timeoutSeconds)
             currentEmbed = self.msg.embeds[0]
             currentEmbed.set_footer(text="This menu has now expired.")
-            await self.msg.edit(embed=currentEmbed)
+            await lib.httpRetry.retryHTTP(lambda: self.msg.edit(embed=currentEmbed), self.msg.channel.id)
         except asyncio.TimeoutError:
-            await self.msg.edit(content="This menu has now expired. Please try the command again.")
+            await lib.httpRetry.retryHTTP(lambda: self.msg.edit(content="This menu has now expired. " \
+                                                                            + "Please try the command again."),
+                                            self.msg.channel.id)
             return []
         else:
-            updatedMsg = await self.msg.channel.fetch_message(self.msg.id)
+            updatedMsg = await lib.httpRetry.retryHTTP(lambda: self.msg.channel.fetch_message(self.msg.id),
+                                                        self.msg.channel.id)
             return [lib.emojis.BasedEmoji.fromReaction(react.emoji) for react in updatedMsg.reactions \
                     if self.targetMember in await react.users().flatten() and \
                     lib.emojis.BasedEmoji.fromReaction(react.emoji) in self.options]
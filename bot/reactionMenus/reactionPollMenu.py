@@ -2,10 +2,10 @@ from __future__ import annotations
 from . import reactionMenu
 from ..cfg import cfg
 from .. import botState, lib
-from discord import Colour, Emoji, PartialEmoji, Message, Embed, User, Member, Role
+from discord import Colour, Message, Embed, User, Member, Role, HTTPException
 from datetime import datetime
 from ..scheduling import timedTask
-from typing import Union
+from typing import Union, Dict, Set
 from ..users import basedUser
 
 
@@ -14,86 +14,41 @@ checkMarkIcon = \
 
 
 async def printAndExpirePollResults(msgID : int):
-    """Menu expiring method specific to ReactionPollMenus. Count the reactions on the menu, selecting only one per user
-    in the case of single-choice mode polls, and replace the menu embed content with a bar chart summarising
-    the results of the poll.
+    """Menu expiring method specific to ReactionPollMenus. Reconcile the menu's vote tally against the menu message,
+    and replace the menu embed content with a bar chart summarising the results of the poll.
 
     :param int msgID: The id of the discord message containing the menu to expire
     """
     menu = botState.reactionMenusDB[msgID]
-    menuMsg = await menu.msg.channel.fetch_message(menu.msg.id)
-    results = {}
 
     if menu.owningBBUser is not None:
         menu.owningBBUser.pollOwned = False
 
-    maxOptionLen = 0
-
-    for option in menu.options.values():
-        results[option] = []
-        if len(option.name) > maxOptionLen:
-            maxOptionLen = len(option.name)
-
-    for reaction in menuMsg.reactions:
-        if type(reaction.emoji) in [Emoji, PartialEmoji]:
-            currentEmoji = lib.emojis.BasedEmoji(id=reaction.emoji.id)
-        else:
-            currentEmoji = lib.emojis.BasedEmoji(unicode=reaction.emoji)
-
-        if currentEmoji is None:
-            botState.logger.log("ReactPollMenu", "prtAndExpirePollResults", "Failed to fetch BasedEmoji for reaction: " \
-                                + str(reaction), category="reactionMenus", eventType="INV_REACT")
-            pollEmbed = menuMsg.embeds[0]
-            pollEmbed.set_footer(text="This poll has ended.")
-            await menu.msg.edit(content="An error occured when calculating the results of this poll. " \
-                                        + "The error has been logged.", embed=pollEmbed)
-            return
+    try:
+        menuMsg = await lib.httpRetry.retryHTTP(lambda: menu.msg.channel.fetch_message(menu.msg.id), menu.msg.channel.id)
+    except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+        botState.logger.log("ReactPollMenu", "prtAndExpirePollResults", "Failed to fetch poll message for reconciliation, " \
+                            + "using vote tally: " + str(msgID), category="reactionMenus", eventType="RECONCILE_FAIL")
+        menuMsg = menu.msg
+    else:
+        await menu.reconcileVotes(menuMsg)
 
-        menuOption = None
-        for currentOption in results:
-            if currentOption.emoji == currentEmoji:
-                menuOption = currentOption
-                break
-
-        if menuOption is None:
-            # botState.logger.log("ReactPollMenu", "prtAndExpirePollResults", "Failed to find menuOption for emoji: " \
-            #                                                                 + str(currentEmoji),
-            #                     category="reactionMenus", eventType="UNKN_OPTN")
-            # pollEmbed = menuMsg.embeds[0]
-            # pollEmbed.set_footer(text="This poll has ended.")
-            # await menu.msg.edit(content="An error occured when calculating the results of this poll. " \
-            #                     + "The error has been logged.", embed=pollEmbed)
-            # return
-            continue
-
-        async for user in reaction.users():
-            if user != botState.client.user:
-                validVote = True
-                if not menu.multipleChoice:
-                    for currentOption in results:
-                        if currentOption.emoji != currentEmoji and user in results[currentOption]:
-                            validVote = False
-                            break
-                if validVote and user not in results[menuOption]:
-                    results[menuOption].append(user)
-                    # print(str(user),"voted for", menuOption.emoji.sendable)
+    maxOptionLen = max(len(option.name) for option in menu.options.values())
 
     pollEmbed = menuMsg.embeds[0]
     pollEmbed.set_footer(text="This poll has ended.")
 
-    maxCount = 0
-    for currentResult in results.values():
-        if len(currentResult) > maxCount:
-            maxCount = len(currentResult)
+    maxCount = max(len(votes) for votes in menu.votes.values())
 
     if maxCount > 0:
         resultsStr = "```\n"
-        for currentOption in results:
-            resultsStr += ("🏆" if len(results[currentOption]) == maxCount else "  ") + currentOption.name \
+        for optionEmoji, currentOption in menu.options.items():
+            numVotes = len(menu.votes[optionEmoji])
+            resultsStr += ("🏆" if numVotes == maxCount else "  ") + currentOption.name \
                             + (" " * (maxOptionLen - len(currentOption.name))) + " | " \
-                            + ("=" * int((len(results[currentOption]) / maxCount) * cfg.pollMenuResultsBarLength)) \
-                            + (" " if len(results[currentOption]) == 0 else "") + " +" + str(len(results[currentOption])) \
-                            + " Vote" + ("s" if len(results[currentOption]) != 1 else "") + "\n"
+                            + ("=" * int((numVotes / maxCount) * cfg.pollMenuResultsBarLength)) \
+                            + (" " if numVotes == 0 else "") + " +" + str(numVotes) \
+                            + " Vote" + ("s" if numVotes != 1 else "") + "\n"
         resultsStr += "```"
 
         pollEmbed.add_field(name="Results", value=resultsStr, inline=False)
@@ -109,11 +64,13 @@ async def printAndExpirePollResults(msgID : int):
         await reaction.remove(menuMsg.guild.me)
 
 
+@reactionMenu.saveableMenu
 class ReactionPollMenu(reactionMenu.ReactionMenu):
     """A saveable reaction menu taking a vote from its participants on a selection of option strings.
     On menu expiry, the menu's TimedTask should call printAndExpirePollResults. This edits to menu embed to provide a summary
-    and bar chart of the votes submitted to the poll. The poll options have no functionality, all vote counting takes place
-    after menu expiry.
+    and bar chart of the votes submitted to the poll. The poll options have no functionality. Instead, votes are tallied
+    as reactions are added and removed, and reconciled against the menu message's reactions on expiry.
+    In single choice polls, each user's vote counts towards the earliest option they are still reacting with.
     TODO: change pollOptions from dict[BasedEmoji, ReactionMenuOption] to dict[BasedEmoji, str] which is used
             to spawn DummyReactionMenuOptions
 
@@ -122,6 +79,13 @@ class ReactionPollMenu(reactionMenu.ReactionMenu):
     :vartype multipleChoice: bool
     :var owningBBUser: The bbUser who started the poll
     :vartype owningBBUser: bbUser
+    :var reactors: The IDs of all users currently reacting with each option's emoji
+    :vartype reactors: dict[lib.emojis.BasedEmoji, set[int]]
+    :var votes: The IDs of the users whose votes count towards each option. For multiple choice polls, this is reactors.
+    :vartype votes: dict[lib.emojis.BasedEmoji, set[int]]
+    :var userReactions: The option emojis that each user is currently reacting with, by user ID, in the order added.
+                        Values are dictionaries with None values, used as insertion-ordered sets.
+    :vartype userReactions: dict[int, dict[lib.emojis.BasedEmoji, None]]
     """
     def __init__(self, msg : Message, pollOptions : dict, timeout : timedTask.TimedTask,
             pollStarter : Union[User, Member] = None, multipleChoice : bool = False, titleTxt : str = "", desc : str = "",
@@ -179,6 +143,105 @@ class ReactionPollMenu(reactionMenu.ReactionMenu):
                                                 timeout=timeout, targetMember=targetMember, targetRole=targetRole)
         self.saveable = True
 
+        self.reactors : Dict[lib.emojis.BasedEmoji, Set[int]] = {optionEmoji: set() for optionEmoji in self.options}
+        self.votes = self.reactors if multipleChoice else {optionEmoji: set() for optionEmoji in self.options}
+        self.userReactions : Dict[int, Dict[lib.emojis.BasedEmoji, None]] = {}
+
+
+    def addVote(self, emoji : lib.emojis.BasedEmoji, userID : int):
+        """Record that a user has reacted with an option's emoji.
+        In single choice polls, the vote only counts if the user is not already voting for another option.
+
+        :param lib.emojis.BasedEmoji emoji: The emoji of the option voted for
+        :param int userID: The ID of the voting user
+        """
+        if userID in self.reactors[emoji]:
+            return
+        self.reactors[emoji].add(userID)
+        if userID not in self.userReactions:
+            self.userReactions[userID] = {}
+        self.userReactions[userID][emoji] = None
+
+        if not self.multipleChoice and len(self.userReactions[userID]) == 1:
+            self.votes[emoji].add(userID)
+
+
+    def removeVote(self, emoji : lib.emojis.BasedEmoji, userID : int):
+        """Record that a user has removed their reaction with an option's emoji.
+        In single choice polls, if this was the user's counted vote, their vote moves to the earliest option they are
+        still reacting with.
+
+        :param lib.emojis.BasedEmoji emoji: The emoji of the option unvoted
+        :param int userID: The ID of the unvoting user
+        """
+        if userID not in self.reactors[emoji]:
+            return
+        self.reactors[emoji].discard(userID)
+        currentReactions = self.userReactions[userID]
+        wasCounted = next(iter(currentReactions)) == emoji
+        del currentReactions[emoji]
+
+        if not self.multipleChoice and wasCounted:
+            self.votes[emoji].discard(userID)
+            if currentReactions:
+                self.votes[next(iter(currentReactions))].add(userID)
+        if not currentReactions:
+            del self.userReactions[userID]
+
+
+    async def reactionAdded(self, emoji : lib.emojis.BasedEmoji, member : Union[Member, User]):
+        """Tally a vote for an option when it is selected by a user.
+        Votes are subject to the menu's targetMember and targetRole, as in ReactionMenu.reactionAdded.
+
+        :param lib.emojis.BasedEmoji emoji: The emoji that member reacted to the menu with
+        :param discord.Member member: The member that added the emoji reaction
+        """
+        if (self.targetMember is None or member == self.targetMember) and \
+                (self.targetRole is None or self.targetRole in member.roles):
+            self.addVote(emoji, member.id)
+
+
+    async def reactionRemoved(self, emoji : lib.emojis.BasedEmoji, member : Union[Member, User]):
+        """Remove a user's vote for an option when it is deselected.
+
+        :param lib.emojis.BasedEmoji emoji: The emoji reaction that member removed from the menu
+        :param discord.Member member: The member that removed the emoji reaction
+        """
+        self.removeVote(emoji, member.id)
+
+
+    async def reconcileVotes(self, menuMsg : Message):
+        """Check the vote tally against the reactions on menuMsg, e.g to account for reactions added while the bot
+        was offline. Reaction counts are compared first, and the users of a reaction are only fetched if its count
+        disagrees with the tally.
+
+        :param discord.Message menuMsg: An up to date copy of the menu's message
+        """
+        for reaction in menuMsg.reactions:
+            try:
+                optionEmoji = lib.emojis.BasedEmoji.fromReaction(reaction.emoji, rejectInvalid=True)
+            except lib.exceptions.UnrecognisedCustomEmoji:
+                continue
+            if optionEmoji not in self.reactors:
+                continue
+
+            numReactors = reaction.count - (1 if reaction.me else 0)
+            if numReactors != len(self.reactors[optionEmoji]):
+                botState.logger.log("ReactPollMenu", "reconcileVotes", "Poll tally disagrees with reactions for option " \
+                                    + optionEmoji.sendable + " (" + str(len(self.reactors[optionEmoji])) + " tallied, " \
+                                    + str(numReactors) + " reacted), fetching reactors: " + str(menuMsg.id),
+                                    category="reactionMenus", eventType="TALLY_MISMATCH", noPrint=True)
+                currentReactors = set()
+                async for user in reaction.users():
+                    if user != botState.client.user and \
+                            (self.targetMember is None or user == self.targetMember) and \
+                            (self.targetRole is None or self.targetRole in getattr(user, "roles", [])):
+                        currentReactors.add(user.id)
+                for userID in self.reactors[optionEmoji] - currentReactors:
+                    self.removeVote(optionEmoji, userID)
+                for userID in currentReactors:
+                    self.addVote(optionEmoji, userID)
+
 
     def getMenuEmbed(self) -> Embed:
         """Generate the discord.Embed representing the reaction menu, and that
@@ -209,6 +272,8 @@ class ReactionPollMenu(reactionMenu.ReactionMenu):
         baseDict = super(ReactionPollMenu, self).toDict(**kwargs)
         baseDict["multipleChoice"] = self.multipleChoice
         baseDict["owningBBUser"] = self.owningBBUser.id
+        baseDict["votes"] = {str(userID): [optionEmoji.sendable for optionEmoji in userReactions] \
+                                for userID, userReactions in self.userReactions.items()}
         return baseDict
 
 
@@ -221,7 +286,7 @@ class ReactionPollMenu(reactionMenu.ReactionMenu):
         :return: A new ReactionPollMenu object as described in rmDict
         :rtype: ReactionPollMenu
         """
-        if "msg" in kwargs:
+        if "msg" not in kwargs:
             raise NameError("Required kwarg not given: msg")
         msg = kwargs["msg"]
 
@@ -233,15 +298,16 @@ class ReactionPollMenu(reactionMenu.ReactionMenu):
         timeoutTT = None
         if "timeout" in rmDict:
             expiryTime = datetime.utcfromtimestamp(rmDict["timeout"])
-            botState.reactionMenusTTDB.scheduleTask(timedTask.TimedTask(expiryTime=expiryTime,
-                                                    expiryFunction=printAndExpirePollResults, expiryFunctionArgs=msg.id))
+            timeoutTT = timedTask.TimedTask(expiryTime=expiryTime, expiryFunction=printAndExpirePollResults,
+                                            expiryFunctionArgs=msg.id)
+            botState.reactionMenusTTDB.scheduleTask(timeoutTT)
 
         if "owningBBUser" in rmDict and botState.usersDB.idExists(rmDict["owningBBUser"]):
             owner = botState.usersDB.getUser(rmDict["owningBBUser"])
         else:
             owner = None
 
-        return ReactionPollMenu(msg, options, timeoutTT,
+        newMenu = ReactionPollMenu(msg, options, timeoutTT,
                                 multipleChoice=rmDict["multipleChoice"] if "multipleChoice" in rmDict else False,
                                 titleTxt=rmDict["titleTxt"] if "titleTxt" in rmDict else "",
                                 desc=rmDict["desc"] if "desc" in rmDict else "",
@@ -256,3 +322,12 @@ class ReactionPollMenu(reactionMenu.ReactionMenu):
                                                 if "targetMember" in rmDict else None,
                                 targetRole=msg.guild.get_role(rmDict["targetRole"]) if "targetRole" in rmDict else None,
                                 owningBBUser=owner)
+
+        # Replay saved votes in the order they were added, to preserve single choice voting
+        for userID, userReactions in rmDict.get("votes", {}).items():
+            for emojiStr in userReactions:
+                optionEmoji = lib.emojis.BasedEmoji.fromStr(emojiStr)
+                if optionEmoji in newMenu.reactors:
+                    newMenu.addVote(optionEmoji, int(userID))
+
+        return newMenu
@@ -91,6 +91,7 @@ class ReactionRolePickerOption(reactionMenu.ReactionMenuOption):
         return {"role": self.role.id}
 
 
+@reactionMenu.saveableMenu
 class ReactionRolePicker(reactionMenu.ReactionMenu):
     """A reaction menu that grants and removes roles when interacted with.
     TODO: replace dcGuild param with extracting msg.guild
@@ -162,7 +163,7 @@ class ReactionRolePicker(reactionMenu.ReactionMenu):
         :return: A new ReactionRolePicker object as described in rmDict
         :rtype: ReactionRolePicker
         """
-        if "msg" in kwargs:
+        if "msg" not in kwargs:
             raise NameError("Required kwarg not given: msg")
         msg = kwargs["msg"]
 
@@ -175,9 +176,9 @@ class ReactionRolePicker(reactionMenu.ReactionMenu):
         timeoutTT = None
         if "timeout" in rmDict:
             expiryTime = datetime.utcfromtimestamp(rmDict["timeout"])
-            botState.reactionMenusTTDB.scheduleTask(timedTask.TimedTask(expiryTime=expiryTime,
-                                                                        expiryFunction=reactionMenu.markExpiredMenu,
-                                                                        expiryFunctionArgs=msg.id))
+            timeoutTT = timedTask.TimedTask(expiryTime=expiryTime, expiryFunction=markExpiredRoleMenu,
+                                            expiryFunctionArgs=msg.id)
+            botState.reactionMenusTTDB.scheduleTask(timeoutTT)
 
 
         return ReactionRolePicker(msg, reactionRoles, dcGuild,
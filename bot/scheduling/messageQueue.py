@@ -0,0 +1,384 @@
+# Typing imports
+from __future__ import annotations
+from typing import List, Dict, Union
+
+from heapq import heappop, heappush
+from itertools import count
+import asyncio
+import time
+import traceback
+
+from discord import abc, Message, HTTPException
+
+from ..cfg import cfg
+from .. import botState, lib
+
+
+class MessagePriority:
+    """The priority classes of outbound messages. Messages with lower values are sent first.
+    Within a priority class, messages are sent in the order that they were queued.
+    """
+    reply = 0
+    announcement = 1
+    broadcast = 2
+
+
+class TokenBucket:
+    """A token bucket rate limiter. The bucket holds up to capacity tokens, and gains refillRate tokens per second.
+    Each send consumes one token, allowing short bursts of up to capacity sends, and an average of refillRate per second.
+
+    :var capacity: The maximum number of tokens the bucket can hold
+    :vartype capacity: float
+    :var refillRate: The number of tokens regained per second
+    :vartype refillRate: float
+    :var tokens: The number of tokens currently in the bucket, as of lastRefill
+    :vartype tokens: float
+    :var lastRefill: The time.monotonic time at which tokens was last updated
+    :vartype lastRefill: float
+    """
+
+    def __init__(self, capacity : float, refillRate : float):
+        """
+        :param float capacity: The maximum number of tokens the bucket can hold. The bucket starts full.
+        :param float refillRate: The number of tokens regained per second
+        """
+        self.capacity = capacity
+        self.refillRate = refillRate
+        self.tokens = capacity
+        self.lastRefill = time.monotonic()
+
+
+    def refill(self, now : float):
+        """Add the tokens gained since lastRefill.
+
+        :param float now: The current time.monotonic time
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.lastRefill) * self.refillRate)
+        self.lastRefill = now
+
+
+    def hasToken(self, now : float) -> bool:
+        """Decide whether a token is currently available.
+
+        :param float now: The current time.monotonic time
+        :return: True if a send is currently allowed, False otherwise
+        :rtype: bool
+        """
+        self.refill(now)
+        return self.tokens >= 1
+
+
+    def consume(self):
+        """Remove a token from the bucket. hasToken should be checked first.
+        """
+        self.tokens -= 1
+
+
+    def secondsUntilToken(self, now : float) -> float:
+        """Get the number of seconds until a token will be available.
+
+        :param float now: The current time.monotonic time
+        :return: The number of seconds to wait before the next send is allowed, or 0 if a token is available now
+        :rtype: float
+        """
+        self.refill(now)
+        return max(0.0, (1 - self.tokens) / self.refillRate)
+
+
+class OutboundMessage:
+    """A message waiting in a MessageQueue to be sent.
+
+    :var channel: The channel to send the message to
+    :vartype channel: discord.abc.Messageable
+    :var args: Positional arguments to pass to channel.send
+    :vartype args: tuple
+    :var kwargs: Keyword arguments to pass to channel.send
+    :vartype kwargs: dict
+    :var priority: The MessagePriority of this message
+    :vartype priority: int
+    :var order: Tie-breaker preserving queueing order within the same priority
+    :vartype order: int
+    :var future: A future to be resolved with the sent discord.Message or the send's exception, or None if the sender
+                    does not need the result
+    :vartype future: asyncio.Future or None
+    """
+
+    def __init__(self, channel : abc.Messageable, args : tuple, kwargs : dict, priority : int, order : int,
+                    future : asyncio.Future = None):
+        self.channel = channel
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.order = order
+        self.future = future
+
+
+    def __lt__(self, other : OutboundMessage) -> bool:
+        return (self.priority, self.order) < (other.priority, other.order)
+
+
+class MessageQueue:
+    """The central outbound message delivery queue.
+    Messages are sent in priority order, under a global rate limit and a rate limit for each channel, with at most
+    maxConcurrent sends in flight at once. Messages to a rate-limited channel are held back without delaying messages
+    to other channels, so broadcasts to many guilds complete as fast as the global rate limit allows.
+
+    :var globalBucket: The rate limiter shared by all channels
+    :vartype globalBucket: TokenBucket
+    :var channelBuckets: The rate limiters for each channel, by channel ID
+    :vartype channelBuckets: dict[int, TokenBucket]
+    :var readyMessages: A heap of messages waiting to be sent, whose channels are not rate limited
+    :vartype readyMessages: list[OutboundMessage]
+    :var heldMessages: Heaps of messages held back because their channel is rate limited, by channel ID
+    :vartype heldMessages: dict[int, list[OutboundMessage]]
+    :var heldChannels: A heap of (time.monotonic release time, channel ID) for all channels in heldMessages
+    :vartype heldChannels: list[tuple[float, int]]
+    :var sendSlots: Semaphore bounding the number of sends in flight
+    :vartype sendSlots: asyncio.Semaphore
+    :var numSent: The number of messages successfully sent
+    :vartype numSent: int
+    :var numFailed: The number of messages that failed to send
+    :vartype numFailed: int
+    """
+
+    def __init__(self, globalRate : float = cfg.messageQueueGlobalRate,
+                    globalBurst : float = cfg.messageQueueGlobalBurst,
+                    channelRate : float = cfg.messageQueueChannelRate,
+                    channelBurst : float = cfg.messageQueueChannelBurst,
+                    maxConcurrent : int = cfg.messageQueueMaxConcurrentSends):
+        """
+        :param float globalRate: The maximum average number of sends per second over all channels
+                                    (Default cfg.messageQueueGlobalRate)
+        :param float globalBurst: The maximum number of sends allowed in a burst over all channels
+                                    (Default cfg.messageQueueGlobalBurst)
+        :param float channelRate: The maximum average number of sends per second to a single channel
+                                    (Default cfg.messageQueueChannelRate)
+        :param float channelBurst: The maximum number of sends allowed in a burst to a single channel
+                                    (Default cfg.messageQueueChannelBurst)
+        :param int maxConcurrent: The maximum number of sends in flight at once (Default cfg.messageQueueMaxConcurrentSends)
+        """
+        self.globalBucket = TokenBucket(globalBurst, globalRate)
+        self.channelRate = channelRate
+        self.channelBurst = channelBurst
+        self.channelBuckets = {}
+
+        self.readyMessages = []
+        self.heldMessages = {}
+        self.heldChannels = []
+        self.messageOrder = count()
+
+        self.sendSlots = asyncio.Semaphore(maxConcurrent)
+        self.messageQueued = asyncio.Event()
+        self.dispatchTask = None
+        self.sendTasks = set()
+
+        self.numSent = 0
+        self.numFailed = 0
+
+
+    def __len__(self) -> int:
+        """Get the number of messages waiting to be sent, not including sends in flight.
+
+        :return: The number of queued messages
+        :rtype: int
+        """
+        return len(self.readyMessages) + sum(len(held) for held in self.heldMessages.values())
+
+
+    def enqueue(self, channel : abc.Messageable, args : tuple, kwargs : dict, priority : int,
+                    future : asyncio.Future = None):
+        """Add a message to the queue, and wake the dispatcher.
+
+        :param discord.abc.Messageable channel: The channel to send the message to
+        :param tuple args: Positional arguments to pass to channel.send
+        :param dict kwargs: Keyword arguments to pass to channel.send
+        :param int priority: The MessagePriority of the message
+        :param asyncio.Future future: A future to resolve with the send result, or None to only log failures (Default None)
+        """
+        newMessage = OutboundMessage(channel, args, kwargs, priority, next(self.messageOrder), future=future)
+        if channel.id in self.heldMessages:
+            heappush(self.heldMessages[channel.id], newMessage)
+        else:
+            heappush(self.readyMessages, newMessage)
+        self.messageQueued.set()
+
+
+    def send(self, channel : abc.Messageable, *args, priority : int = MessagePriority.announcement,
+                **kwargs) -> asyncio.Future:
+        """Queue a message to be sent to channel, with the same arguments as discord.abc.Messageable.send.
+        Await the returned future to get the sent message. If the send fails, awaiting the future raises the same
+        exception that channel.send would have raised.
+
+        :param discord.abc.Messageable channel: The channel to send the message to
+        :param int priority: The MessagePriority of the message (Default MessagePriority.announcement)
+        :return: A future resolving to the sent discord.Message
+        :rtype: asyncio.Future
+        """
+        future = asyncio.get_event_loop().create_future()
+        self.enqueue(channel, args, kwargs, priority, future=future)
+        return future
+
+
+    def post(self, channel : abc.Messageable, *args, priority : int = MessagePriority.announcement, **kwargs):
+        """Queue a message to be sent to channel, with the same arguments as discord.abc.Messageable.send,
+        without waiting for the result. Failed sends are logged.
+
+        :param discord.abc.Messageable channel: The channel to send the message to
+        :param int priority: The MessagePriority of the message (Default MessagePriority.announcement)
+        """
+        self.enqueue(channel, args, kwargs, priority)
+
+
+    async def broadcast(self, channels : List[abc.Messageable], *args, priority : int = MessagePriority.broadcast,
+                            **kwargs) -> Dict[abc.Messageable, Union[Message, Exception]]:
+        """Send the same message to every channel in channels, and wait for all sends to complete.
+
+        :param list[discord.abc.Messageable] channels: The channels to send the message to
+        :param int priority: The MessagePriority of the messages (Default MessagePriority.broadcast)
+        :return: A dictionary mapping each channel to its sent message, or to the exception raised if the send failed
+        :rtype: dict[discord.abc.Messageable, discord.Message or Exception]
+        """
+        futures = [self.send(channel, *args, priority=priority, **kwargs) for channel in channels]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        return dict(zip(channels, results))
+
+
+    def start(self):
+        """Start sending queued messages.
+
+        :raise RuntimeError: If the queue is already running
+        """
+        if self.dispatchTask is not None:
+            raise RuntimeError("Attempted to start a MessageQueue that is already running")
+        self.dispatchTask = asyncio.ensure_future(self.dispatch())
+
+
+    async def stop(self, timeoutSeconds : float = cfg.messageQueueShutdownTimeoutSeconds):
+        """Wait for queued messages and sends in flight to finish, and then stop the dispatcher.
+        Messages still queued after timeoutSeconds are discarded, and their futures cancelled.
+
+        :param float timeoutSeconds: The maximum number of seconds to wait for the queue to drain
+                                        (Default cfg.messageQueueShutdownTimeoutSeconds)
+        """
+        deadline = time.monotonic() + timeoutSeconds
+        while (len(self) > 0 or self.sendTasks) and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+
+        if self.dispatchTask is not None:
+            self.dispatchTask.cancel()
+            self.dispatchTask = None
+
+        remaining = self.readyMessages
+        for held in self.heldMessages.values():
+            remaining += held
+        for outbound in remaining:
+            if outbound.future is not None and not outbound.future.done():
+                outbound.future.cancel()
+        if remaining:
+            botState.logger.log("MessageQueue", "stop", "Discarded " + str(len(remaining)) + " unsent messages on shutdown",
+                                category="messageQueue", eventType="DISCARD")
+        self.readyMessages = []
+        self.heldMessages = {}
+        self.heldChannels = []
+
+
+    def getChannelBucket(self, channelID : int) -> TokenBucket:
+        """Get the rate limiter for the given channel, creating a full one if none exists.
+
+        :param int channelID: The ID of the channel
+        :return: The channel's rate limiter
+        :rtype: TokenBucket
+        """
+        if channelID not in self.channelBuckets:
+            self.channelBuckets[channelID] = TokenBucket(self.channelBurst, self.channelRate)
+        return self.channelBuckets[channelID]
+
+
+    def releaseHeldChannels(self, now : float):
+        """Move the messages of every held channel whose rate limit has elapsed back into readyMessages.
+        Channels that have been idle long enough to refill completely have their rate limiter discarded.
+
+        :param float now: The current time.monotonic time
+        """
+        while self.heldChannels and self.heldChannels[0][0] <= now:
+            channelID = heappop(self.heldChannels)[1]
+            for outbound in self.heldMessages.pop(channelID):
+                heappush(self.readyMessages, outbound)
+
+        if len(self.channelBuckets) > cfg.messageQueueMaxIdleBuckets:
+            for channelID in list(self.channelBuckets.keys()):
+                if channelID not in self.heldMessages:
+                    bucket = self.channelBuckets[channelID]
+                    bucket.refill(now)
+                    if bucket.tokens >= bucket.capacity:
+                        del self.channelBuckets[channelID]
+
+
+    async def dispatch(self):
+        """Send queued messages in priority order, as fast as the rate limits and maxConcurrent allow.
+        Runs until cancelled by stop.
+        """
+        while True:
+            now = time.monotonic()
+            self.releaseHeldChannels(now)
+
+            if not self.readyMessages:
+                self.messageQueued.clear()
+                # Sleep until a message is queued, or until the next held channel is released
+                timeout = (self.heldChannels[0][0] - now) if self.heldChannels else None
+                try:
+                    await asyncio.wait_for(self.messageQueued.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            if not self.globalBucket.hasToken(now):
+                await asyncio.sleep(self.globalBucket.secondsUntilToken(now))
+                continue
+
+            outbound = heappop(self.readyMessages)
+            if outbound.channel.id in self.heldMessages:
+                heappush(self.heldMessages[outbound.channel.id], outbound)
+                continue
+            channelBucket = self.getChannelBucket(outbound.channel.id)
+            if not channelBucket.hasToken(now):
+                # Hold back this channel's messages without delaying other channels
+                self.heldMessages[outbound.channel.id] = [outbound]
+                heappush(self.heldChannels, (now + channelBucket.secondsUntilToken(now), outbound.channel.id))
+                continue
+
+            self.globalBucket.consume()
+            channelBucket.consume()
+            await self.sendSlots.acquire()
+            sendTask = asyncio.ensure_future(self.deliver(outbound))
+            self.sendTasks.add(sendTask)
+            sendTask.add_done_callback(self.sendTasks.discard)
+
+
+    async def deliver(self, outbound : OutboundMessage):
+        """Send a single message, and report the result to its future.
+        Failed sends are retried according to lib.httpRetry. Sends that still fail are logged, and counted in numFailed.
+
+        :param OutboundMessage outbound: The message to send
+        """
+        try:
+            sentMessage = await lib.httpRetry.retryHTTP(lambda: outbound.channel.send(*outbound.args, **outbound.kwargs),
+                                                        outbound.channel.id)
+        except Exception as e:
+            self.numFailed += 1
+            if not isinstance(e, (HTTPException, lib.exceptions.CircuitBreakerOpen)):
+                botState.logger.log("MessageQueue", "deliver", "Unexpected " + type(e).__name__ + " when sending to " \
+                                    + "channel #" + str(outbound.channel.id), category="messageQueue",
+                                    eventType="UNKWNERR", trace=traceback.format_exc())
+            elif outbound.future is None:
+                botState.logger.log("MessageQueue", "deliver", type(e).__name__ + " when sending to channel #" \
+                                    + str(outbound.channel.id) + ": " + str(e), category="messageQueue",
+                                    eventType="SEND_FAIL", noPrint=True)
+            if outbound.future is not None and not outbound.future.done():
+                outbound.future.set_exception(e)
+        else:
+            self.numSent += 1
+            if outbound.future is not None and not outbound.future.done():
+                outbound.future.set_result(sentMessage)
+        finally:
+            self.sendSlots.release()
@@ -36,6 +36,8 @@ class TimedTask:
     :var asyncExpiryFunction: whether or not the expiryFunction is a coroutine and needs to be awaited
     :vartype asyncExpiryFunction: bool
     """
+    __slots__ = ("issueTime", "expiryTime", "expiryDelta", "expiryFunction", "hasExpiryFunctionArgs", "expiryFunctionArgs",
+                    "autoReschedule", "gravestone", "asyncExpiryFunction")
 
     def __init__(self, issueTime : datetime = None, expiryTime : datetime = None, expiryDelta : timedelta = None,
                  expiryFunction : FunctionType = None, expiryFunctionArgs : Any = None, autoReschedule : bool = False):
@@ -61,7 +63,6 @@ class TimedTask:
         self.expiryDelta = self.expiryTime - self.issueTime if expiryDelta is None else expiryDelta
 
         self.expiryFunction = expiryFunction
-        self.hasExpiryFunction = expiryFunction is not None
         self.hasExpiryFunctionArgs = expiryFunctionArgs is not None
         self.expiryFunctionArgs = expiryFunctionArgs if self.hasExpiryFunctionArgs else {}
         self.autoReschedule = autoReschedule
@@ -75,6 +76,13 @@ class TimedTask:
         self.asyncExpiryFunction = inspect.iscoroutinefunction(expiryFunction)
 
 
+    @property
+    def hasExpiryFunction(self) -> bool:
+        """Whether or not the task has an expiry function to call
+        """
+        return self.expiryFunction is not None
+
+
     def __lt__(self, other: TimedTask) -> bool:
         """< Overload, to be used in TimedTask heaps.
         The other object must be a TimedTask. Compares only the expiryTimes of the two tasks.
@@ -243,6 +251,7 @@ class DynamicRescheduleTask(TimedTask):
     :param bool autoReschedule: Whether or not this task should automatically reschedule itself.
                                 You probably want this to be True, otherwise you may as well use a TimedTask. Default: False
     """
+    __slots__ = ("delayTimeGenerator", "hasDelayTimeGeneratorArgs", "delayTimeGeneratorArgs", "asyncDelayTimeGenerator")
 
     def __init__(self, delayTimeGenerator : FunctionType, delayTimeGeneratorArgs : Any = None, issueTime : datetime = None,
                         expiryTime : datetime = None, expiryFunction : FunctionType = None,
@@ -1,8 +1,8 @@
 from . import timedTask
-from heapq import heappop, heappush
+from heapq import heappop, heappush, heapify
 import inspect
 from types import FunctionType
-from typing import Any
+from typing import Any, List
 import asyncio
 from datetime import datetime
 
@@ -60,6 +60,16 @@ class TimedTaskHeap:
         heappush(self.tasksHeap, task)
 
 
+    def scheduleTasks(self, tasks: List[timedTask.TimedTask]):
+        """Schedule many new tasks onto this heap at once.
+        The heap is rebuilt in linear time, rather than pushing each task individually.
+
+        :param list[TimedTask] tasks: the tasks to schedule
+        """
+        self.tasksHeap.extend(tasks)
+        heapify(self.tasksHeap)
+
+
     def unscheduleTask(self, task: timedTask.TimedTask):
         """Forcebly remove a task from the heap without 'expiring' it - no expiry functions or auto-rescheduling are called.
         This method overrides task autoRescheduling, forcibly removing the task from the heap entirely.
@@ -234,6 +244,28 @@ class AutoCheckingTimedTaskHeap(TimedTaskHeap):
                 self.startTaskChecking()
 
 
+    def scheduleTasks(self, tasks: List[timedTask.TimedTask], startLoop: bool = True):
+        """Schedule many new tasks onto the heap at once.
+        If no checking loop is currently active, a new one is started.
+        If a checking loop is already active and any of the new tasks expires before the task it is waiting for,
+        the loop's current waiting time is updated.
+
+        :param list[TimedTask] tasks: the tasks to schedule
+        :param bool startLoop: Give False here to override the starting of a new loop. (Default True)
+        """
+        if not tasks:
+            return
+        soonest = self.tasksHeap[0] if len(self.tasksHeap) > 0 else None
+        super().scheduleTasks(tasks)
+
+        if self.active:
+            if soonest is not None and self.tasksHeap[0] < soonest and self.sleepTask is not None:
+                self.sleepTask.cancel()
+                self.sleepTask = None
+        elif startLoop:
+            self.startTaskChecking()
+
+
     def unscheduleTask(self, task: timedTask.TimedTask):
         """Forcebly remove a task from the heap without 'expiring' it - no expiry functions or auto-rescheduling are called.
         This method overrides task autoRescheduling, forcibly removing the task from the heap entirely.
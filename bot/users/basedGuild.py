@@ -1,7 +1,7 @@
 from __future__ import annotations
 from discord import Embed, channel, Client, Forbidden, Guild, Member, Message, HTTPException, NotFound
 from typing import List, Dict, Union
-from datetime import timedelta
+from datetime import timedelta, datetime
 
 from .. import botState, lib
 from ..gameObjects import guildShop
@@ -10,6 +10,7 @@ from ..gameObjects.bounties.bountyBoards import bountyBoardChannel
 from ..userAlerts import userAlerts
 from ..cfg import cfg, bbData
 from ..scheduling.timedTask import TimedTask, DynamicRescheduleTask
+from ..scheduling.messageQueue import MessagePriority
 from ..gameObjects.bounties import bounty
 from ..baseClasses import serializable
 
@@ -44,6 +45,8 @@ class BasedGuild(serializable.Serializable):
     :vartype bountiesDisabled: bool
     :var shopDisabled: Whether or not to disable this guild's guildShop and shop refreshing
     :vartype shopDisabled: bool
+    :var bountyExpiryTTs: A dictionary of active bounties to the TimedTasks scheduled to escape them at their endTimes
+    :vartype bountyExpiryTTs: dict[bounty.Bounty, TimedTask]
     """
 
     def __init__(self, id: int, dcGuild: Guild, bounties: bountyDB.BountyDB, commandPrefix: str = cfg.defaultCommandPrefix,
@@ -101,6 +104,8 @@ class BasedGuild(serializable.Serializable):
         self.ownedRoleMenus = ownedRoleMenus
         self.bountiesDB = bounties
         self.bountiesDisabled = bountiesDisabled
+        # Bounty expiry tasks are scheduled in bulk after loading, by makeAllBountyExpiryTTs
+        self.bountyExpiryTTs = {}
 
         bountyDelayGenerators = {"random": lib.timeUtil.getRandomDelaySeconds,
                                 "fixed-routeScale": self.getRouteScaledBountyDelayFixed,
@@ -273,12 +278,15 @@ class BasedGuild(serializable.Serializable):
 
     def removeBountyBoardChannel(self):
         """Deactivate this guild's bountyBoardChannel. This does not remove any active bounty listing messages.
+        Listing edits that the bountyBoardChannel has not yet flushed are discarded.
 
         :raise RuntimeError: If this guild does not have an active bountyBoardChannel.
         """
         if not self.hasBountyBoardChannel:
             raise RuntimeError("Attempted to remove a bountyboard channel for guild " + str(self.id) \
                                 + " but none is assigned")
+        # Queued edits would otherwise still target the removed channel's listings
+        self.bountyBoardChannel.cancelPendingEdits()
         self.bountyBoardChannel = None
         self.hasBountyBoardChannel = False
 
@@ -298,9 +306,10 @@ class BasedGuild(serializable.Serializable):
         """
         if not self.hasBountyBoardChannel:
             raise ValueError("The requested BasedGuild has no bountyBoardChannel")
-        bountyListing = await self.bountyBoardChannel.channel.send(msg, embed=embed)
+        bountyListing = await lib.httpRetry.retryHTTP(lambda: self.bountyBoardChannel.channel.send(msg, embed=embed),
+                                                        self.bountyBoardChannel.channel.id)
         await self.bountyBoardChannel.addBounty(bounty, bountyListing)
-        await self.bountyBoardChannel.updateBountyMessage(bounty)
+        await self.bountyBoardChannel.updateBountyMessage(bounty, immediate=True)
         return bountyListing
 
 
@@ -315,11 +324,8 @@ class BasedGuild(serializable.Serializable):
             raise ValueError("The requested BasedGuild has no bountyBoardChannel")
         if self.bountyBoardChannel.hasMessageForBounty(bounty):
             try:
-                await self.bountyBoardChannel.getMessageForBounty(bounty).delete()
-            except HTTPException:
-                botState.logger.log("Main", "rmBBCMsg",
-                                    "HTTPException thrown when removing bounty listing message for criminal: " \
-                                    + bounty.criminal.name, category='bountyBoards', eventType="RM_LISTING-HTTPERR")
+                await lib.httpRetry.retryHTTP(self.bountyBoardChannel.getMessageForBounty(bounty).delete,
+                                                self.bountyBoardChannel.channel.id)
             except Forbidden:
                 botState.logger.log("Main", "rmBBCMsg",
                                     "Forbidden exception thrown when removing bounty listing message for criminal: " \
@@ -328,6 +334,10 @@ class BasedGuild(serializable.Serializable):
                 botState.logger.log("Main", "rmBBCMsg",
                                     "Bounty listing message no longer exists, BBC entry removed: " + bounty.criminal.name,
                                     category='bountyBoards', eventType="RM_LISTING-NOT_FOUND")
+            except (HTTPException, lib.exceptions.CircuitBreakerOpen):
+                botState.logger.log("Main", "rmBBCMsg",
+                                    "HTTPException thrown when removing bounty listing message for criminal: " \
+                                    + bounty.criminal.name, category='bountyBoards', eventType="RM_LISTING-HTTPERR")
             await self.bountyBoardChannel.removeBounty(bounty)
         else:
             raise KeyError("The requested BasedGuild (" + str(self.id) \
@@ -352,6 +362,82 @@ class BasedGuild(serializable.Serializable):
                     await self.bountyBoardChannel.updateBountyMessage(bounty)
 
 
+    def makeBountyExpiryTT(self, bounty : bounty.Bounty) -> TimedTask:
+        """Create a TimedTask that escapes the given bounty at its endTime, and register it as the bounty's expiry task.
+        The task is not scheduled; use scheduleBountyExpiry for a single bounty, or makeAllBountyExpiryTTs
+        to schedule many bounties at once.
+
+        :param bounty.Bounty bounty: The active bounty to create an expiry task for
+        :return: A new TimedTask which calls escapeBounty on bounty when it expires
+        :rtype: TimedTask
+        """
+        # bounty.endTime is created with naive datetime.timestamp, which fromtimestamp inverts exactly
+        expiryTT = TimedTask(expiryTime=datetime.fromtimestamp(bounty.endTime), expiryFunction=self.escapeBounty,
+                                expiryFunctionArgs=bounty)
+        self.bountyExpiryTTs[bounty] = expiryTT
+        return expiryTT
+
+
+    def scheduleBountyExpiry(self, bounty : bounty.Bounty):
+        """Schedule the given bounty to escape at its endTime, on botState.taskScheduler.
+
+        :param bounty.Bounty bounty: The newly activated bounty to schedule the expiry of
+        """
+        botState.taskScheduler.scheduleTask(self.makeBountyExpiryTT(bounty))
+
+
+    def makeAllBountyExpiryTTs(self) -> List[TimedTask]:
+        """Create expiry tasks for all of this guild's active bounties that do not yet have one.
+        The tasks are not scheduled, so that the expiry tasks of all guilds can be scheduled in bulk after loading,
+        with TimedTaskHeap.scheduleTasks.
+
+        :return: A list of new, unscheduled bounty expiry TimedTasks
+        :rtype: list[TimedTask]
+        """
+        if self.bountiesDisabled:
+            return []
+        return [self.makeBountyExpiryTT(currentBounty) for fac in self.bountiesDB.getFactions() \
+                    for currentBounty in self.bountiesDB.getFactionBounties(fac) \
+                    if currentBounty not in self.bountyExpiryTTs]
+
+
+    def unscheduleBountyExpiry(self, bounty : bounty.Bounty):
+        """Cancel the expiry of the given bounty, if it has been scheduled. This should be called whenever an active bounty
+        is removed from this guild's bountiesDB for reasons other than escaping.
+
+        :param bounty.Bounty bounty: The bounty whose expiry task should be unscheduled
+        """
+        if bounty in self.bountyExpiryTTs:
+            botState.taskScheduler.unscheduleTask(self.bountyExpiryTTs.pop(bounty))
+
+
+    def unscheduleAllBountyExpiries(self):
+        """Cancel the expiry tasks of all of this guild's bounties.
+        """
+        for expiryTT in self.bountyExpiryTTs.values():
+            botState.taskScheduler.unscheduleTask(expiryTT)
+        self.bountyExpiryTTs = {}
+
+
+    async def escapeBounty(self, bounty : bounty.Bounty):
+        """Expire the given bounty, moving it into this guild's escaped bounties, freeing its faction's slot
+        and removing its bounty board listing.
+        If the bounty is no longer active (e.g it has been won), nothing is done.
+
+        :param bounty.Bounty bounty: The bounty to escape
+        """
+        self.bountyExpiryTTs.pop(bounty, None)
+        if self.bountiesDisabled or not self.bountiesDB.bountyObjExists(bounty):
+            return
+
+        self.bountiesDB.escapeBounty(bounty)
+        if self.hasBountyBoardChannel and self.bountyBoardChannel.hasMessageForBounty(bounty):
+            await self.removeBountyBoardChannelMessage(bounty)
+        botState.logger.log("BasedGuild", "escapeBounty",
+                            "Bounty expired for criminal '" + bounty.criminal.name + "' in guild #" + str(self.id),
+                            category="escapedBounties", eventType="BTY_ESCAPED", noPrint=True)
+
+
     def getRouteScaledBountyDelayFixed(self, baseDelayDict : Dict[str, int]) -> timedelta:
         """New bounty delay generator, scaling a fixed delay by the length of the presently spawned bounty.
 
@@ -425,9 +511,9 @@ class BasedGuild(serializable.Serializable):
                 if self.hasUserAlertRoleID("bounties_new"):
                     msg = "<@&" + str(self.getUserAlertRoleID("bounties_new")) + "> " + msg
                 # announce to the given channel
-                bountyListing = await self.bountyBoardChannel.channel.send(msg, embed=bountyEmbed)
+                bountyListing = await botState.messageQueue.send(self.bountyBoardChannel.channel, msg, embed=bountyEmbed)
                 await self.bountyBoardChannel.addBounty(newBounty, bountyListing)
-                await self.bountyBoardChannel.updateBountyMessage(newBounty)
+                await self.bountyBoardChannel.updateBountyMessage(newBounty, immediate=True)
                 return bountyListing
 
             except Forbidden:
@@ -442,18 +528,14 @@ class BasedGuild(serializable.Serializable):
             # ensure the announceChannel is valid
             currentChannel = self.getAnnounceChannel()
             if currentChannel is not None:
-                try:
-                    if self.hasUserAlertRoleID("bounties_new"):
-                        # announce to the given channel
-                        await currentChannel.send("<@&" + str(self.getUserAlertRoleID("bounties_new")) + "> " + msg,
-                                                    embed=bountyEmbed)
-                    else:
-                        await currentChannel.send(msg, embed=bountyEmbed)
-                except Forbidden:
-                    botState.logger.log("BasedGuild", "anncBnty",
-                                        "Failed to post announce-channel bounty listing to guild " \
-                                        + botState.client.get_guild(self.id).name + "#" + str(self.id) + " in channel " \
-                                        + currentChannel.name + "#" + str(currentChannel.id), eventType="ANNCCH_SND_FRBDN")
+                # Queue the announcement without waiting for it to be sent. Failed sends are logged by the message queue.
+                if self.hasUserAlertRoleID("bounties_new"):
+                    # announce to the given channel
+                    botState.messageQueue.post(currentChannel,
+                                               "<@&" + str(self.getUserAlertRoleID("bounties_new")) + "> " + msg,
+                                               embed=bountyEmbed)
+                else:
+                    botState.messageQueue.post(currentChannel, msg, embed=bountyEmbed)
 
             # TODO: may wish to add handling for invalid announceChannels - e.g remove them from the BasedGuild object
 
@@ -466,9 +548,11 @@ class BasedGuild(serializable.Serializable):
             raise ValueError("Attempted to spawn a bounty into a guild where bounties are disabled")
         # ensure a new bounty can be created
         if self.bountiesDB.canMakeBounty():
-            newBounty = bounty.Bounty(owningDB=self.bountiesDB)
+            # Claim a pre-generated route, and pick a faction and criminal for this guild
+            newBounty = bounty.Bounty(owningDB=self.bountiesDB, config=botState.bountyPool.claimConfig())
             # activate and announce the bounty
             self.bountiesDB.addBounty(newBounty)
+            self.scheduleBountyExpiry(newBounty)
             await self.announceNewBounty(newBounty)
 
 
@@ -508,11 +592,11 @@ class BasedGuild(serializable.Serializable):
                                                 + ("s" if int(rewards[userID]["checked"]) != 1 else ""), inline=False)
                         place += 1
 
-                # Send the announcement to the guild's playChannel
-                await self.getPlayChannel().send(":trophy: **You win!**\n**" + winningUser.display_name \
-                                                    + "** located and EMP'd **" + bounty.criminal.name \
-                                                    + "**, who has been arrested by local security forces. :chains:",
-                                                    embed=rewardsEmbed)
+                # Queue the announcement to the guild's playChannel, without waiting for it to be sent
+                botState.messageQueue.post(self.getPlayChannel(), ":trophy: **You win!**\n**" \
+                                           + winningUser.display_name + "** located and EMP'd **" \
+                                           + bounty.criminal.name + "**, who has been arrested by local " \
+                                           + "security forces. :chains:", embed=rewardsEmbed)
 
         else:
             botState.logger.log("Main", "AnncBtyWn",
@@ -568,6 +652,7 @@ class BasedGuild(serializable.Serializable):
 
         if self.hasBountyBoardChannel:
             self.removeBountyBoardChannel()
+        self.unscheduleAllBountyExpiries()
         botState.newBountiesTTDB.unscheduleTask(self.newBountyTT)
         self.newBountyTT = None
         self.bountiesDisabled = True
@@ -612,18 +697,16 @@ class BasedGuild(serializable.Serializable):
             playCh = self.getPlayChannel()
             msg = "The shop stock has been refreshed!\n**        **Now at tech level: **" \
                     + str(self.shop.currentTechLevel) + "**"
-            try:
-                if self.hasUserAlertRoleID("shop_refresh"):
-                    # announce to the given channel
-                    await playCh.send(":arrows_counterclockwise: <@&" \
-                                        + str(self.getUserAlertRoleID("shop_refresh")) + "> " + msg)
-                else:
-                    await playCh.send(":arrows_counterclockwise: " + msg)
-            except Forbidden:
-                botState.logger.log("Main", "anncNwShp",
-                                    "Failed to post shop stock announcement to " + self.dcGuild.name + "#" + str(self.id) \
-                                    + " in channel " + playCh.name + "#" + str(playCh.id), category="shop",
-                                    eventType="PLCH_NONE")
+            # Queue the announcement without waiting for it to be sent, so that announcing to every guild does not wait
+            # on each send in turn. Failed sends are logged by the message queue.
+            if self.hasUserAlertRoleID("shop_refresh"):
+                # announce to the given channel
+                botState.messageQueue.post(playCh, ":arrows_counterclockwise: <@&" \
+                                           + str(self.getUserAlertRoleID("shop_refresh")) + "> " + msg,
+                                           priority=MessagePriority.broadcast)
+            else:
+                botState.messageQueue.post(playCh, ":arrows_counterclockwise: " + msg,
+                                           priority=MessagePriority.broadcast)
 
 
     def toDict(self, **kwargs) -> dict:
@@ -97,6 +97,15 @@ class BasedUser(serializable.Serializable):
     :vartype homeGuildID: int
     :var guildTransferCooldownEnd: A timestamp after which this user is allowed to transfer their homeGuildID.
     :vartype guildTransferCooldownEnd: datetime.datetime
+    :var leaderboards: The leaderboards ranking this user, which are notified when the user's ranked stats change.
+                        None if the user is not ranked.
+    :vartype leaderboards: leaderboards.Leaderboards or None
+    :var statsStore: The columnar stats store holding this user's stats, which is notified when the user's stats change.
+                        None if the user's stats are not stored.
+    :vartype statsStore: userStats.UserStatsStore or None
+    :var cachedValue: The user's total value, as returned by getStatByName("value"). This is kept up to date as the
+                        user's credits, items and ships change, rather than recalculated on every read.
+    :vartype cachedValue: int or float
     """
 
     def __init__(self, id: int, credits : int = 0, lifetimeCredits : int = 0,
@@ -184,6 +193,11 @@ class BasedUser(serializable.Serializable):
         if guildTransferCooldownEnd is None:
             guildTransferCooldownEnd = datetime.utcnow()
 
+        self.leaderboards = None
+        self.statsStore = None
+        # Not tracked until all of the user's items have been assigned, at which point it is calculated in full
+        self.cachedValue = None
+        self._activeShip = None
         self.id = id
         self.credits = credits
         self.lifetimeCredits = lifetimeCredits
@@ -198,6 +212,11 @@ class BasedUser(serializable.Serializable):
         self.inactiveWeapons = inactiveWeapons
         self.inactiveTurrets = inactiveTurrets
         self.inactiveTools = inactiveTools
+        for inactiveItems in (inactiveShips, inactiveModules, inactiveWeapons, inactiveTurrets, inactiveTools):
+            inactiveItems.changeListener = self.inventoryChanged
+        for ship in inactiveShips.keys:
+            ship.changeListener = self.shipChanged
+        self.cachedValue = self.calculateValue()
 
         self.lastSeenGuildId = lastSeenGuildId
         self.hasLastSeenGuildId = lastSeenGuildId != -1
@@ -249,6 +268,240 @@ class BasedUser(serializable.Serializable):
         self.guildTransferCooldownEnd = guildTransferCooldownEnd
 
 
+    @property
+    def credits(self) -> int:
+        """The amount of credits (currency) this user has. Changes are reported to the user's leaderboards
+        and stats store.
+        """
+        return self._credits
+
+
+    @credits.setter
+    def credits(self, newCredits : int):
+        # Ship values may be fractional, e.g after upgrades, so credits from sales are truncated as they are on load
+        if type(newCredits) == float:
+            newCredits = int(newCredits)
+        if self.cachedValue is not None:
+            self.cachedValue += newCredits - self._credits
+        self._credits = newCredits
+        self.reportStatChange("credits")
+
+
+    @property
+    def lifetimeCredits(self) -> int:
+        """The total amount of credits this user has earned through hunting bounties.
+        Changes are reported to the user's stats store.
+        """
+        return self._lifetimeCredits
+
+
+    @lifetimeCredits.setter
+    def lifetimeCredits(self, newLifetimeCredits : int):
+        self._lifetimeCredits = newLifetimeCredits
+        self.reportStatChange("lifetimeCredits")
+
+
+    @property
+    def duelWins(self) -> int:
+        """The total number of duels this user has won.
+        Changes are reported to the user's stats store.
+        """
+        return self._duelWins
+
+
+    @duelWins.setter
+    def duelWins(self, newDuelWins : int):
+        self._duelWins = newDuelWins
+        self.reportStatChange("duelWins")
+
+
+    @property
+    def duelLosses(self) -> int:
+        """The total number of duels this user has lost.
+        Changes are reported to the user's stats store.
+        """
+        return self._duelLosses
+
+
+    @duelLosses.setter
+    def duelLosses(self, newDuelLosses : int):
+        self._duelLosses = newDuelLosses
+        self.reportStatChange("duelLosses")
+
+
+    @property
+    def duelCreditsWins(self) -> int:
+        """The total amount of credits this user has won through fighting duels.
+        Changes are reported to the user's stats store.
+        """
+        return self._duelCreditsWins
+
+
+    @duelCreditsWins.setter
+    def duelCreditsWins(self, newDuelCreditsWins : int):
+        self._duelCreditsWins = newDuelCreditsWins
+        self.reportStatChange("duelCreditsWins")
+
+
+    @property
+    def duelCreditsLosses(self) -> int:
+        """The total amount of credits this user has lost through fighting duels.
+        Changes are reported to the user's stats store.
+        """
+        return self._duelCreditsLosses
+
+
+    @duelCreditsLosses.setter
+    def duelCreditsLosses(self, newDuelCreditsLosses : int):
+        self._duelCreditsLosses = newDuelCreditsLosses
+        self.reportStatChange("duelCreditsLosses")
+
+
+    @property
+    def systemsChecked(self) -> int:
+        """The total number of space systems this user has checked. Changes are reported to the user's leaderboards
+        and stats store.
+        """
+        return self._systemsChecked
+
+
+    @systemsChecked.setter
+    def systemsChecked(self, newSystemsChecked : int):
+        self._systemsChecked = newSystemsChecked
+        self.reportStatChange("systemsChecked")
+
+
+    @property
+    def bountyWins(self) -> int:
+        """The total number of bounties this user has won. Changes are reported to the user's leaderboards
+        and stats store.
+        """
+        return self._bountyWins
+
+
+    @bountyWins.setter
+    def bountyWins(self, newBountyWins : int):
+        self._bountyWins = newBountyWins
+        self.reportStatChange("bountyWins")
+
+
+    @property
+    def activeShip(self) -> shipItem.Ship:
+        """The user's currently equipped shipItem. Replacing the ship updates the user's cached value, and is reported
+        to the user's leaderboards and stats store.
+        """
+        return self._activeShip
+
+
+    @activeShip.setter
+    def activeShip(self, newShip : shipItem.Ship):
+        oldShip = self._activeShip
+        self._activeShip = newShip
+        if oldShip is newShip:
+            return
+        # The old ship may have been moved to the hangar, in which case its changes still affect this user's value
+        if oldShip is not None and oldShip.changeListener == self.shipChanged and not self.inactiveShips.stores(oldShip):
+            oldShip.changeListener = None
+        if newShip is not None:
+            newShip.changeListener = self.shipChanged
+
+        if self.cachedValue is not None:
+            self.cachedValue += (newShip.getValue() if newShip is not None else 0) \
+                                - (oldShip.getValue() if oldShip is not None else 0)
+            self.reportStatChange("value")
+
+
+    def inventoryChanged(self, changedInventory : inventory.Inventory, item : object, quantity : int):
+        """Update the user's cached value for a change to one of the user's inactive item inventories, and report the
+        change to the user's leaderboards and stats store.
+        This is the changeListener of each of the user's inactive item inventories.
+
+        :param inventory changedInventory: The inventory whose contents changed
+        :param object item: The item added or removed
+        :param int quantity: The number of item added, negative if items were removed
+        """
+        if changedInventory is self.inactiveShips:
+            if quantity > 0:
+                item.changeListener = self.shipChanged
+            elif item is not self.activeShip and not changedInventory.stores(item):
+                item.changeListener = None
+
+        # Tools are not counted towards a user's value
+        if self.cachedValue is None or changedInventory is self.inactiveTools:
+            return
+        self.cachedValue += quantity * item.getValue()
+        self.reportStatChange("value")
+
+
+    def shipChanged(self, ship : shipItem.Ship, valueChange : Union[int, float]):
+        """Update the user's cached value for a change in the value of one of the user's ships, and report the change
+        to the user's leaderboards and stats store.
+        This is the changeListener of the user's active ship, and of each ship in the user's hangar.
+
+        :param shipItem ship: The ship whose value changed
+        :param valueChange: The amount by which the ship's value changed, negative if the value decreased
+        :type valueChange: int or float
+        """
+        if self.cachedValue is None:
+            return
+        numOwned = self.inactiveShips.numStored(ship) + (1 if ship is self.activeShip else 0)
+        self.cachedValue += valueChange * numOwned
+        self.reportStatChange("value")
+
+
+    def reportStatChange(self, stat : str):
+        """Report a change to one of the user's stats to the user's leaderboards and stats store, if they have them.
+
+        :param str stat: The name of the stat that changed, as given to getStatByName
+        """
+        if self.leaderboards is not None:
+            self.leaderboards.statChanged(self, stat)
+        if self.statsStore is not None:
+            self.statsStore.statChanged(self, stat)
+
+
+    def calculateValue(self) -> Union[int, float]:
+        """Calculate the user's total value in full, from their credits, active ship and inactive items.
+        getStatByName("value") should be preferred, which reads the cached value instead.
+
+        :return: The total value of the user's credits, active ship and inactive items, excluding tools
+        :rtype: int or float
+        """
+        modulesValue = 0
+        for module in self.inactiveModules.keys:
+            modulesValue += self.inactiveModules.items[module].count * module.getValue()
+        turretsValue = 0
+        for turret in self.inactiveTurrets.keys:
+            turretsValue += self.inactiveTurrets.items[turret].count * turret.getValue()
+        weaponsValue = 0
+        for weapon in self.inactiveWeapons.keys:
+            weaponsValue += self.inactiveWeapons.items[weapon].count * weapon.getValue()
+        shipsValue = 0
+        for ship in self.inactiveShips.keys:
+            shipsValue += self.inactiveShips.items[ship].count * ship.getValue()
+        activeShipValue = self.activeShip.getValue() if self.activeShip is not None else 0
+
+        return modulesValue + turretsValue + weaponsValue + shipsValue + activeShipValue + self.credits
+
+
+    def checkValueCache(self) -> bool:
+        """Compare the user's cached value against a full recalculation.
+        If they do not match, the mismatch is logged and the cached value is replaced with the recalculated value.
+
+        :return: True if the cached value was correct, False if it had to be repaired
+        :rtype: bool
+        """
+        fullValue = self.calculateValue()
+        if fullValue == self.cachedValue:
+            return True
+        botState.logger.log("bbUsr", "checkValueCache", "Cached value for user #" + str(self.id) + " was " \
+                            + str(self.cachedValue) + ", but recalculated as " + str(fullValue) + ". Cache repaired.",
+                            category="usersDB", eventType="VALUE_CACHE_MISMATCH")
+        self.cachedValue = fullValue
+        self.reportStatChange("value")
+        return False
+
+
     def resetUser(self):
         """Reset the user's attributes back to their default values.
         """
@@ -429,7 +682,7 @@ class BasedUser(serializable.Serializable):
             raise IndexError("Index out of range")
         if self.activeShip is not None:
             self.inactiveShips.addItem(self.activeShip)
-        self.activeShip = self.inactiveShips[index]
+        self.activeShip = self.inactiveShips[index].item
         self.inactiveShips.removeItem(self.activeShip)
 
 
@@ -481,7 +734,8 @@ class BasedUser(serializable.Serializable):
     def getStatByName(self, stat : str) -> Union[int, float]:
         """Get a user attribute by its string name. This method is primarily used in leaderboard generation.
 
-        :param str stat: One of id, credits, lifetimeCredits, bountyCooldownEnd, systemsChecked, bountyWins or value
+        :param str stat: One of id, credits, lifetimeCredits, bountyCooldownEnd, systemsChecked, bountyWins, duelWins,
+                            duelLosses, duelCreditsWins, duelCreditsLosses or value
         :return: The requested user attribute
         :rtype: int or float
         :raise ValueError: When given an invalid stat name
@@ -498,24 +752,18 @@ class BasedUser(serializable.Serializable):
             return self.systemsChecked
         elif stat == "bountyWins":
             return self.bountyWins
+        elif stat == "duelWins":
+            return self.duelWins
+        elif stat == "duelLosses":
+            return self.duelLosses
+        elif stat == "duelCreditsWins":
+            return self.duelCreditsWins
+        elif stat == "duelCreditsLosses":
+            return self.duelCreditsLosses
         elif stat == "value":
-            modulesValue = 0
-            for module in self.inactiveModules.keys:
-                modulesValue += self.inactiveModules.items[module].count * module.getValue()
-            turretsValue = 0
-            for turret in self.inactiveTurrets.keys:
-                turretsValue += self.inactiveTurrets.items[turret].count * turret.getValue()
-            weaponsValue = 0
-            for weapon in self.inactiveWeapons.keys:
-                weaponsValue += self.inactiveWeapons.items[weapon].count * weapon.getValue()
-            shipsValue = 0
-            for ship in self.inactiveShips.keys:
-                shipsValue += self.inactiveShips.items[ship].count * ship.getValue()
-            toolsValue = 0
-            for tool in self.inactiveTools.keys:
-                toolsValue += self.inactiveTools.items[tool].count * tool.getValue()
-
-            return modulesValue + turretsValue + weaponsValue + shipsValue + self.activeShip.getValue() + self.credits
+            if cfg.debugValueCache:
+                self.checkValueCache()
+            return self.cachedValue
         else:
             raise ValueError("Unknown stat name: " + str(stat))
 
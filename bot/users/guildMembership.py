@@ -0,0 +1,115 @@
+# Typing imports
+from __future__ import annotations
+from typing import Dict, Iterable, Set
+
+from discord import Guild
+
+
+class GuildMembership:
+    """An index of which discord users are members of which guilds, in both directions.
+    The index is built from the client's member cache when the bot starts, and is kept up to date by the bot's member
+    and guild events. This allows the members of a guild, or the guilds of a user, to be found without checking every
+    user or every guild.
+
+    :var guildMembers: The IDs of the members of each guild, by guild ID
+    :vartype guildMembers: dict[int, set[int]]
+    :var userGuilds: The IDs of the guilds that each user is a member of, by user ID
+    :vartype userGuilds: dict[int, set[int]]
+    """
+
+    def __init__(self):
+        self.guildMembers : Dict[int, Set[int]] = {}
+        self.userGuilds : Dict[int, Set[int]] = {}
+
+
+    def addMember(self, guildID : int, userID : int):
+        """Record that a user is a member of a guild.
+
+        :param int guildID: The ID of the guild
+        :param int userID: The ID of the user that is a member of the guild
+        """
+        if guildID not in self.guildMembers:
+            self.guildMembers[guildID] = set()
+        self.guildMembers[guildID].add(userID)
+        if userID not in self.userGuilds:
+            self.userGuilds[userID] = set()
+        self.userGuilds[userID].add(guildID)
+
+
+    def removeMember(self, guildID : int, userID : int):
+        """Record that a user is no longer a member of a guild. Users that were not recorded as members are ignored.
+
+        :param int guildID: The ID of the guild
+        :param int userID: The ID of the user that left the guild
+        """
+        if guildID in self.guildMembers:
+            self.guildMembers[guildID].discard(userID)
+        if userID in self.userGuilds:
+            self.userGuilds[userID].discard(guildID)
+            if not self.userGuilds[userID]:
+                del self.userGuilds[userID]
+
+
+    def addGuild(self, guild : Guild):
+        """Record all cached members of a guild, replacing any members already recorded for the guild.
+
+        :param discord.Guild guild: The guild whose members to record
+        """
+        self.removeGuild(guild.id)
+        self.guildMembers[guild.id] = set()
+        for member in guild.members:
+            self.addMember(guild.id, member.id)
+
+
+    def addGuilds(self, guilds : Iterable[Guild]):
+        """Record all cached members of several guilds, e.g all of the client's guilds on startup.
+
+        :param guilds: The guilds whose members to record
+        :type guilds: Iterable[discord.Guild]
+        """
+        for guild in guilds:
+            self.addGuild(guild)
+
+
+    def removeGuild(self, guildID : int):
+        """Forget a guild and all of its members, e.g when the bot leaves the guild. Unknown guilds are ignored.
+
+        :param int guildID: The ID of the guild to remove
+        """
+        for userID in self.guildMembers.pop(guildID, ()):
+            self.userGuilds[userID].discard(guildID)
+            if not self.userGuilds[userID]:
+                del self.userGuilds[userID]
+
+
+    def isMember(self, guildID : int, userID : int) -> bool:
+        """Decide whether a user is a member of a guild.
+
+        :param int guildID: The ID of the guild
+        :param int userID: The ID of the user
+        :return: True if the user is recorded as a member of the guild, False otherwise
+        :rtype: bool
+        """
+        return guildID in self.userGuilds.get(userID, ())
+
+
+    def membersOf(self, guildID : int) -> Set[int]:
+        """Get the IDs of all members of a guild.
+        The returned set is part of the index, and must not be modified.
+
+        :param int guildID: The ID of the guild
+        :return: The IDs of all users recorded as members of the guild. Empty if the guild is unknown.
+        :rtype: set[int]
+        """
+        return self.guildMembers.get(guildID, set())
+
+
+    def guildsOf(self, userID : int) -> Set[int]:
+        """Get the IDs of all guilds that a user is a member of.
+        The returned set is part of the index, and must not be modified.
+
+        :param int userID: The ID of the user
+        :return: The IDs of all guilds that the user is recorded as a member of. Empty if the user is unknown.
+        :rtype: set[int]
+        """
+        return self.userGuilds.get(userID, set())
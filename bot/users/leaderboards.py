@@ -0,0 +1,224 @@
+# Typing imports
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Collection, Dict, Iterable, List, Set, Tuple, Union
+if TYPE_CHECKING:
+    from .basedUser import BasedUser
+    from .userStats import UserStatsStore
+
+from bisect import bisect_left, insort
+import heapq
+
+
+# The user stats that leaderboards can be shown for
+indexedStats = ("credits", "systemsChecked", "bountyWins", "value")
+
+
+class StatIndex:
+    """A ranking of users by a single stat, kept sorted as scores change.
+    Entries are sorted by descending score, with ties broken by ascending user ID, so the top of the leaderboard
+    is the start of the list. Updating a score is a binary search followed by a list insertion, and reading the
+    top K entries touches only those entries, plus any rejected by a filter.
+
+    :var stat: The name of the ranked stat, as given to BasedUser.getStatByName
+    :vartype stat: str
+    :var entries: Tuples of negated score and user ID, in ascending order
+    :vartype entries: list[tuple[int or float, int]]
+    :var scores: The current score of each ranked user, by user ID
+    :vartype scores: dict[int, int or float]
+    """
+
+    def __init__(self, stat : str):
+        """
+        :param str stat: The name of the ranked stat, as given to BasedUser.getStatByName
+        """
+        self.stat = stat
+        self.entries = []
+        self.scores = {}
+
+
+    def update(self, userID : int, score : Union[int, float]):
+        """Set the score of a user, adding them to the ranking if they are not already ranked.
+
+        :param int userID: The ID of the user to score
+        :param score: The user's new score
+        :type score: int or float
+        """
+        if userID in self.scores:
+            if self.scores[userID] == score:
+                return
+            self.remove(userID)
+        self.scores[userID] = score
+        insort(self.entries, (-score, userID))
+
+
+    def updateMany(self, userIDs : Iterable[int], scores : Iterable[Union[int, float]]):
+        """Set the scores of many users at once, e.g when loading the user database.
+        The ranking is re-sorted once, rather than inserting each user individually.
+
+        :param userIDs: The IDs of the users to score
+        :type userIDs: Iterable[int]
+        :param scores: The new score of each user, in the same order as userIDs
+        :type scores: Iterable[int or float]
+        """
+        for userID, score in zip(userIDs, scores):
+            if userID in self.scores:
+                self.remove(userID)
+            self.scores[userID] = score
+            self.entries.append((-score, userID))
+        self.entries.sort()
+
+
+    def remove(self, userID : int):
+        """Remove a user from the ranking. Users that are not ranked are ignored.
+
+        :param int userID: The ID of the user to remove
+        """
+        if userID in self.scores:
+            del self.entries[bisect_left(self.entries, (-self.scores.pop(userID), userID))]
+
+
+    def top(self, numEntries : int, userFilter : Callable[[int], bool] = None) -> List[Tuple[int, Union[int, float]]]:
+        """Get the highest scoring users.
+
+        :param int numEntries: The maximum number of users to return
+        :param userFilter: A function deciding whether a user ID should be included, e.g for local leaderboards.
+                            Give None to include all users. (Default None)
+        :return: Up to numEntries tuples of user ID and score, highest score first
+        :rtype: list[tuple[int, int or float]]
+        """
+        results = []
+        if numEntries <= 0:
+            return results
+        for negScore, userID in self.entries:
+            if userFilter is None or userFilter(userID):
+                results.append((userID, -negScore))
+                if len(results) == numEntries:
+                    break
+        return results
+
+
+    def topAmong(self, numEntries : int, userIDs : Collection[int]) -> List[Tuple[int, Union[int, float]]]:
+        """Get the highest scoring users out of a given group of users, e.g the members of a guild.
+        Only the given users are looked up, so this is faster than top with a filter when the group is much smaller
+        than the ranking.
+
+        :param int numEntries: The maximum number of users to return
+        :param userIDs: The IDs of the users to rank. Users that are not ranked are ignored.
+        :type userIDs: Collection[int]
+        :return: Up to numEntries tuples of user ID and score, highest score first
+        :rtype: list[tuple[int, int or float]]
+        """
+        if numEntries <= 0:
+            return []
+        groupEntries = ((-self.scores[userID], userID) for userID in userIDs if userID in self.scores)
+        return [(userID, -negScore) for negScore, userID in heapq.nsmallest(numEntries, groupEntries)]
+
+
+    def __len__(self) -> int:
+        """Get the number of ranked users.
+
+        :return: The number of users in the ranking
+        :rtype: int
+        """
+        return len(self.scores)
+
+
+class Leaderboards:
+    """Rankings of users for each stat in indexedStats, updated by BasedUser whenever one of those stats changes.
+
+    :var indexes: The ranking for each indexed stat, by stat name
+    :vartype indexes: dict[str, StatIndex]
+    :var users: The ranked users, by ID
+    :vartype users: dict[int, BasedUser]
+    """
+
+    def __init__(self):
+        self.indexes : Dict[str, StatIndex] = {stat: StatIndex(stat) for stat in indexedStats}
+        self.users : Dict[int, BasedUser] = {}
+
+
+    def addUser(self, user : BasedUser):
+        """Rank a user on all leaderboards, and have them report future stat changes to these leaderboards.
+
+        :param BasedUser user: The user to rank
+        """
+        self.users[user.id] = user
+        user.leaderboards = self
+        for stat in indexedStats:
+            self.statChanged(user, stat)
+
+
+    def addUsers(self, users : List[BasedUser], statsStore : UserStatsStore):
+        """Rank many users on all leaderboards at once, e.g when loading the user database.
+        Integer scores are read from the columns of a stats store that already holds the users, and each leaderboard is
+        sorted once, which is much faster than adding the users individually.
+
+        :param list[BasedUser] users: The users to rank
+        :param UserStatsStore statsStore: A stats store holding all of users
+        """
+        userIDs = []
+        for user in users:
+            self.users[user.id] = user
+            user.leaderboards = self
+            userIDs.append(user.id)
+        # Rank by the order of the store's rows when ranking every stored user, to read the columns directly
+        if len(userIDs) == len(statsStore) and set(userIDs) == statsStore.rows.keys():
+            userIDs = statsStore.ids
+        for stat in indexedStats:
+            # Float columns would turn integer scores such as value into floats, so those are read from the users
+            if statsStore.columns[stat].typecode == "d":
+                scores = [self.users[userID].getStatByName(stat) for userID in userIDs]
+            elif userIDs is statsStore.ids:
+                scores = statsStore.columns[stat]
+            else:
+                scores = [statsStore.columns[stat][statsStore.rows[userID]] for userID in userIDs]
+            self.indexes[stat].updateMany(userIDs, scores)
+
+
+    def removeUser(self, userID : int):
+        """Remove a user from all leaderboards.
+
+        :param int userID: The ID of the user to remove
+        """
+        if userID in self.users:
+            self.users.pop(userID).leaderboards = None
+        for index in self.indexes.values():
+            index.remove(userID)
+
+
+    def statChanged(self, user : BasedUser, stat : str):
+        """Update a user's score for a stat that has changed.
+        A user's value includes their credits, so a change to credits also rescores the user's value.
+
+        :param BasedUser user: The user whose stat changed
+        :param str stat: The name of the stat that changed. Stats that are not indexed are ignored.
+        """
+        if stat in self.indexes:
+            self.indexes[stat].update(user.id, user.getStatByName(stat))
+        if stat == "credits":
+            self.indexes["value"].update(user.id, user.getStatByName("value"))
+
+
+    def top(self, stat : str, numEntries : int, userFilter : Callable[[int], bool] = None,
+            userIDs : Set[int] = None) -> List[Tuple[int, Union[int, float]]]:
+        """Get the highest scoring users for a stat.
+
+        :param str stat: The name of the stat to rank users by. Must be in indexedStats.
+        :param int numEntries: The maximum number of users to return
+        :param userFilter: A function deciding whether a user ID should be included. Give None to include all users.
+                            Ignored if userIDs is given. (Default None)
+        :param userIDs: The IDs of the only users to rank, e.g the members of a guild for local leaderboards.
+                        Give None to rank all users. (Default None)
+        :type userIDs: set[int]
+        :return: Up to numEntries tuples of user ID and score, highest score first
+        :rtype: list[tuple[int, int or float]]
+        :raise KeyError: When given a stat that is not indexed
+        """
+        index = self.indexes[stat]
+        if userIDs is not None:
+            # Scanning the index from the top visits about numEntries * len(index) / len(userIDs) entries before
+            # finding enough of the given users, so small groups are cheaper to look up individually
+            if len(userIDs) ** 2 < numEntries * len(index):
+                return index.topAmong(numEntries, userIDs)
+            userFilter = userIDs.__contains__
+        return index.top(numEntries, userFilter=userFilter)
@@ -0,0 +1,219 @@
+# Typing imports
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Set, Tuple, Union
+if TYPE_CHECKING:
+    from .basedUser import BasedUser
+
+from array import array
+from bisect import bisect_left
+from operator import neg
+import heapq
+import math
+
+
+# The user stats held by UserStatsStore, and the array typecode of each stat's column.
+# Value is stored as a float, as ship upgrades may give fractional values. Floats given for integer stats are truncated.
+storedStats = {"credits": "q", "lifetimeCredits": "q", "systemsChecked": "q", "bountyWins": "q", "duelWins": "q",
+                "duelLosses": "q", "duelCreditsWins": "q", "duelCreditsLosses": "q", "value": "d"}
+
+
+def columnValue(column : array, value : Union[int, float]) -> Union[int, float]:
+    """Convert a stat value to the type held by a stat's column.
+    Integer columns cannot hold floats, so float values given for integer stats are truncated.
+
+    :param array.array column: The column that value will be stored in
+    :param value: The stat value to convert
+    :type value: int or float
+    :return: value, as an int if column holds integers
+    :rtype: int or float
+    """
+    return value if column.typecode == "d" else int(value)
+
+
+class UserStatsStore:
+    """A columnar copy of the stats of every user in a UserDB, for answering economy-wide questions without visiting
+    every BasedUser object.
+    Each stat in storedStats is held in its own array, with one row per user. Rows are kept in sync by BasedUser, which
+    reports changes to its stats to this store. Removing a user moves the last row into the removed user's row, so row
+    order is not meaningful.
+
+    Aggregates accept an optional set of user IDs, e.g the members of a guild, to aggregate over only those users.
+
+    :var ids: The ID of the user in each row
+    :vartype ids: array.array
+    :var columns: An array of each stored stat, by stat name. Row i of every column belongs to the user with ID ids[i].
+    :vartype columns: dict[str, array.array]
+    :var rows: The row number of each stored user, by user ID
+    :vartype rows: dict[int, int]
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.columns : Dict[str, array] = {stat: array(typeCode) for stat, typeCode in storedStats.items()}
+        self.rows : Dict[int, int] = {}
+
+
+    def addUser(self, user : BasedUser):
+        """Store a user's stats, and have the user report future stat changes to this store.
+        If the user is already stored, their stats are updated instead.
+
+        :param BasedUser user: The user to store
+        """
+        user.statsStore = self
+        if user.id in self.rows:
+            for stat in storedStats:
+                self.statChanged(user, stat)
+            return
+
+        self.rows[user.id] = len(self.ids)
+        self.ids.append(user.id)
+        for stat, column in self.columns.items():
+            column.append(columnValue(column, user.getStatByName(stat)))
+
+
+    def removeUser(self, userID : int):
+        """Remove a user's stats from the store. Users that are not stored are ignored.
+
+        :param int userID: The ID of the user to remove
+        """
+        if userID not in self.rows:
+            return
+        row = self.rows.pop(userID)
+        lastRow = len(self.ids) - 1
+        # Fill the removed row with the last row, so that rows stay contiguous
+        if row != lastRow:
+            self.ids[row] = self.ids[lastRow]
+            self.rows[self.ids[row]] = row
+            for column in self.columns.values():
+                column[row] = column[lastRow]
+        self.ids.pop()
+        for column in self.columns.values():
+            column.pop()
+
+
+    def statChanged(self, user : BasedUser, stat : str):
+        """Update a user's stored stat after it has changed.
+        A user's value includes their credits, so a change to credits also updates the user's value.
+
+        :param BasedUser user: The user whose stat changed
+        :param str stat: The name of the stat that changed. Stats that are not stored are ignored.
+        """
+        if user.id not in self.rows:
+            return
+        row = self.rows[user.id]
+        if stat in self.columns:
+            column = self.columns[stat]
+            column[row] = columnValue(column, user.getStatByName(stat))
+        if stat == "credits":
+            self.columns["value"][row] = user.getStatByName("value")
+
+
+    def column(self, stat : str, userIDs : Set[int] = None) -> Sequence[Union[int, float]]:
+        """Get the stored values of a stat.
+        The full column is part of the store, and must not be modified.
+
+        :param str stat: The name of the stat to get. Must be in storedStats.
+        :param userIDs: The IDs of the users to get the stat for. Users that are not stored are ignored.
+                        Give None to get the stat for all users. (Default None)
+        :type userIDs: set[int]
+        :return: The stat's values, in row order if userIDs is None
+        :rtype: array.array
+        :raise KeyError: When given a stat that is not stored
+        """
+        column = self.columns[stat]
+        if userIDs is None:
+            return column
+        return array(column.typecode, [column[self.rows[userID]] for userID in userIDs if userID in self.rows])
+
+
+    def total(self, stat : str, userIDs : Set[int] = None) -> Union[int, float]:
+        """Get the sum of a stat over all users, e.g the total credits in circulation.
+
+        :param str stat: The name of the stat to sum. Must be in storedStats.
+        :param userIDs: The IDs of the users to sum over. Give None to sum over all users. (Default None)
+        :type userIDs: set[int]
+        :return: The sum of the stat
+        :rtype: int or float
+        """
+        return sum(self.column(stat, userIDs=userIDs))
+
+
+    def mean(self, stat : str, userIDs : Set[int] = None) -> float:
+        """Get the mean of a stat over all users.
+
+        :param str stat: The name of the stat to average. Must be in storedStats.
+        :param userIDs: The IDs of the users to average over. Give None to average over all users. (Default None)
+        :type userIDs: set[int]
+        :return: The mean of the stat, or 0 if there are no users to average over
+        :rtype: float
+        """
+        column = self.column(stat, userIDs=userIDs)
+        return sum(column) / len(column) if column else 0
+
+
+    def percentiles(self, stat : str, percents : Iterable[float], userIDs : Set[int] = None) -> List[Union[int, float]]:
+        """Get percentiles of a stat over all users, using the nearest rank method.
+
+        :param str stat: The name of the stat. Must be in storedStats.
+        :param percents: The percentiles to find, each between 0 and 100 inclusive. E.g give [50] for the median.
+        :type percents: Iterable[float]
+        :param userIDs: The IDs of the users to include. Give None to include all users. (Default None)
+        :type userIDs: set[int]
+        :return: The stat's value at each of the requested percentiles, in the order given. Empty if there are no users.
+        :rtype: list[int or float]
+        """
+        sortedValues = sorted(self.column(stat, userIDs=userIDs))
+        if not sortedValues:
+            return []
+        lastIndex = len(sortedValues) - 1
+        return [sortedValues[min(lastIndex, max(0, math.ceil(len(sortedValues) * percent / 100) - 1))]
+                for percent in percents]
+
+
+    def histogram(self, stat : str, binEdges : Sequence[Union[int, float]], userIDs : Set[int] = None) -> List[int]:
+        """Count the number of users whose stat falls within each of a series of bins.
+        There are len(binEdges) + 1 bins: values below binEdges[0], values from binEdges[i - 1] up to but not
+        including binEdges[i], and values of at least binEdges[-1].
+
+        :param str stat: The name of the stat. Must be in storedStats.
+        :param binEdges: The boundaries between bins, in ascending order
+        :type binEdges: Sequence[int or float]
+        :param userIDs: The IDs of the users to include. Give None to include all users. (Default None)
+        :type userIDs: set[int]
+        :return: The number of users in each bin, lowest bin first
+        :rtype: list[int]
+        """
+        sortedValues = sorted(self.column(stat, userIDs=userIDs))
+        edgeIndices = [0] + [bisect_left(sortedValues, edge) for edge in binEdges] + [len(sortedValues)]
+        return [edgeIndices[i + 1] - edgeIndices[i] for i in range(len(edgeIndices) - 1)]
+
+
+    def top(self, stat : str, numEntries : int, userIDs : Set[int] = None) -> List[Tuple[int, Union[int, float]]]:
+        """Get the highest scoring users for a stat, with ties broken by ascending user ID.
+        Every stored row is visited, so for repeated queries of an indexed stat, leaderboards.Leaderboards.top is faster.
+
+        :param str stat: The name of the stat to rank users by. Must be in storedStats.
+        :param int numEntries: The maximum number of users to return
+        :param userIDs: The IDs of the only users to rank. Give None to rank all users. (Default None)
+        :type userIDs: set[int]
+        :return: Up to numEntries tuples of user ID and score, highest score first
+        :rtype: list[tuple[int, int or float]]
+        """
+        column = self.columns[stat]
+        if userIDs is None:
+            rowIDs, scores = self.ids, column
+        else:
+            rowIDs = [userID for userID in userIDs if userID in self.rows]
+            scores = [column[self.rows[userID]] for userID in rowIDs]
+        # Negating IDs makes the lowest ID win ties between equal scores
+        topRows = heapq.nlargest(numEntries, zip(scores, map(neg, rowIDs)))
+        return [(-negID, score) for score, negID in topRows]
+
+
+    def __len__(self) -> int:
+        """Get the number of stored users.
+
+        :return: The number of users with stored stats
+        :rtype: int
+        """
+        return len(self.ids)